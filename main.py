@@ -1,4 +1,35 @@
-from src.run import Run
+import argparse
+import multiprocessing
+
+from src.config.conf_parser import Configs
+from src.partitioned_run import create_run
+from src.run import create_state_store
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--list-dead-letters", action="store_true")
+    parser.add_argument("--replay-dead-letters", nargs="*", metavar="ORDER_CODE")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    Run().run_program()
\ No newline at end of file
+    multiprocessing.freeze_support()
+    args = parse_args()
+
+    if args.list_dead_letters or args.replay_dead_letters is not None:
+        configs = Configs()
+        state_store = create_state_store(configs=configs, clustered=configs.cluster_config().get("enabled"))
+
+        if args.replay_dead_letters is not None:
+            state_store.requeue_dead_letters(order_codes=args.replay_dead_letters or None)
+        else:
+            for dead_letter in state_store.get_dead_letters():
+                print(f"{dead_letter['order_code']}\t{dead_letter['attempt_count']}\t"
+                      f"{dead_letter['updated_at']}\t{dead_letter['last_error']}")
+
+        state_store.close()
+    else:
+        run = create_run()
+        try:
+            run.run_program()
+        finally:
+            run.close()
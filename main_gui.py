@@ -1,5 +1,7 @@
 from src.gui.main_window import MainWindow
+import multiprocessing
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = MainWindow()
     app.run()
\ No newline at end of file
@@ -10,6 +10,14 @@ class Configs:
         self._database: str = ""
         self._user: str = ""
         self._password: str = ""
+        self._pool_size: int = 0
+        self._max_overflow: int = 0
+        self._pool_timeout: float = 0
+        self._pool_recycle: int = 0
+        self._statement_timeout_ms: int = 0
+        self._replica_hosts: list[str] = []
+        self._replica_retry_seconds: float = 0
+        self._replica_max_lag_seconds: float = 0
         self._db_config: dict[str, str] = {}
 
         self._firma_kodu: str = ""
@@ -17,6 +25,78 @@ class Configs:
         self._api_key: str = ""
         self._mikro_config: dict[str, any] = {}
 
+        self._sip_birim_pntr: int = 0
+        self._sip_cins: int = 0
+        self._sip_vergi_pntr: int = 0
+        self._sip_depono: int = 0
+        self._sip_vergisiz_fl: bool = False
+        self._sip_stok_sormerk: str = ""
+        self._satir_defaults_config: dict[str, any] = {}
+
+        self._order_page_size: int = 0
+        self._batch_max_orders: int = 0
+        self._batch_max_lines: int = 0
+        self._batch_max_bytes: int = 0
+        self._loader_max_in_flight: int = 0
+        self._loader_slow_response_seconds: float = 0
+        self._state_store_path: str = ""
+        self._use_prepared_statements: bool = False
+        self._worker_count: int = 0
+        self._worker_mode: str = ""
+        self._claim_lease_seconds: float = 0
+        self._safety_window_seconds: float = 0
+        self._etl_config: dict[str, any] = {}
+
+        self._cache_max_size: int = 0
+        self._cache_ttl_seconds: float = 0
+        self._cache_warm_up: bool = False
+        self._cache_updated_at_column: str = ""
+        self._cache_config: dict[str, any] = {}
+
+        self._trigger_mode: str = ""
+        self._notify_channel: str = ""
+        self._install_notify_trigger: bool = False
+        self._poll_min_interval: float = 0
+        self._poll_max_interval: float = 0
+        self._poll_backoff_factor: float = 0
+        self._trigger_config: dict[str, any] = {}
+
+        self._http_pool_size: int = 0
+        self._http_connect_timeout: float = 0
+        self._http_read_timeout: float = 0
+        self._http_max_retries: int = 0
+        self._http_backoff_factor: float = 0
+        self._http_config: dict[str, any] = {}
+
+        self._circuit_failure_threshold: int = 0
+        self._circuit_recovery_seconds: float = 0
+        self._circuit_half_open_max_calls: int = 0
+        self._circuit_breaker_config: dict[str, any] = {}
+
+        self._rate_limit_per_second: float = 0
+        self._rate_limit_min_per_second: float = 0
+        self._rate_limit_max_per_second: float = 0
+        self._rate_limit_burst: int = 0
+        self._rate_limit_target_latency_seconds: float = 0
+        self._rate_limit_max_error_rate: float = 0
+        self._rate_limit_config: dict[str, any] = {}
+
+        self._retry_base_delay_seconds: float = 0
+        self._retry_max_delay_seconds: float = 0
+        self._retry_max_attempts: int = 0
+        self._retry_jitter_ratio: float = 0
+        self._retry_scan_interval_seconds: float = 0
+        self._retry_max_in_flight: int = 0
+        self._retry_config: dict[str, any] = {}
+
+        self._cluster_enabled: bool = False
+        self._cluster_lock_name: str = ""
+        self._cluster_shard_count: int = 0
+        self._cluster_retry_seconds: float = 0
+        self._cluster_adopt_after_seconds: float = 0
+        self._cluster_rebalance_seconds: float = 0
+        self._cluster_config: dict[str, any] = {}
+
         self._logger = SingletonLogger.get_logger()
 
     def db_config(self) -> dict[str, any]:
@@ -28,13 +108,30 @@ class Configs:
         self._database: str = os.getenv("DB_NAME")
         self._user: str = os.getenv("DB_USER")
         self._password: str = os.getenv("DB_PASS")
+        self._pool_size: int = int(os.getenv("DB_POOL_SIZE", 5))
+        self._max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+        self._pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", 30))
+        self._pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", 3600))
+        self._statement_timeout_ms: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 0))
+        self._replica_hosts: list[str] = [replica_host.strip() for replica_host
+                                          in os.getenv("DB_REPLICA_HOSTS", "").split(",") if replica_host.strip()]
+        self._replica_retry_seconds: float = float(os.getenv("DB_REPLICA_RETRY_SECONDS", 30))
+        self._replica_max_lag_seconds: float = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", 5))
 
         self._db_config: dict[str, any] = {
             "host": self._host,
             "port": self._port,
             "database": self._database,
             "user": self._user,
-            "password": self._password
+            "password": self._password,
+            "pool_size": self._pool_size,
+            "max_overflow": self._max_overflow,
+            "pool_timeout": self._pool_timeout,
+            "pool_recycle": self._pool_recycle,
+            "statement_timeout_ms": self._statement_timeout_ms,
+            "replica_hosts": self._replica_hosts,
+            "replica_retry_seconds": self._replica_retry_seconds,
+            "replica_max_lag_seconds": self._replica_max_lag_seconds
         }
 
         return self._db_config
@@ -53,4 +150,211 @@ class Configs:
             "api_key": self._api_key
         }
 
-        return self._mikro_config
\ No newline at end of file
+        return self._mikro_config
+
+    def satir_defaults_config(self) -> dict[str, any]:
+
+        load_dotenv()
+
+        self._sip_birim_pntr: int = int(os.getenv("SIP_BIRIM_PNTR", 0))
+        self._sip_cins: int = int(os.getenv("SIP_CINS", 0))
+        self._sip_vergi_pntr: int = int(os.getenv("SIP_VERGI_PNTR", 0))
+        self._sip_depono: int = int(os.getenv("SIP_DEPONO", 1))
+        self._sip_vergisiz_fl: bool = self._get_bool_env("SIP_VERGISIZ_FL", False)
+        self._sip_stok_sormerk: str = os.getenv("SIP_STOK_SORMERK", "")
+
+        self._satir_defaults_config: dict[str, any] = {
+            "sip_birim_pntr": self._sip_birim_pntr,
+            "sip_cins": self._sip_cins,
+            "sip_vergi_pntr": self._sip_vergi_pntr,
+            "sip_depono": self._sip_depono,
+            "sip_vergisiz_fl": self._sip_vergisiz_fl,
+            "sip_stok_sormerk": self._sip_stok_sormerk
+        }
+
+        return self._satir_defaults_config
+
+    def etl_config(self) -> dict[str, any]:
+
+        load_dotenv()
+
+        self._order_page_size: int = int(os.getenv("ORDER_PAGE_SIZE", 500))
+        self._batch_max_orders: int = int(os.getenv("BATCH_MAX_ORDERS", 50))
+        self._batch_max_lines: int = int(os.getenv("BATCH_MAX_LINES", 1000))
+        self._batch_max_bytes: int = int(os.getenv("BATCH_MAX_BYTES", 1000000))
+        self._loader_max_in_flight: int = int(os.getenv("LOADER_MAX_IN_FLIGHT", 4))
+        self._loader_slow_response_seconds: float = float(os.getenv("LOADER_SLOW_RESPONSE_SECONDS", 5))
+        self._state_store_path: str = os.getenv("STATE_STORE_PATH", "docs/sync_state.db")
+        self._use_prepared_statements: bool = self._get_bool_env("DB_USE_PREPARED_STATEMENTS", False)
+        self._worker_count: int = max(int(os.getenv("ETL_WORKER_COUNT", 1)), 1)
+        self._worker_mode: str = os.getenv("ETL_WORKER_MODE", "process").strip().lower()
+        self._claim_lease_seconds: float = float(os.getenv("ETL_CLAIM_LEASE_SECONDS", 600))
+        self._safety_window_seconds: float = float(os.getenv("ETL_SAFETY_WINDOW_SECONDS", 5))
+
+        self._etl_config: dict[str, any] = {
+            "order_page_size": self._order_page_size,
+            "batch_max_orders": self._batch_max_orders,
+            "batch_max_lines": self._batch_max_lines,
+            "batch_max_bytes": self._batch_max_bytes,
+            "loader_max_in_flight": self._loader_max_in_flight,
+            "loader_slow_response_seconds": self._loader_slow_response_seconds,
+            "state_store_path": self._state_store_path,
+            "use_prepared_statements": self._use_prepared_statements,
+            "worker_count": self._worker_count,
+            "worker_mode": self._worker_mode,
+            "claim_lease_seconds": self._claim_lease_seconds,
+            "safety_window_seconds": self._safety_window_seconds
+        }
+
+        return self._etl_config
+
+
+    def cache_config(self) -> dict[str, any]:
+
+        load_dotenv()
+
+        self._cache_max_size: int = int(os.getenv("CACHE_MAX_SIZE", 10000))
+        self._cache_ttl_seconds: float = float(os.getenv("CACHE_TTL_SECONDS", 3600))
+        self._cache_warm_up: bool = self._get_bool_env("CACHE_WARM_UP", False)
+        self._cache_updated_at_column: str = os.getenv("CACHE_UPDATED_AT_COLUMN", "")
+
+        self._cache_config: dict[str, any] = {
+            "max_size": self._cache_max_size,
+            "ttl_seconds": self._cache_ttl_seconds,
+            "warm_up": self._cache_warm_up,
+            "updated_at_column": self._cache_updated_at_column
+        }
+
+        return self._cache_config
+
+    def trigger_config(self) -> dict[str, any]:
+
+        load_dotenv()
+
+        self._trigger_mode: str = os.getenv("TRIGGER_MODE", "poll").strip().lower()
+        self._notify_channel: str = os.getenv("NOTIFY_CHANNEL", "mikro_new_order")
+        self._install_notify_trigger: bool = self._get_bool_env("INSTALL_NOTIFY_TRIGGER", False)
+        self._poll_min_interval: float = float(os.getenv("POLL_MIN_INTERVAL", 1))
+        self._poll_max_interval: float = float(os.getenv("POLL_MAX_INTERVAL", 120))
+        self._poll_backoff_factor: float = float(os.getenv("POLL_BACKOFF_FACTOR", 2))
+
+        self._trigger_config: dict[str, any] = {
+            "mode": self._trigger_mode,
+            "notify_channel": self._notify_channel,
+            "install_notify_trigger": self._install_notify_trigger,
+            "poll_min_interval": self._poll_min_interval,
+            "poll_max_interval": self._poll_max_interval,
+            "poll_backoff_factor": self._poll_backoff_factor
+        }
+
+        return self._trigger_config
+
+    def http_config(self) -> dict[str, any]:
+
+        load_dotenv()
+
+        self._http_pool_size: int = int(os.getenv("HTTP_POOL_SIZE", 10))
+        self._http_connect_timeout: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", 5))
+        self._http_read_timeout: float = float(os.getenv("HTTP_READ_TIMEOUT", 30))
+        self._http_max_retries: int = int(os.getenv("HTTP_MAX_RETRIES", 3))
+        self._http_backoff_factor: float = float(os.getenv("HTTP_BACKOFF_FACTOR", 0.5))
+
+        self._http_config: dict[str, any] = {
+            "pool_size": self._http_pool_size,
+            "connect_timeout": self._http_connect_timeout,
+            "read_timeout": self._http_read_timeout,
+            "max_retries": self._http_max_retries,
+            "backoff_factor": self._http_backoff_factor
+        }
+
+        return self._http_config
+
+    def circuit_breaker_config(self) -> dict[str, any]:
+
+        load_dotenv()
+
+        self._circuit_failure_threshold: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", 5))
+        self._circuit_recovery_seconds: float = float(os.getenv("CIRCUIT_RECOVERY_SECONDS", 30))
+        self._circuit_half_open_max_calls: int = int(os.getenv("CIRCUIT_HALF_OPEN_MAX_CALLS", 1))
+
+        self._circuit_breaker_config: dict[str, any] = {
+            "failure_threshold": self._circuit_failure_threshold,
+            "recovery_seconds": self._circuit_recovery_seconds,
+            "half_open_max_calls": self._circuit_half_open_max_calls
+        }
+
+        return self._circuit_breaker_config
+
+    def rate_limit_config(self) -> dict[str, any]:
+
+        load_dotenv()
+
+        self._rate_limit_per_second: float = float(os.getenv("RATE_LIMIT_PER_SECOND", 5))
+        self._rate_limit_min_per_second: float = float(os.getenv("RATE_LIMIT_MIN_PER_SECOND", 0.5))
+        self._rate_limit_max_per_second: float = float(os.getenv("RATE_LIMIT_MAX_PER_SECOND", 20))
+        self._rate_limit_burst: int = int(os.getenv("RATE_LIMIT_BURST", 5))
+        self._rate_limit_target_latency_seconds: float = float(os.getenv("RATE_LIMIT_TARGET_LATENCY_SECONDS", 5))
+        self._rate_limit_max_error_rate: float = float(os.getenv("RATE_LIMIT_MAX_ERROR_RATE", 0.2))
+
+        self._rate_limit_config: dict[str, any] = {
+            "rate_per_second": self._rate_limit_per_second,
+            "min_rate_per_second": self._rate_limit_min_per_second,
+            "max_rate_per_second": self._rate_limit_max_per_second,
+            "burst": self._rate_limit_burst,
+            "target_latency_seconds": self._rate_limit_target_latency_seconds,
+            "max_error_rate": self._rate_limit_max_error_rate
+        }
+
+        return self._rate_limit_config
+
+    def retry_config(self) -> dict[str, any]:
+
+        load_dotenv()
+
+        self._retry_base_delay_seconds: float = float(os.getenv("RETRY_BASE_DELAY_SECONDS", 30))
+        self._retry_max_delay_seconds: float = float(os.getenv("RETRY_MAX_DELAY_SECONDS", 3600))
+        self._retry_max_attempts: int = int(os.getenv("RETRY_MAX_ATTEMPTS", 8))
+        self._retry_jitter_ratio: float = float(os.getenv("RETRY_JITTER_RATIO", 0.2))
+        self._retry_scan_interval_seconds: float = float(os.getenv("RETRY_SCAN_INTERVAL_SECONDS", 15))
+        self._retry_max_in_flight: int = int(os.getenv("RETRY_MAX_IN_FLIGHT", 1))
+
+        self._retry_config: dict[str, any] = {
+            "base_delay_seconds": self._retry_base_delay_seconds,
+            "max_delay_seconds": self._retry_max_delay_seconds,
+            "max_attempts": self._retry_max_attempts,
+            "jitter_ratio": self._retry_jitter_ratio,
+            "scan_interval_seconds": self._retry_scan_interval_seconds,
+            "max_in_flight": self._retry_max_in_flight
+        }
+
+        return self._retry_config
+
+    def cluster_config(self) -> dict[str, any]:
+
+        load_dotenv()
+
+        self._cluster_enabled: bool = self._get_bool_env("CLUSTER_ENABLED", False)
+        self._cluster_lock_name: str = os.getenv("CLUSTER_LOCK_NAME", "mikro_integration")
+        self._cluster_shard_count: int = max(int(os.getenv("CLUSTER_SHARD_COUNT", 1)), 1)
+        self._cluster_retry_seconds: float = float(os.getenv("CLUSTER_RETRY_SECONDS", 10))
+        self._cluster_adopt_after_seconds: float = max(float(os.getenv("CLUSTER_ADOPT_AFTER_SECONDS", 30)),
+                                                       self._cluster_retry_seconds * 2)
+        self._cluster_rebalance_seconds: float = float(os.getenv("CLUSTER_REBALANCE_SECONDS", 300))
+
+        self._cluster_config: dict[str, any] = {
+            "enabled": self._cluster_enabled,
+            "lock_name": self._cluster_lock_name,
+            "shard_count": self._cluster_shard_count,
+            "retry_seconds": self._cluster_retry_seconds,
+            "adopt_after_seconds": self._cluster_adopt_after_seconds,
+            "rebalance_seconds": self._cluster_rebalance_seconds
+        }
+
+        return self._cluster_config
+
+    @staticmethod
+    def _get_bool_env(name: str, default: bool) -> bool:
+        value: str = os.getenv(name)
+        if value is None or value == "":
+            return default
+        return value.strip().lower() in ("1", "true", "yes", "evet")
@@ -4,7 +4,7 @@ import threading
 from src.gui.widget.log_viewer import LogViewer
 from src.gui.handler.log_handler import GUILogHandler
 from src.logger.custom_logger import SingletonLogger
-from src.run import Run
+from src.partitioned_run import create_run
 
 
 class MainWindow:
@@ -14,6 +14,7 @@ class MainWindow:
         self.gui_handler = GUILogHandler()
         self.is_running = False
         self.run_thread = None
+        self.run_instance = None
 
         self._setup_window()
         self._setup_theme()
@@ -132,6 +133,8 @@ class MainWindow:
 
     def _stop_program(self):
         self.is_running = False
+        if self.run_instance:
+            self.run_instance.stop()
         self.start_stop_btn.config(text="Başlat")
         try:
             self.status_label.config(text="● Durduruldu", foreground='#F44336')
@@ -143,7 +146,11 @@ class MainWindow:
 
         while self.is_running:
             try:
-                Run().run_program()
+                self.run_instance = create_run()
+                try:
+                    self.run_instance.run_program()
+                finally:
+                    self.run_instance.close()
 
                 for _ in range(300):
                     if not self.is_running:
@@ -158,6 +165,8 @@ class MainWindow:
 
     def _on_closing(self):
         self.is_running = False
+        if self.run_instance:
+            self.run_instance.stop()
         if self.log_viewer:
             self.log_viewer.stop_monitoring()
         self.root.quit()
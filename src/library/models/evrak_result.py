@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+@dataclass()
+class EvrakResult:
+
+    order: dict[str, any]
+    success: bool
+    message: str = ""
+    response: str = ""
+    retryable: bool = True
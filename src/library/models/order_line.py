@@ -0,0 +1,31 @@
+from typing import Optional
+
+class OrderLine:
+
+    __slots__ = ("order_id", "product_id", "quantity", "price", "product_code", "order_code", "order_date",
+                 "customer_code", "total_price")
+
+    def __init__(self, order_id: any, product_id: any, quantity: any, price: any,
+                 product_code: Optional[str] = None, order_code: str = "", order_date: str = "",
+                 customer_code: str = "", total_price: float = 0.0):
+        self.order_id: any = order_id
+        self.product_id: any = product_id
+        self.quantity: any = quantity
+        self.price: any = price
+        self.product_code: Optional[str] = product_code
+        self.order_code: str = order_code
+        self.order_date: str = order_date
+        self.customer_code: str = customer_code
+        self.total_price: float = total_price
+
+    def __repr__(self) -> str:
+        return (f"OrderLine(order_id={self.order_id!r}, product_id={self.product_id!r}, "
+                f"quantity={self.quantity!r}, price={self.price!r}, product_code={self.product_code!r}, "
+                f"order_code={self.order_code!r}, order_date={self.order_date!r}, "
+                f"customer_code={self.customer_code!r}, total_price={self.total_price!r})")
+
+    @classmethod
+    def from_order_item(cls, order_item: dict[str, any]) -> "OrderLine":
+        return cls(order_id=order_item.get("orderId"), product_id=order_item.get("productId"),
+                   quantity=order_item.get("quantity"), price=order_item.get("price"),
+                   product_code=order_item.get("productCode"))
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+import hashlib
+
+@dataclass(frozen=True)
+class OrderPartition:
+
+    index: int
+    count: int
+
+    _WHERE_CLAUSE_TEMPLATE = ("mod(('x' || lpad(substr(md5({column}), 1, 8), 16, '0'))::bit(64)::bigint, "
+                              ":partition_count) = :partition_index")
+    WHERE_CLAUSE = _WHERE_CLAUSE_TEMPLATE.format(column="Id::text")
+
+    @classmethod
+    def where_clause_for(cls, column: str) -> str:
+        return cls._WHERE_CLAUSE_TEMPLATE.format(column=column)
+
+    @property
+    def enabled(self) -> bool:
+        return self.count > 1
+
+    @staticmethod
+    def index_of(order_id: any, count: int) -> int:
+        return int(hashlib.md5(str(order_id).encode("utf-8")).hexdigest()[:8], 16) % count
+
+    def to_params(self) -> dict[str, int]:
+        return {"partition_count": self.count, "partition_index": self.index}
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class OrderWatermark:
+
+    created_at: str
+    order_id: str
+
+    def to_params(self) -> dict[str, str]:
+        return {"watermark_created_at": self.created_at, "watermark_order_id": self.order_id}
+
+    @classmethod
+    def from_order(cls, order: dict[str, any]) -> "OrderWatermark":
+        return cls(created_at=order.get("CreatedAt"), order_id=order.get("Id"))
@@ -1,4 +1,5 @@
 import logging
+from logging.handlers import QueueHandler
 from threading import Lock
 
 class SingletonLogger:
@@ -24,4 +25,11 @@ class SingletonLogger:
 
     @classmethod
     def get_logger(cls, engine=None):
-        return cls(engine)._logger
\ No newline at end of file
+        return cls(engine)._logger
+
+    @classmethod
+    def forward_to_queue(cls, log_queue) -> None:
+        logger = cls.get_logger()
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(QueueHandler(log_queue))
@@ -0,0 +1,224 @@
+from typing import Optional
+
+from src.config.conf_parser import Configs
+from src.logger.custom_logger import SingletonLogger
+from src.run import Run
+from src.scripts.db.connector.connector import DatabaseConnector
+from src.scripts.db.coordination.leader_election import LeaderElector
+from logging.handlers import QueueListener
+import multiprocessing
+import threading
+import time
+
+def _run_worker(worker_index: int, worker_count: int, stop_event, log_queue=None, limit_share: int = 1) -> None:
+    if log_queue is not None:
+        SingletonLogger.forward_to_queue(log_queue)
+
+    logger = SingletonLogger.get_logger()
+    cluster_config: dict[str, any] = Configs().cluster_config()
+
+    while not stop_event.is_set():
+        try:
+            if cluster_config.get("enabled"):
+                _run_cluster_worker(cluster_config=cluster_config, stop_event=stop_event, limit_share=limit_share)
+            else:
+                _run_partition(run=Run(worker_index=worker_index, worker_count=worker_count, stop_event=stop_event,
+                                       limit_share=limit_share))
+        except Exception as e:
+            logger.error(f"{worker_index + 1}. işçi çalışırken hata oluştu: {e}")
+            stop_event.wait(5)
+
+
+def _run_partition(run: Run) -> None:
+    try:
+        run.run_program()
+    finally:
+        run.close()
+
+
+def _run_cluster_worker(cluster_config: dict[str, any], stop_event, limit_share: int = 1) -> None:
+    ClusterWorker(cluster_config=cluster_config, stop_event=stop_event, limit_share=limit_share).run_program()
+
+
+class ClusterWorker:
+
+    def __init__(self, cluster_config: dict[str, any], stop_event, limit_share: int = 1):
+        self._logger = SingletonLogger.get_logger()
+        self._stop_event = stop_event
+        self._limit_share: int = limit_share
+        self._elector = LeaderElector(connector=DatabaseConnector(**Configs().db_config()),
+                                      lock_name=cluster_config.get("lock_name"),
+                                      shard_count=cluster_config.get("shard_count"),
+                                      retry_seconds=cluster_config.get("retry_seconds"))
+        self._retry_seconds: float = cluster_config.get("retry_seconds")
+        self._adopt_after_seconds: float = cluster_config.get("adopt_after_seconds")
+        self._rebalance_seconds: float = cluster_config.get("rebalance_seconds")
+
+        self._shards: dict[int, dict[str, any]] = {}
+        self._next_acquire_at: float = 0
+        self._next_adopt_at: float = 0
+        self._standby_logged: bool = False
+
+    def run_program(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                self._reap_shards()
+                self._release_adopted_shards()
+
+                now: float = time.monotonic()
+                if not self._shards and now >= self._next_acquire_at:
+                    self._acquire_shard(adopted=False)
+                    self._next_acquire_at = now + self._retry_seconds
+                    self._next_adopt_at = now + self._adopt_after_seconds
+                elif self._shards and now >= self._next_adopt_at:
+                    self._acquire_shard(adopted=True)
+                    self._next_adopt_at = now + self._adopt_after_seconds
+
+                self._stop_event.wait(min(self._retry_seconds, 1.0))
+        finally:
+            self._stop_shards(shard_indexes=list(self._shards))
+            self._reap_shards(wait=True)
+
+    def _acquire_shard(self, adopted: bool) -> None:
+        shard: Optional[tuple] = self._elector.try_acquire(excluded_shard_indexes=self._shards.keys())
+
+        if shard is None:
+            if not self._shards and not self._standby_logged:
+                self._logger.info("Tüm parçalar başka düğümler tarafından işleniyor, yedek modda bekleniyor...")
+                self._standby_logged = True
+            return
+
+        shard_index, cluster_lock = shard
+        shard_stop_event = threading.Event()
+        thread = threading.Thread(target=self._run_shard,
+                                  args=(shard_index, cluster_lock, shard_stop_event),
+                                  name=f"mikro-shard-{shard_index}", daemon=True)
+
+        self._shards[shard_index] = {
+            "thread": thread,
+            "lock": cluster_lock,
+            "stop_event": shard_stop_event,
+            "adopted": adopted,
+            "acquired_at": time.monotonic()
+        }
+        self._standby_logged = False
+
+        if adopted:
+            self._logger.warning(f"{shard_index + 1}/{self._elector.shard_count}. parçayı işleyen düğüm yok, parça "
+                                 f"bu düğüm tarafından devralındı")
+        thread.start()
+
+    def _run_shard(self, shard_index: int, cluster_lock, shard_stop_event: threading.Event) -> None:
+        try:
+            _run_partition(run=Run(worker_index=shard_index, worker_count=self._elector.shard_count,
+                                   stop_event=shard_stop_event, cluster_lock=cluster_lock,
+                                   limit_share=self._limit_share))
+        except Exception as e:
+            self._logger.error(f"{shard_index + 1}. parça işlenirken hata oluştu: {e}")
+
+    def _release_adopted_shards(self) -> None:
+        now: float = time.monotonic()
+        expired_shard_indexes: list[int] = [
+            shard_index for shard_index, shard in self._shards.items()
+            if shard["adopted"] and now - shard["acquired_at"] >= self._rebalance_seconds
+            and not shard["stop_event"].is_set()
+        ]
+
+        if expired_shard_indexes:
+            self._logger.info(f"Devralınan {', '.join(str(index + 1) for index in expired_shard_indexes)}. "
+                              f"parça yedek düğümlere bırakılıyor")
+            self._stop_shards(shard_indexes=expired_shard_indexes)
+            self._next_adopt_at = now + self._adopt_after_seconds
+
+    def _stop_shards(self, shard_indexes: list[int]) -> None:
+        for shard_index in shard_indexes:
+            self._shards[shard_index]["stop_event"].set()
+
+    def _reap_shards(self, wait: bool = False) -> None:
+        for shard_index, shard in list(self._shards.items()):
+            if wait:
+                shard["thread"].join()
+            elif shard["thread"].is_alive():
+                continue
+
+            shard["lock"].release()
+            del self._shards[shard_index]
+
+
+class PartitionedRun:
+
+    WORKER_MODE_PROCESS: str = "process"
+    WORKER_MODE_THREAD: str = "thread"
+
+    def __init__(self):
+        self._configs = Configs()
+        self._etl_config: dict[str, any] = self._configs.etl_config()
+        self._worker_count: int = self._etl_config.get("worker_count")
+        self._worker_mode: str = self._etl_config.get("worker_mode")
+        self._logger = SingletonLogger.get_logger()
+
+        if self._worker_mode not in (self.WORKER_MODE_PROCESS, self.WORKER_MODE_THREAD):
+            self._logger.warning(f"Geçersiz işçi modu '{self._worker_mode}', işlem modu kullanılacak")
+            self._worker_mode = self.WORKER_MODE_PROCESS
+
+        if self._worker_count == 1:
+            self._worker_mode = self.WORKER_MODE_THREAD
+
+        self._log_queue = None
+        if self._worker_mode == self.WORKER_MODE_PROCESS:
+            self._stop_event = multiprocessing.Event()
+            self._log_queue = multiprocessing.Queue()
+        else:
+            self._stop_event = threading.Event()
+
+        self._workers: list = []
+
+    def run_program(self):
+        self._logger.info(f"Siparişler {self._worker_count} işçiye bölünerek işlenecek (mod: {self._worker_mode})")
+
+        log_listener: Optional[QueueListener] = None
+        if self._log_queue is not None:
+            log_listener = QueueListener(self._log_queue, *self._logger.handlers, respect_handler_level=True)
+            log_listener.start()
+
+        limit_share: int = self._worker_count if self._worker_mode == self.WORKER_MODE_PROCESS else 1
+
+        try:
+            for worker_index in range(self._worker_count):
+                worker_options: dict[str, any] = {
+                    "target": _run_worker,
+                    "args": (worker_index, self._worker_count, self._stop_event, self._log_queue, limit_share),
+                    "name": f"mikro-worker-{worker_index}",
+                    "daemon": True
+                }
+
+                if self._worker_mode == self.WORKER_MODE_PROCESS:
+                    worker = multiprocessing.Process(**worker_options)
+                else:
+                    worker = threading.Thread(**worker_options)
+
+                worker.start()
+                self._workers.append(worker)
+
+            for worker in self._workers:
+                worker.join()
+
+        finally:
+            self._workers = []
+            if log_listener is not None:
+                log_listener.stop()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def close(self) -> None:
+        if self._log_queue is not None:
+            self._log_queue.close()
+            self._log_queue.join_thread()
+
+
+def create_run():
+    configs = Configs()
+    if configs.etl_config().get("worker_count") > 1 or configs.cluster_config().get("enabled"):
+        return PartitionedRun()
+    return Run()
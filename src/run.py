@@ -1,72 +1,474 @@
+from typing import Optional
+
 from src.config.conf_parser import Configs
+from src.library.models.evrak_result import EvrakResult
+from src.library.models.order_partition import OrderPartition
+from src.library.models.order_watermark import OrderWatermark
 from src.logger.custom_logger import SingletonLogger
 from src.scripts.db.connector.connector import DatabaseConnector
+from src.scripts.db.coordination.cluster_state_store import ClusterStateStore
+from src.scripts.db.coordination.leader_election import AdvisoryLock
+from src.scripts.db.listener.listener import OrderNotificationListener
 from src.scripts.etl.extractor import Extractor
 from src.scripts.etl.transformer import Transformer
-from src.scripts.generator.md5_hashed_password import MD5HashedPassword
 from src.scripts.generator.siparis_kaydet_v2_json import SiparisKaydetV2JSON
 from src.scripts.generator.mikro_api_up_v2_json import MikroApiUp
-from src.scripts.etl.loader import Loader
+from src.scripts.etl.async_loader import AsyncLoader, PredecessorFailedError
+from src.scripts.etl.batcher import SiparisBatch, SiparisBatcher
+from src.scripts.etl.loader import Loader, MikroUnavailableError
+from src.scripts.etl.mikro_session import MikroLoginError, MikroSessionManager
+from src.scripts.etl.retry_scheduler import RetryScheduler
+from src.scripts.utils.adaptive_poller import AdaptivePoller
+from src.scripts.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 from src.scripts.utils.file_handler import FileHandler
+from src.scripts.utils.rate_limiter import AdaptiveRateLimiter
+from src.scripts.utils.retry_policy import RetryPolicy
+from src.scripts.utils.state_store import SyncStateStore
+import os
+import socket
+import threading
 import time
 
+def create_state_store(configs: Configs, clustered: bool, cluster_lock: Optional[AdvisoryLock] = None):
+    etl_config: dict[str, any] = configs.etl_config()
+    retry_config: dict[str, any] = configs.retry_config()
+    state_store_options: dict[str, any] = {
+        "claim_lease_seconds": etl_config.get("claim_lease_seconds"),
+        "retry_policy": RetryPolicy(base_delay_seconds=retry_config.get("base_delay_seconds"),
+                                    max_delay_seconds=retry_config.get("max_delay_seconds"),
+                                    max_attempts=retry_config.get("max_attempts"),
+                                    jitter_ratio=retry_config.get("jitter_ratio"))
+    }
+
+    if clustered:
+        return ClusterStateStore(connector=DatabaseConnector(**configs.db_config()), cluster_lock=cluster_lock,
+                                 **state_store_options)
+    return SyncStateStore(path=etl_config.get("state_store_path"), **state_store_options)
+
+_mikro_guards_lock = threading.Lock()
+_mikro_guards: dict[int, tuple[CircuitBreaker, AdaptiveRateLimiter, threading.BoundedSemaphore]] = {}
+
+def get_mikro_guards(configs: Configs, limit_share: int = 1) \
+        -> tuple[CircuitBreaker, AdaptiveRateLimiter, threading.BoundedSemaphore]:
+    limit_share = max(limit_share, 1)
+
+    with _mikro_guards_lock:
+        guards = _mikro_guards.get(os.getpid())
+        if guards is None:
+            rate_limit_config: dict[str, any] = configs.rate_limit_config()
+            rate_limit_config.update({
+                "rate_per_second": rate_limit_config.get("rate_per_second") / limit_share,
+                "min_rate_per_second": rate_limit_config.get("min_rate_per_second") / limit_share,
+                "max_rate_per_second": rate_limit_config.get("max_rate_per_second") / limit_share,
+                "burst": max(rate_limit_config.get("burst") // limit_share, 1)
+            })
+            max_in_flight: int = max(configs.etl_config().get("loader_max_in_flight") // limit_share, 1)
+            guards = (CircuitBreaker(**configs.circuit_breaker_config()),
+                      AdaptiveRateLimiter(**rate_limit_config),
+                      threading.BoundedSemaphore(max_in_flight))
+            _mikro_guards[os.getpid()] = guards
+
+        return guards
+
 class Run:
 
-    def __init__(self):
+    _NOT_SENT_LOAD_ERRORS: tuple[type, ...] = (CircuitOpenError, MikroLoginError)
+
+    def __init__(self, worker_index: int = 0, worker_count: int = 1, stop_event=None,
+                 cluster_lock: Optional[AdvisoryLock] = None, limit_share: int = 1):
         self._configs = Configs()
         self._db_config: dict[str, any] = self._configs.db_config()
         db_conn = DatabaseConnector(**self._db_config)
+        self._db_conn = db_conn
         self._mikro_config: dict[str, str] = self._configs.mikro_config()
-        self._siparis_kaydet_v2_generator = SiparisKaydetV2JSON(**self._mikro_config)
+        self._etl_config: dict[str, any] = self._configs.etl_config()
+        self._siparis_kaydet_v2_generator = SiparisKaydetV2JSON(
+            **self._mikro_config, satir_defaults=self._configs.satir_defaults_config())
         self._login_mikro = MikroApiUp(**self._mikro_config)
-        self._extractor = Extractor(db_conn)
+        self._cache_config: dict[str, any] = self._configs.cache_config()
+        self._extractor = Extractor(db_conn, cache_config=self._cache_config,
+                                    use_prepared_statements=self._etl_config.get("use_prepared_statements"),
+                                    safety_window_seconds=self._etl_config.get("safety_window_seconds"))
+        self._trigger_config: dict[str, any] = self._configs.trigger_config()
+        self._poller = AdaptivePoller(min_interval=self._trigger_config.get("poll_min_interval"),
+                                      max_interval=self._trigger_config.get("poll_max_interval"),
+                                      backoff_factor=self._trigger_config.get("poll_backoff_factor"))
+        self._order_listener: Optional[OrderNotificationListener] = None
+        if self._trigger_config.get("mode") == "notify":
+            self._order_listener = OrderNotificationListener(db_conn,
+                                                             channel=self._trigger_config.get("notify_channel"))
+        self._stop_event = stop_event if stop_event is not None else threading.Event()
+        self._worker_id: str = f"{socket.gethostname()}-{worker_index}"
+        self._partition = OrderPartition(index=worker_index, count=worker_count)
+        self._watermark_name: str = "orders" if worker_count == 1 \
+            else f"orders_md5_{worker_index}_of_{worker_count}"
+        self._cluster_lock: Optional[AdvisoryLock] = cluster_lock
         self._transformer = Transformer()
-        self._password_generator = MD5HashedPassword(self._mikro_config.get("kullanici_kodu"))
-        self._loader = Loader()
+        self._http_config: dict[str, any] = self._configs.http_config()
+        circuit_breaker, rate_limiter, in_flight_limiter = get_mikro_guards(configs=self._configs,
+                                                                            limit_share=limit_share)
+        self._loader = Loader(**self._http_config, circuit_breaker=circuit_breaker, rate_limiter=rate_limiter,
+                              in_flight_limiter=in_flight_limiter)
+        self._mikro_session = MikroSessionManager(loader=self._loader,
+                                                  login_generator=self._login_mikro,
+                                                  kullanici_kodu=self._mikro_config.get("kullanici_kodu"))
+        self._mikro_session.add_refresh_listener(self._siparis_kaydet_v2_generator.refresh_current_year)
+        self._async_loader = AsyncLoader(max_in_flight=self._etl_config.get("loader_max_in_flight"),
+                                         slow_response_seconds=self._etl_config.get("loader_slow_response_seconds"))
         self._logger = SingletonLogger.get_logger()
         self._file_handler = FileHandler()
+        self._retry_config: dict[str, any] = self._configs.retry_config()
+        self._state_store = create_state_store(configs=self._configs, clustered=cluster_lock is not None,
+                                               cluster_lock=cluster_lock)
+        self._retry_async_loader = AsyncLoader(max_in_flight=self._retry_config.get("max_in_flight"),
+                                               slow_response_seconds=self._etl_config.get(
+                                                   "loader_slow_response_seconds"))
+        self._retry_scheduler = RetryScheduler(retry_callback=self._retry_failed_orders,
+                                               interval_seconds=self._retry_config.get("scan_interval_seconds"),
+                                               stop_event=self._stop_event)
+        self._order_page_size: int = self._etl_config.get("order_page_size")
+        self._batcher = SiparisBatcher(generator=self._siparis_kaydet_v2_generator,
+                                       max_orders=self._etl_config.get("batch_max_orders"),
+                                       max_lines=self._etl_config.get("batch_max_lines"),
+                                       max_bytes=self._etl_config.get("batch_max_bytes"))
+
+        self.backlog_depth: int = 0
+        self.drain_rate: float = 0.0
+
+        if self._cache_config.get("warm_up"):
+            self._warm_lookup_caches()
+
+    def _warm_lookup_caches(self) -> None:
+        try:
+            self._extractor.warm_lookup_caches()
+        except Exception as e:
+            self._logger.warning(f"Kod önbellekleri başlangıçta doldurulamadı: {e}")
 
     def run_program(self):
 
-        while True:
+        self._start_order_listener()
+        self._retry_scheduler.start()
+        self._sync_until_stopped()
+
+    def _sync_until_stopped(self) -> None:
+        idle_logged: bool = False
+
+        while not self._stop_event.is_set():
+
+            if self._cluster_lock is not None and not self._cluster_lock.is_held():
+                self._logger.warning("Küme kilidi kaybedildi, bu düğümde senkronizasyon durduruluyor")
+                break
+
+            try:
+                processed_order_count: int = self._drain_backlog()
+
+            except Exception as e:
+                self._logger.error(f"Siparişler senkronize edilirken hata oluştu: {e}")
+                processed_order_count = 0
+
+            else:
+                if processed_order_count == 0 and not idle_logged:
+                    self._logger.info(f"Yeni bir sipariş bulunmamaktadır...")
+                idle_logged = processed_order_count == 0
+
+            self._wait_for_next_poll(processed_order_count=processed_order_count)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def close(self) -> None:
+        if self._order_listener is not None:
+            self._order_listener.stop()
+
+        self._retry_scheduler.stop()
+        self._retry_scheduler.join()
+        self._async_loader.close()
+        self._retry_async_loader.close()
+        self._loader.close()
+        self._state_store.close()
+
+    def _start_order_listener(self) -> None:
+        if self._order_listener is None:
+            return
+
+        try:
+            if self._trigger_config.get("install_notify_trigger"):
+                self._order_listener.install_trigger()
+            self._order_listener.start()
+        except Exception as e:
+            self._logger.warning(f"Sipariş bildirimleri dinlenemiyor, yalnızca periyodik kontrol yapılacak: {e}")
+
+    def _wait_for_next_poll(self, processed_order_count: int) -> None:
+        interval: float = self._poller.next_interval(processed_order_count=processed_order_count)
+        deadline: float = time.monotonic() + interval
+
+        while not self._stop_event.is_set():
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+
+            if self._order_listener is None:
+                self._stop_event.wait(min(remaining, 1.0))
+                continue
 
             try:
-                latest_order_json: dict[str, any] = self._extractor.get_latest_order_from_orders_table()
+                if self._order_listener.wait(timeout=min(remaining, 1.0)) > 0:
+                    self._poller.reset()
+                    return
+            except Exception as e:
+                self._logger.warning(f"Sipariş bildirimi beklenirken hata oluştu: {e}")
+                self._stop_event.wait(min(remaining, 1.0))
+
+    def _drain_backlog(self) -> int:
+        watermark: Optional[OrderWatermark] = self._get_watermark()
+        self._extractor.refresh_lookup_caches()
+
+        self.backlog_depth: int = self._extractor.count_orders_after_watermark(watermark=watermark,
+                                                                               partition=self._partition)
+        if self.backlog_depth > 0:
+            self._logger.info(f"Senkronize edilmeyi bekleyen sipariş sayısı: {self.backlog_depth}")
+
+        started_at: float = time.monotonic()
+        processed_order_count: int = 0
+
+        for orders_page in self._extractor.iter_orders_after_watermark(watermark=watermark,
+                                                                       page_size=self._order_page_size,
+                                                                       partition=self._partition):
+
+            unsent_orders: list[dict[str, any]] = self._state_store.claim_orders(orders=orders_page,
+                                                                                 worker_id=self._worker_id)
+
+            if len(unsent_orders) != len(orders_page):
+                self._logger.info(f"{len(orders_page) - len(unsent_orders)} sipariş daha önce gönderildiği "
+                                  f"veya başka bir işçi tarafından işlendiği için atlandı")
 
-                order_code_in_doc: str = self._file_handler.get_last_order_code_from_txt()
+            page_settled: bool = self._sync_orders(orders=unsent_orders, worker_id=self._worker_id,
+                                                   async_loader=self._async_loader, advance_watermark=True)
 
-                if latest_order_json.get("Code") != order_code_in_doc:
+            if page_settled:
+                self._advance_watermark(order=orders_page[-1])
+            processed_order_count += len(orders_page)
 
-                    order_id, created_at, customer_id = (self._extractor.
-                                                         fetch_from_latest_order(latest_order=latest_order_json))
+            elapsed_seconds: float = max(time.monotonic() - started_at, 1e-6)
+            self.drain_rate: float = processed_order_count / elapsed_seconds
+            self._logger.info(f"{processed_order_count}/{max(self.backlog_depth, processed_order_count)} sipariş "
+                              f"işlendi - boşaltma hızı: {self.drain_rate:.2f} sipariş/sn")
 
-                    customer_code: str = (self._extractor.
-                                          fetch_customer_code_from_latest_users(customer_id=customer_id))
+            if not page_settled:
+                break
 
-                    self._extractor.get_latest_order_item_from_order_items_table(order_id=order_id)
-                    order_items: list[dict] = self._extractor.fetch_product_code_from_products_table()
+        if processed_order_count == 0:
+            return 0
 
-                    final_order_items: list[dict[str, any]] = self._transformer.prepare_final_order_items(
-                        order_items=order_items,
-                        latest_order_json=latest_order_json,
-                        customer_code=customer_code
-                    )
+        self._logger.info(f"Sipariş senkronizasyon durumları: {self._state_store.get_status_counts()}")
+        self._logger.info(f"Veritabanı bağlantı havuzu: {self._db_conn.get_pool_metrics()}")
 
-                    md5_hash_pass: str = self._password_generator.get_hashed_password()
+        for cache_stats in self._extractor.get_lookup_cache_stats():
+            self._logger.info(f"{cache_stats['name']} önbelleği - boyut: {cache_stats['size']}/"
+                              f"{cache_stats['max_size']}, isabet: {cache_stats['hits']}, "
+                              f"ıska: {cache_stats['misses']}, isabet oranı: {cache_stats['hit_ratio']:.2%}")
 
-                    mikro_api_up_json: dict = self._login_mikro.prepare_login_json(md5_hash_pass=md5_hash_pass)
-                    self._loader.post_mikro_api_up(mikro_api_up_json=mikro_api_up_json)
+        return processed_order_count
 
-                    siparis_kaydet_v2_json: dict = self._siparis_kaydet_v2_generator.prepare_final_siparis_kaydet_v2_json(
-                        final_order_items=final_order_items, md5_hash_pass=md5_hash_pass)
-                    self._loader.post_siparis_kaydet(siparis_kaydet_json=siparis_kaydet_v2_json)
+    def _sync_orders(self, orders: list[dict[str, any]], worker_id: str, async_loader: AsyncLoader,
+                     advance_watermark: bool) -> bool:
+        orders_lines: dict[any, dict[str, any]] = self._extractor.fetch_order_lines_for_orders(
+            order_ids=[order.get("Id") for order in orders]) if orders else {}
 
-                    self._file_handler.write_last_order_to_txt(last_order_code=latest_order_json.get("Code"))
-                    time.sleep(120)
+        transformed_orders, orders_final_items, transform_rejected_results = \
+            self._transformer.prepare_orders_final_items(orders=orders, orders_lines=orders_lines)
 
-            except:
-                time.sleep(120)
+        batches, rejected_results = self._batcher.create_batches(orders=transformed_orders,
+                                                                 orders_final_items=orders_final_items)
+        rejected_results = transform_rejected_results + rejected_results
+        for retryable in (True, False):
+            retryable_results: list[EvrakResult] = [rejected_result for rejected_result in rejected_results
+                                                    if rejected_result.retryable == retryable]
+            if retryable_results:
+                self._state_store.record_results(
+                    results=[(rejected_result.order, False, rejected_result.message, rejected_result.response)
+                             for rejected_result in retryable_results],
+                    retryable=retryable)
 
+        batched_order_ids: set[str] = {str(order.get("Id")) for batch in batches for order in batch.orders}
+        self._state_store.release_claims(
+            orders=[order for order in orders if str(order.get("Id")) not in batched_order_ids],
+            worker_id=worker_id)
+        return self._load_batches(batches=batches, worker_id=worker_id, async_loader=async_loader,
+                                  advance_watermark=advance_watermark)
+
+    def _retry_failed_orders(self) -> int:
+        due_order_ids: list[str] = self._state_store.get_due_retry_order_ids(limit=self._order_page_size,
+                                                                             partition=self._partition)
+        if not due_order_ids:
+            return 0
+
+        orders: list[dict[str, any]] = self._extractor.get_orders_by_ids(order_ids=due_order_ids)
+        found_order_ids: set[str] = {str(order.get("Id")) for order in orders}
+        missing_order_ids: list[str] = [order_id for order_id in due_order_ids if order_id not in found_order_ids]
+
+        if missing_order_ids:
+            self._state_store.record_results(
+                results=[({"Id": order_id}, False, "Sipariş veritabanında bulunamadı", "")
+                         for order_id in missing_order_ids],
+                retryable=False)
+
+        retry_worker_id: str = f"{self._worker_id}-retry"
+        claimed_orders: list[dict[str, any]] = self._state_store.claim_orders(orders=orders,
+                                                                              worker_id=retry_worker_id)
+
+        if claimed_orders:
+            self._sync_orders(orders=claimed_orders, worker_id=retry_worker_id, async_loader=self._retry_async_loader,
+                              advance_watermark=False)
+
+        return len(claimed_orders)
+
+    def _advance_watermark(self, order: dict[str, any]) -> None:
+        self._save_watermark(watermark=OrderWatermark.from_order(order), order_code=order.get("Code"))
+
+    def _save_watermark(self, watermark: OrderWatermark, order_code: Optional[str]) -> None:
+        self._state_store.set_watermark(watermark=watermark, order_code=order_code, name=self._watermark_name)
+
+    def _load_batches(self, batches: list[SiparisBatch], worker_id: str, async_loader: AsyncLoader,
+                      advance_watermark: bool) -> bool:
+        batch_results: list = async_loader.run_all(
+            jobs=[lambda batch=batch: self._load_batch(batch=batch) for batch in batches],
+            ordering_keys=[batch.ordering_keys for batch in batches],
+            is_failure=lambda evrak_results: not all(evrak_result.success for evrak_result in evrak_results))
+
+        failed_batch_error: Optional[Exception] = None
+        skipped_orders: list[dict[str, any]] = []
+
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, PredecessorFailedError):
+                self._state_store.release_claims(orders=batch.orders, worker_id=worker_id)
+                skipped_orders.extend(batch.orders)
+                continue
+
+            if isinstance(batch_result, self._NOT_SENT_LOAD_ERRORS) or self._loader.is_connect_error(batch_result):
+                self._state_store.release_claims(orders=batch.orders, worker_id=worker_id)
+                failed_batch_error = failed_batch_error or batch_result
+                continue
+
+            retryable: bool = True
+
+            if isinstance(batch_result, MikroUnavailableError) \
+                    and self._loader.is_refused_status(batch_result.status_code):
+                self._logger.error(f"Mikro toplu isteği işlemeden reddetti, {len(batch.orders)} sipariş yeniden "
+                                   f"denenmek üzere kuyruğa alındı: {batch_result}")
+                evrak_results: list[tuple] = [(order, False, str(batch_result), "") for order in batch.orders]
+            elif isinstance(batch_result, Exception):
+                retryable = False
+                self._logger.error(f"Toplu istek gönderildi ancak sonucu alınamadı, {len(batch.orders)} sipariş "
+                                   f"Mikro'da kaydedilmiş olabilir; otomatik yeniden gönderilmeyecek, Mikro'da "
+                                   f"kontrol edildikten sonra elle yeniden gönderilmeli: {batch_result}")
+                evrak_results = [(order, False, f"Sonucu belirsiz, Mikro'da kontrol edilmeli: {batch_result}", "")
+                                 for order in batch.orders]
             else:
-                self._logger.info(f"Yeni bir sipariş bulunmamaktadır...")
-                time.sleep(120)
\ No newline at end of file
+                evrak_results = [(evrak_result.order, evrak_result.success, evrak_result.message,
+                                  evrak_result.response) for evrak_result in batch_result]
+
+            last_order: dict[str, any] = batch.orders[-1]
+            watermark: Optional[OrderWatermark] = OrderWatermark.from_order(last_order) \
+                if advance_watermark and failed_batch_error is None and not skipped_orders else None
+            self._state_store.record_results(
+                results=evrak_results,
+                watermark=watermark,
+                order_code=last_order.get("Code"),
+                name=self._watermark_name,
+                retryable=retryable)
+
+        if failed_batch_error is not None:
+            raise failed_batch_error
+
+        if skipped_orders:
+            self._logger.warning(f"Aynı müşterinin önceki toplu isteği başarısız olduğu için {len(skipped_orders)} "
+                                 f"sipariş gönderilmedi, bir sonraki turda yeniden okunacak")
+
+        return not skipped_orders
+
+    def _load_batch(self, batch: SiparisBatch) -> list[EvrakResult]:
+        resp = self._mikro_session.post_siparis_kaydet(
+            build_payload=lambda md5_hash_pass: self._siparis_kaydet_v2_generator.prepare_batch_siparis_kaydet_v2_json(
+                evraklar=batch.evraklar, md5_hash_pass=md5_hash_pass, evrak_payloads=batch.evrak_payloads,
+                validate_evraklar=False))
+
+        if self._loader.is_unavailable_response(resp):
+            raise MikroUnavailableError(f"Mikro geçici olarak yanıt vermiyor, statü kodu: {resp.status_code}",
+                                        status_code=resp.status_code)
+
+        if self._mikro_session.is_auth_failure(resp):
+            raise MikroLoginError(f"Mikro oturumu yenilendikten sonra da yetki hatası alındı, statü kodu: "
+                                  f"{resp.status_code}")
+
+        evrak_results: list[EvrakResult] = self._batcher.parse_batch_results(batch=batch, resp=resp)
+
+        for evrak_result in evrak_results:
+            if not evrak_result.success:
+                self._logger.error(f"{evrak_result.order.get('Code')} kodlu sipariş Mikro'ya kaydedilemedi: "
+                                   f"{evrak_result.message}")
+
+        succeeded_count: int = sum(1 for evrak_result in evrak_results if evrak_result.success)
+        self._logger.info(f"Toplu istek sonucu: {succeeded_count}/{len(evrak_results)} evrak kaydedildi "
+                          f"({batch.line_count} satır, {batch.byte_size} bayt)")
+        return evrak_results
+
+    def _read_local_watermarks(self) -> tuple[Optional[OrderWatermark], Optional[str], Optional[OrderWatermark]]:
+        state_store_path: str = self._etl_config.get("state_store_path")
+        if self._cluster_lock is None or not os.path.exists(state_store_path):
+            return None, None, None
+
+        local_state_store = SyncStateStore(path=state_store_path)
+        try:
+            return (local_state_store.get_watermark(name=self._watermark_name),
+                    local_state_store.get_last_order_code(name=self._watermark_name),
+                    local_state_store.get_earliest_watermark())
+        finally:
+            local_state_store.close()
+
+    def _get_watermark(self) -> Optional[OrderWatermark]:
+        watermark: Optional[OrderWatermark] = self._state_store.get_watermark(name=self._watermark_name)
+        if watermark is not None:
+            return watermark
+
+        watermark, order_code, local_earliest_watermark = self._read_local_watermarks()
+        if watermark is not None:
+            self._logger.info(f"'{self._watermark_name}' için yerel durum dosyasındaki konum küme durumuna aktarıldı")
+            self._save_watermark(watermark=watermark, order_code=order_code)
+            return watermark
+
+        earliest_watermarks: list[OrderWatermark] = [
+            earliest_watermark for earliest_watermark in (
+                self._state_store.get_earliest_watermark(),
+                local_earliest_watermark
+            ) if earliest_watermark is not None
+        ]
+        if earliest_watermarks:
+            watermark = min(earliest_watermarks,
+                            key=lambda earliest_watermark: (earliest_watermark.created_at,
+                                                            earliest_watermark.order_id))
+            self._logger.info(f"'{self._watermark_name}' için kayıtlı konum bulunamadı, diğer işçilerin en eski "
+                              f"konumundan başlanacak; gönderilmiş siparişler atlanacak")
+            self._save_watermark(watermark=watermark, order_code=None)
+            return watermark
+
+        watermark = self._file_handler.get_watermark_from_txt()
+        if watermark is not None:
+            self._save_watermark(watermark=watermark, order_code=None)
+            return watermark
+
+        order_code_in_doc: str = self._file_handler.get_last_order_code_from_txt().strip()
+        order: Optional[dict] = self._extractor.get_order_by_code(order_code=order_code_in_doc) \
+            if order_code_in_doc else None
+
+        if order is None:
+            order = self._extractor.get_latest_order_from_orders_table()
+            if order is None:
+                return None
+
+            self._logger.warning(f"Belgedeki sipariş kodu bulunamadı, senkronizasyon "
+                                 f"{order.get('Code')} kodlu siparişten sonra başlatılacak")
+
+        watermark = OrderWatermark.from_order(order)
+        self._save_watermark(watermark=watermark, order_code=order.get("Code"))
+        return watermark
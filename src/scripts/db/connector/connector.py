@@ -1,7 +1,10 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 from src.logger.custom_logger import SingletonLogger
+from src.scripts.db.connector.pool_metrics import InstrumentedQueuePool
+from threading import Lock
+import time
 
 class DatabaseConnector:
 
@@ -9,13 +12,21 @@ class DatabaseConnector:
     _engine = None
     _session_factory = None
 
-    def __new__(cls, host=None, port=None, database=None, user=None, password=None):
+    _REPLICA_LAG_CHECK_SECONDS = 5
+    _REPLICA_LAG_QUERY = """
+        SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END
+    """
+
+    def __new__(cls, host=None, port=None, database=None, user=None, password=None, **pool_options):
         if cls._instance is None:
             cls._instance = super(DatabaseConnector, cls).__new__(cls)
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self, host=None, port=None, database=None, user=None, password=None):
+    def __init__(self, host=None, port=None, database=None, user=None, password=None,
+                 pool_size=5, max_overflow=10, pool_timeout=30, pool_recycle=3600, statement_timeout_ms=0,
+                 replica_hosts=None, replica_retry_seconds=30, replica_max_lag_seconds=5):
         if self._initialized:
             return
 
@@ -29,15 +40,32 @@ class DatabaseConnector:
         self._password = password
         self._logger = SingletonLogger().get_logger()
 
-        connection_string = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}"
+        self._engine_options = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": pool_timeout,
+            "pool_recycle": pool_recycle,
+            "statement_timeout_ms": statement_timeout_ms
+        }
+        self._replica_retry_seconds = replica_retry_seconds
+        self._replica_max_lag_seconds = replica_max_lag_seconds
+        self._replica_lock = Lock()
+        self._next_replica_index = 0
+        self._replicas = []
 
         try:
-            self._engine = create_engine(
-                connection_string,
-                echo=False,
-                pool_pre_ping=True,
-                pool_recycle=3600,
-            )
+            self._engine = self._create_engine(host=host, port=port)
+
+            for replica_host in replica_hosts or []:
+                replica_address, _, replica_port = replica_host.partition(":")
+                self._replicas.append({
+                    "label": replica_host,
+                    "engine": self._create_engine(host=replica_address, port=replica_port or port),
+                    "unhealthy_until": 0.0,
+                    "lag_seconds": 0.0,
+                    "lag_checked_at": 0.0,
+                    "lagging": False
+                })
 
             self._session_factory = sessionmaker(bind=self._engine)
 
@@ -47,15 +75,133 @@ class DatabaseConnector:
             self._initialized = True
             self._logger.info(f"Veritabanı bağlantısı başarılı: {host}:{port}/{database}")
 
+            if self._replicas:
+                self._logger.info(f"Okuma sorguları için {len(self._replicas)} replika tanımlandı: "
+                                  f"{', '.join(replica['label'] for replica in self._replicas)}")
+
         except SQLAlchemyError as e:
             self._logger.error(f"Veritabanı bağlantı hatası: {e}")
             raise
 
+    def _create_engine(self, host, port, pool_size=None, max_overflow=None):
+        connection_string = (f"postgresql+psycopg2://{self._user}:{self._password}@{host}:{port}/"
+                             f"{self._database}")
+
+        connect_args = {}
+        if self._engine_options["statement_timeout_ms"]:
+            connect_args["options"] = f"-c statement_timeout={int(self._engine_options['statement_timeout_ms'])}"
+
+        engine = create_engine(
+            connection_string,
+            echo=False,
+            poolclass=InstrumentedQueuePool,
+            pool_pre_ping=True,
+            pool_size=pool_size if pool_size is not None else self._engine_options["pool_size"],
+            max_overflow=max_overflow if max_overflow is not None else self._engine_options["max_overflow"],
+            pool_timeout=self._engine_options["pool_timeout"],
+            pool_recycle=self._engine_options["pool_recycle"],
+            connect_args=connect_args,
+            executemany_mode="values_plus_batch",
+            executemany_batch_page_size=500,
+        )
+        self._listen_pool_errors(engine)
+        return engine
+
+    def _listen_pool_errors(self, engine) -> None:
+        pool_metrics = engine.pool.metrics
+
+        def on_handle_error(context) -> None:
+            if getattr(context, "is_pre_ping", False):
+                pool_metrics.record_pre_ping_failure()
+                self._logger.warning(f"Havuzdaki bağlantı pre-ping kontrolünden geçemedi: "
+                                     f"{context.original_exception}")
+
+        event.listen(engine, "handle_error", on_handle_error)
+
     def get_engine(self):
         if not self._initialized:
             raise RuntimeError("Connector initialize edilmemiş")
         return self._engine
 
+    def create_primary_engine(self, pool_size, max_overflow=0):
+        if not self._initialized:
+            raise RuntimeError("Connector initialize edilmemiş")
+        return self._create_engine(host=self._host, port=self._port, pool_size=pool_size, max_overflow=max_overflow)
+
+    def get_read_engine(self):
+        if not self._initialized:
+            raise RuntimeError("Connector initialize edilmemiş")
+
+        for _ in range(len(self._replicas)):
+            with self._replica_lock:
+                replica = self._replicas[self._next_replica_index % len(self._replicas)]
+                self._next_replica_index += 1
+                healthy = replica["unhealthy_until"] <= time.monotonic()
+
+            if healthy and self._is_replica_fresh(replica):
+                return replica["engine"]
+
+        return self._engine
+
+    def _is_replica_fresh(self, replica):
+        if not self._replica_max_lag_seconds:
+            return True
+
+        now = time.monotonic()
+        with self._replica_lock:
+            if replica["lag_checked_at"] + self._REPLICA_LAG_CHECK_SECONDS > now:
+                return not replica["lagging"]
+
+            replica["lag_checked_at"] = now
+
+        try:
+            with replica["engine"].connect() as conn:
+                lag_seconds = float(conn.execute(text(self._REPLICA_LAG_QUERY)).scalar() or 0)
+        except SQLAlchemyError as e:
+            self.mark_replica_unhealthy(replica["engine"], e)
+            return False
+
+        lagging = lag_seconds > self._replica_max_lag_seconds
+        with self._replica_lock:
+            was_lagging = replica["lagging"]
+            replica["lag_seconds"] = lag_seconds
+            replica["lagging"] = lagging
+
+        if lagging and not was_lagging:
+            self._logger.warning(f"Replika {replica['label']} {lag_seconds:.1f} sn geride, okuma sorguları "
+                                 f"gecikme {self._replica_max_lag_seconds} sn altına inene kadar başka "
+                                 f"sunucuya yönlendirilecek")
+        elif was_lagging and not lagging:
+            self._logger.info(f"Replika {replica['label']} yeniden güncel, okuma sorguları tekrar yönlendiriliyor")
+
+        return not lagging
+
+    def mark_replica_unhealthy(self, engine, error=None):
+        with self._replica_lock:
+            for replica in self._replicas:
+                if replica["engine"] is engine:
+                    replica["unhealthy_until"] = time.monotonic() + self._replica_retry_seconds
+                    self._logger.warning(f"Replika {replica['label']} {self._replica_retry_seconds} sn boyunca "
+                                         f"devre dışı bırakıldı: {error}")
+
+    def get_pool_metrics(self) -> dict[str, any]:
+        if not self._initialized:
+            raise RuntimeError("Connector initialize edilmemiş")
+        pool = self._engine.pool
+        pool_metrics = pool.metrics.snapshot(pool)
+
+        if self._replicas:
+            now = time.monotonic()
+            pool_metrics["replicas"] = [
+                {"label": replica["label"],
+                 "healthy": replica["unhealthy_until"] <= now,
+                 "lag_seconds": replica["lag_seconds"],
+                 **replica["engine"].pool.metrics.snapshot(replica["engine"].pool)}
+                for replica in self._replicas
+            ]
+
+        return pool_metrics
+
     def get_session(self):
         if not self._initialized:
             raise RuntimeError("Connector initialize edilmemiş")
@@ -73,6 +219,9 @@ class DatabaseConnector:
             return False
 
     def close(self):
+        for replica in self._replicas:
+            replica["engine"].dispose()
+
         if self._engine:
             self._engine.dispose()
             self._logger.info("Veritabanı bağlantıları kapatıldı")
\ No newline at end of file
@@ -0,0 +1,65 @@
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+from threading import Lock
+import time
+
+class PoolMetrics:
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checkout_count: int = 0
+        self.total_wait_seconds: float = 0.0
+        self.max_wait_seconds: float = 0.0
+        self.checkout_timeouts: int = 0
+        self.pre_ping_failures: int = 0
+
+    def record_checkout_wait(self, wait_seconds: float) -> None:
+        with self._lock:
+            self.checkout_count += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def record_checkout_timeout(self) -> None:
+        with self._lock:
+            self.checkout_timeouts += 1
+
+    def record_pre_ping_failure(self) -> None:
+        with self._lock:
+            self.pre_ping_failures += 1
+
+    def snapshot(self, pool) -> dict[str, any]:
+        with self._lock:
+            return {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "checkout_count": self.checkout_count,
+                "average_wait_ms": (self.total_wait_seconds / self.checkout_count * 1000
+                                    if self.checkout_count else 0.0),
+                "max_wait_ms": self.max_wait_seconds * 1000,
+                "checkout_timeouts": self.checkout_timeouts,
+                "pre_ping_failures": self.pre_ping_failures
+            }
+
+class InstrumentedQueuePool(QueuePool):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started_at: float = time.perf_counter()
+
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_checkout_timeout()
+            raise
+        finally:
+            self.metrics.record_checkout_wait(time.perf_counter() - started_at)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
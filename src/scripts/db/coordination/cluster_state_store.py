@@ -0,0 +1,320 @@
+from typing import Optional
+
+from sqlalchemy import text
+
+from src.library.models.order_partition import OrderPartition
+from src.library.models.order_watermark import OrderWatermark
+from src.logger.custom_logger import SingletonLogger
+from src.scripts.db.coordination.leader_election import AdvisoryLock
+from src.scripts.utils.retry_policy import RetryPolicy
+from src.scripts.utils.state_store import SyncStateStore
+
+class ClusterStateStore:
+
+    STATUS_PENDING: str = SyncStateStore.STATUS_PENDING
+    STATUS_SENT: str = SyncStateStore.STATUS_SENT
+    STATUS_FAILED: str = SyncStateStore.STATUS_FAILED
+    STATUS_DEAD_LETTER: str = SyncStateStore.STATUS_DEAD_LETTER
+
+    _POOL_SIZE: int = 2
+    _SCHEMA_LOCK_NAME: str = "mikro_order_sync_state_schema"
+    _SCHEMA: tuple[str, ...] = (
+        """
+        CREATE TABLE IF NOT EXISTS mikro_order_sync_state (
+            order_id TEXT PRIMARY KEY,
+            order_code TEXT,
+            created_at TEXT,
+            status TEXT NOT NULL,
+            attempt_count INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            mikro_response TEXT,
+            claimed_by TEXT,
+            claimed_at TIMESTAMPTZ,
+            next_attempt_at TIMESTAMPTZ,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_mikro_order_sync_state_order_code ON mikro_order_sync_state (order_code)",
+        """
+        CREATE INDEX IF NOT EXISTS idx_mikro_order_sync_state_retry
+            ON mikro_order_sync_state (status, next_attempt_at)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS mikro_sync_watermark (
+            name TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL,
+            order_id TEXT NOT NULL,
+            order_code TEXT,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+        """
+    )
+
+    _CLAIMABLE_CONDITION: str = """
+        mikro_order_sync_state.status NOT IN (:sent, :dead_letter)
+        AND (mikro_order_sync_state.status != :failed OR mikro_order_sync_state.next_attempt_at IS NULL
+             OR mikro_order_sync_state.next_attempt_at <= now())
+    """
+
+    _LOCK_HELD_CONDITION: str = """
+        EXISTS (
+            SELECT 1 FROM pg_locks
+            WHERE locktype = 'advisory' AND granted AND pid = :lock_pid AND objsubid = 1
+              AND classid::bigint = (CAST(:lock_key AS BIGINT) >> 32) & 4294967295
+              AND objid::bigint = CAST(:lock_key AS BIGINT) & 4294967295
+        )
+    """
+
+    def __init__(self, connector, claim_lease_seconds: float = 600, retry_policy: Optional[RetryPolicy] = None,
+                 cluster_lock: Optional[AdvisoryLock] = None):
+        self._logger = SingletonLogger.get_logger()
+        self._engine = connector.create_primary_engine(pool_size=self._POOL_SIZE, max_overflow=self._POOL_SIZE)
+        self._cluster_lock: Optional[AdvisoryLock] = cluster_lock
+        self._claim_lease_seconds: float = claim_lease_seconds
+        self._retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+
+        with self._engine.begin() as conn:
+            conn.execute(text("SELECT pg_advisory_xact_lock(hashtext(:name))"), {"name": self._SCHEMA_LOCK_NAME})
+            for statement in self._SCHEMA:
+                conn.execute(text(statement))
+
+    def _status_params(self) -> dict[str, any]:
+        return {"sent": self.STATUS_SENT, "dead_letter": self.STATUS_DEAD_LETTER, "failed": self.STATUS_FAILED,
+                "pending": self.STATUS_PENDING, "lease_seconds": self._claim_lease_seconds}
+
+    def get_watermark(self, name: str = "orders") -> Optional[OrderWatermark]:
+        with self._engine.connect() as conn:
+            row = conn.execute(text("SELECT created_at, order_id FROM mikro_sync_watermark WHERE name = :name"),
+                               {"name": name}).fetchone()
+
+        if row is None:
+            return None
+        return OrderWatermark(created_at=row[0], order_id=row[1])
+
+    def get_earliest_watermark(self, prefix: str = "orders") -> Optional[OrderWatermark]:
+        with self._engine.connect() as conn:
+            row = conn.execute(
+                text("""
+                    SELECT created_at, order_id FROM mikro_sync_watermark
+                    WHERE name = :prefix OR left(name, :prefix_length) = :name_prefix
+                    ORDER BY created_at, order_id
+                    LIMIT 1
+                """),
+                {"prefix": prefix, "prefix_length": len(prefix) + 1, "name_prefix": f"{prefix}_"}).fetchone()
+
+        if row is None:
+            return None
+        return OrderWatermark(created_at=row[0], order_id=row[1])
+
+    def set_watermark(self, watermark: OrderWatermark, order_code: str = None, name: str = "orders") -> None:
+        with self._engine.begin() as conn:
+            self._set_watermark(conn=conn, watermark=watermark, order_code=order_code, name=name)
+
+    def _set_watermark(self, conn, watermark: OrderWatermark, order_code: Optional[str], name: str) -> None:
+        lock_condition: str = "TRUE"
+        params: dict[str, any] = {"name": name, "created_at": str(watermark.created_at),
+                                  "order_id": str(watermark.order_id), "order_code": order_code}
+
+        if self._cluster_lock is not None:
+            lock_condition = self._LOCK_HELD_CONDITION
+            params.update({"lock_pid": self._cluster_lock.backend_pid, "lock_key": self._cluster_lock.key})
+
+        written_count: int = conn.execute(
+            text(f"""
+                INSERT INTO mikro_sync_watermark (name, created_at, order_id, order_code, updated_at)
+                SELECT :name, :created_at, :order_id, :order_code, now()
+                WHERE {lock_condition}
+                ON CONFLICT (name) DO UPDATE SET
+                    created_at = excluded.created_at,
+                    order_id = excluded.order_id,
+                    order_code = excluded.order_code,
+                    updated_at = excluded.updated_at
+            """),
+            params
+        ).rowcount
+
+        if not written_count:
+            self._logger.warning(f"'{self._cluster_lock.name}' küme kilidi artık bu düğümde değil, '{name}' konumu "
+                                 f"güncellenmedi")
+
+    def get_last_order_code(self, name: str = "orders") -> Optional[str]:
+        with self._engine.connect() as conn:
+            row = conn.execute(text("SELECT order_code FROM mikro_sync_watermark WHERE name = :name"),
+                               {"name": name}).fetchone()
+        return row[0] if row else None
+
+    def claim_orders(self, orders: list[dict[str, any]], worker_id: str) -> list[dict[str, any]]:
+        if not orders:
+            return []
+
+        with self._engine.begin() as conn:
+            rows = conn.execute(
+                text(f"""
+                    INSERT INTO mikro_order_sync_state (order_id, order_code, created_at, status, claimed_by,
+                                                        claimed_at, updated_at)
+                    SELECT order_id, order_code, created_at, :pending, :worker_id, now(), now()
+                    FROM unnest(CAST(:order_ids AS TEXT[]), CAST(:order_codes AS TEXT[]),
+                                CAST(:created_ats AS TEXT[])) AS claimed (order_id, order_code, created_at)
+                    ON CONFLICT (order_id) DO UPDATE SET
+                        claimed_by = excluded.claimed_by,
+                        claimed_at = excluded.claimed_at,
+                        updated_at = excluded.updated_at
+                    WHERE {self._CLAIMABLE_CONDITION}
+                      AND (mikro_order_sync_state.claimed_by IS NULL
+                           OR mikro_order_sync_state.claimed_by = excluded.claimed_by
+                           OR mikro_order_sync_state.claimed_at < now() - make_interval(secs => :lease_seconds))
+                    RETURNING order_id
+                """),
+                {**self._status_params(), "worker_id": worker_id,
+                 "order_ids": [str(order.get("Id")) for order in orders],
+                 "order_codes": [order.get("Code") for order in orders],
+                 "created_ats": [str(order.get("CreatedAt")) for order in orders]}).fetchall()
+
+        claimed_order_ids: set[str] = {row[0] for row in rows}
+        return [order for order in orders if str(order.get("Id")) in claimed_order_ids]
+
+    def release_claims(self, orders: list[dict[str, any]], worker_id: str) -> None:
+        if not orders:
+            return
+
+        with self._engine.begin() as conn:
+            conn.execute(
+                text("""
+                    UPDATE mikro_order_sync_state SET claimed_by = NULL, claimed_at = NULL
+                    WHERE order_id = ANY(CAST(:order_ids AS TEXT[])) AND claimed_by = :worker_id
+                """),
+                {"order_ids": [str(order.get("Id")) for order in orders], "worker_id": worker_id})
+
+    def record_results(self, results: list[tuple[dict[str, any], bool, str, str]],
+                       watermark: Optional[OrderWatermark] = None, order_code: str = None,
+                       name: str = "orders", retryable: bool = True) -> None:
+        dead_lettered_order_codes: list[str] = []
+
+        with self._engine.begin() as conn:
+            failed_order_ids: list[str] = [str(order.get("Id")) for order, success, _, _ in results if not success]
+            attempt_counts: dict[str, int] = {
+                order_id: attempt_count for order_id, attempt_count in conn.execute(
+                    text("""
+                        SELECT order_id, attempt_count FROM mikro_order_sync_state
+                        WHERE order_id = ANY(CAST(:order_ids AS TEXT[]))
+                        FOR UPDATE
+                    """),
+                    {"order_ids": failed_order_ids}).fetchall()
+            } if failed_order_ids else {}
+            rows: list[dict[str, any]] = []
+
+            for order, success, error, response in results:
+                order_id: str = str(order.get("Id"))
+                attempt_count: int = attempt_counts.get(order_id, 0) + 1
+                retry_delay_seconds: Optional[float] = None
+
+                if success:
+                    status: str = self.STATUS_SENT
+                elif retryable and self._retry_policy.should_retry(attempt_count=attempt_count):
+                    status = self.STATUS_FAILED
+                    retry_delay_seconds = self._retry_policy.next_delay(attempt_count=attempt_count)
+                else:
+                    status = self.STATUS_DEAD_LETTER
+                    dead_lettered_order_codes.append(order.get("Code") or order_id)
+
+                rows.append({"order_id": order_id, "order_code": order.get("Code"),
+                             "created_at": str(order.get("CreatedAt")), "status": status,
+                             "attempt_count": attempt_count, "last_error": None if success else error,
+                             "mikro_response": response, "retry_delay_seconds": retry_delay_seconds})
+
+            if rows:
+                conn.execute(
+                    text("""
+                        INSERT INTO mikro_order_sync_state (order_id, order_code, created_at, status, attempt_count,
+                                                            last_error, mikro_response, next_attempt_at,
+                                                            updated_at)
+                        VALUES (:order_id, :order_code, :created_at, :status, :attempt_count, :last_error,
+                                :mikro_response,
+                                now() + make_interval(secs => CAST(:retry_delay_seconds AS DOUBLE PRECISION)),
+                                now())
+                        ON CONFLICT (order_id) DO UPDATE SET
+                            status = excluded.status,
+                            attempt_count = excluded.attempt_count,
+                            last_error = excluded.last_error,
+                            mikro_response = excluded.mikro_response,
+                            next_attempt_at = excluded.next_attempt_at,
+                            claimed_by = NULL,
+                            claimed_at = NULL,
+                            updated_at = excluded.updated_at
+                    """),
+                    rows)
+
+            if watermark is not None:
+                self._set_watermark(conn=conn, watermark=watermark, order_code=order_code, name=name)
+
+        if dead_lettered_order_codes:
+            self._logger.error(f"{len(dead_lettered_order_codes)} sipariş yeniden denenmeyecek, hatalı siparişler "
+                               f"kuyruğuna alındı: {', '.join(str(code) for code in dead_lettered_order_codes)}")
+
+    def get_due_retry_order_ids(self, limit: int = 500, partition: Optional[OrderPartition] = None) -> list[str]:
+        partition_clause: str = ""
+        params: dict[str, any] = {**self._status_params(), "limit": limit}
+
+        if partition is not None and partition.enabled:
+            partition_clause = f"AND {OrderPartition.where_clause_for('order_id')}"
+            params.update(partition.to_params())
+
+        with self._engine.connect() as conn:
+            rows = conn.execute(
+                text(f"""
+                    SELECT order_id FROM mikro_order_sync_state
+                    WHERE ((status = :failed
+                            AND (next_attempt_at IS NULL OR next_attempt_at <= now())
+                            AND (claimed_by IS NULL
+                                 OR claimed_at < now() - make_interval(secs => :lease_seconds)))
+                           OR (status = :pending AND claimed_by IS NOT NULL
+                               AND claimed_at < now() - make_interval(secs => :lease_seconds)))
+                      {partition_clause}
+                    ORDER BY next_attempt_at NULLS FIRST, created_at
+                    LIMIT :limit
+                """),
+                params).fetchall()
+
+        return [row[0] for row in rows]
+
+    def get_dead_letters(self, limit: int = 100) -> list[dict[str, any]]:
+        with self._engine.connect() as conn:
+            rows = conn.execute(
+                text("""
+                    SELECT order_id, order_code, attempt_count, last_error, updated_at FROM mikro_order_sync_state
+                    WHERE status = :dead_letter
+                    ORDER BY updated_at DESC
+                    LIMIT :limit
+                """),
+                {"dead_letter": self.STATUS_DEAD_LETTER, "limit": limit}).fetchall()
+
+        return [{"order_id": order_id, "order_code": order_code, "attempt_count": attempt_count,
+                 "last_error": last_error, "updated_at": updated_at.isoformat()}
+                for order_id, order_code, attempt_count, last_error, updated_at in rows]
+
+    def requeue_dead_letters(self, order_codes: Optional[list[str]] = None) -> int:
+        query: str = """
+            UPDATE mikro_order_sync_state SET status = :failed, attempt_count = 0, next_attempt_at = now(),
+                claimed_by = NULL, claimed_at = NULL, updated_at = now()
+            WHERE status = :dead_letter
+        """
+        params: dict[str, any] = {"failed": self.STATUS_FAILED, "dead_letter": self.STATUS_DEAD_LETTER}
+
+        if order_codes:
+            query += " AND order_code = ANY(CAST(:order_codes AS TEXT[]))"
+            params["order_codes"] = list(order_codes)
+
+        with self._engine.begin() as conn:
+            requeued_count: int = conn.execute(text(query), params).rowcount
+
+        self._logger.info(f"{requeued_count} sipariş hatalı siparişler kuyruğundan yeniden denenmek üzere alındı")
+        return requeued_count
+
+    def get_status_counts(self) -> dict[str, int]:
+        with self._engine.connect() as conn:
+            rows = conn.execute(
+                text("SELECT status, COUNT(*) FROM mikro_order_sync_state GROUP BY status")).fetchall()
+        return {status: count for status, count in rows}
+
+    def close(self) -> None:
+        self._engine.dispose()
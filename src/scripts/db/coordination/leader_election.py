@@ -0,0 +1,167 @@
+from typing import Iterable, Optional
+import hashlib
+import random
+
+from src.logger.custom_logger import SingletonLogger
+
+class AdvisoryLock:
+
+    def __init__(self, connector, name: str):
+        self._connector = connector
+        self._name: str = name
+        self._key: int = self.lock_key(name)
+        self._connection = None
+        self._backend_pid: Optional[int] = None
+        self._logger = SingletonLogger().get_logger()
+
+    @staticmethod
+    def lock_key(name: str) -> int:
+        return int.from_bytes(hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest(), "big", signed=True)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def key(self) -> int:
+        return self._key
+
+    @property
+    def backend_pid(self) -> Optional[int]:
+        return self._backend_pid
+
+    @property
+    def held(self) -> bool:
+        return self._connection is not None
+
+    def try_acquire(self) -> bool:
+        if self._connection is not None:
+            return True
+
+        connection = self._connector.get_engine().raw_connection()
+
+        try:
+            dbapi_connection = connection.dbapi_connection
+            dbapi_connection.autocommit = True
+
+            cursor = dbapi_connection.cursor()
+            cursor.execute("SELECT pg_try_advisory_lock(%s), pg_backend_pid()", (self._key,))
+            acquired, backend_pid = cursor.fetchone()
+            cursor.close()
+        except Exception:
+            connection.invalidate()
+            raise
+
+        if not acquired:
+            connection.invalidate()
+            return False
+
+        self._connection = connection
+        self._backend_pid = backend_pid
+        self._logger.info(f"'{self._name}' küme kilidi alındı")
+        return True
+
+    def is_held(self) -> bool:
+        if self._connection is None:
+            return False
+
+        try:
+            self._execute("SELECT 1")
+        except Exception as e:
+            self._logger.warning(f"'{self._name}' küme kilidinin bağlantısı koptu: {e}")
+            return False
+
+        return True
+
+    def _execute(self, statement: str, params: tuple = None) -> None:
+        if self._connection is None:
+            raise RuntimeError(f"'{self._name}' küme kilidi bu düğümde tutulmuyor")
+
+        try:
+            cursor = self._connection.dbapi_connection.cursor()
+            cursor.execute(statement, params)
+            cursor.close()
+        except Exception:
+            self._drop()
+            raise
+
+    def release(self) -> None:
+        if self._connection is None:
+            return
+
+        try:
+            self._execute("SELECT pg_advisory_unlock(%s)", (self._key,))
+        except Exception as e:
+            self._logger.warning(f"'{self._name}' küme kilidi bırakılırken hata oluştu: {e}")
+        finally:
+            self._drop()
+
+        self._logger.info(f"'{self._name}' küme kilidi bırakıldı")
+
+    def _drop(self) -> None:
+        connection = self._connection
+        self._connection = None
+        self._backend_pid = None
+
+        if connection is not None:
+            connection.invalidate()
+
+
+class LeaderElector:
+
+    def __init__(self, connector, lock_name: str = "mikro_integration", shard_count: int = 1,
+                 retry_seconds: float = 10):
+        self._connector = connector
+        self._lock_name: str = lock_name
+        self._shard_count: int = max(shard_count, 1)
+        self._retry_seconds: float = retry_seconds
+        self._logger = SingletonLogger().get_logger()
+
+    def _shard_lock_name(self, shard_index: int) -> str:
+        if self._shard_count == 1:
+            return self._lock_name
+        return f"{self._lock_name}:{shard_index}/{self._shard_count}"
+
+    @property
+    def shard_count(self) -> int:
+        return self._shard_count
+
+    def try_acquire(self, excluded_shard_indexes: Iterable[int] = ()) -> Optional[tuple[int, AdvisoryLock]]:
+        excluded_shard_indexes: set[int] = set(excluded_shard_indexes)
+        start_index: int = random.randrange(self._shard_count)
+
+        for offset in range(self._shard_count):
+            shard_index: int = (start_index + offset) % self._shard_count
+            if shard_index in excluded_shard_indexes:
+                continue
+
+            lock = AdvisoryLock(connector=self._connector, name=self._shard_lock_name(shard_index))
+
+            try:
+                if not lock.try_acquire():
+                    continue
+            except Exception as e:
+                lock.release()
+                self._logger.warning(f"'{lock.name}' küme kilidi alınamadı: {e}")
+                continue
+
+            self._logger.info(f"Bu düğüm {shard_index + 1}/{self._shard_count}. parçanın siparişlerini işleyecek")
+            return shard_index, lock
+
+        return None
+
+    def acquire(self, stop_event) -> Optional[tuple[int, AdvisoryLock]]:
+        standby_logged: bool = False
+
+        while not stop_event.is_set():
+            shard: Optional[tuple[int, AdvisoryLock]] = self.try_acquire()
+            if shard is not None:
+                return shard
+
+            if not standby_logged:
+                self._logger.info("Tüm parçalar başka düğümler tarafından işleniyor, yedek modda bekleniyor...")
+                standby_logged = True
+
+            stop_event.wait(self._retry_seconds)
+
+        return None
@@ -1,42 +1,100 @@
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy import text
+from sqlalchemy.engine import Connection
 from src.logger.custom_logger import SingletonLogger
-from typing import List, Dict, Any, Optional
+from sqlalchemy.sql.elements import TextClause
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple, Union
 import re
 
+_PASSTHROUGH_TYPE_CODES = frozenset({16, 19, 20, 21, 23, 25, 26, 700, 701, 1042, 1043})
+_ISOFORMAT_TYPE_CODES = frozenset({1082, 1083, 1114, 1184, 1266})
+_STRING_TYPE_CODES = frozenset({1700, 2950})
+
+def _convert_value(value: Any) -> Any:
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    elif hasattr(value, '__str__') and not isinstance(value, (int, float, bool, str)):
+        return str(value)
+    return value
+
+def _isoformat_value(value: Any) -> str:
+    return value.isoformat()
+
+_IDENTIFIER_PATTERN = re.compile(r"'(?:[^']|'')*'|(?<![:\w\"])[A-Za-z_][A-Za-z0-9_]*\b")
+_BIND_PARAM_PATTERN = re.compile(r'(?<![:\w]):([A-Za-z_][A-Za-z0-9_]*)')
+_SQL_KEYWORDS = frozenset({"AND", "OR", "NOT", "IN", "IS", "NULL", "LIKE", "ILIKE", "BETWEEN",
+                           "TRUE", "FALSE", "ANY", "ALL", "ASC", "DESC"})
+
+@lru_cache(maxsize=1024)
+def _quote_identifier(identifier: str) -> str:
+    if identifier.startswith("'") or identifier.upper() in _SQL_KEYWORDS or not any(c.isupper() for c in identifier):
+        return identifier
+    return f'"{identifier}"'
+
+@lru_cache(maxsize=256)
+def _format_where_clause(where_clause: str) -> str:
+    return _IDENTIFIER_PATTERN.sub(lambda match: _quote_identifier(match.group(0)), where_clause)
+
 class DatabaseHandler:
 
+    _STATEMENT_CACHE_SIZE: int = 256
+    _statement_cache: "OrderedDict[tuple, TextClause]" = OrderedDict()
+    _statement_cache_lock = Lock()
+
     def __init__(self, connector):
         self._connector = connector
         self._logger = SingletonLogger().get_logger()
 
-    def execute_query(self, query: str, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    def _connect(self, use_primary: bool = False) -> Connection:
+        primary_engine = self._connector.get_engine()
+
+        while True:
+            engine = primary_engine if use_primary else self._connector.get_read_engine()
+
+            try:
+                return engine.connect()
+            except OperationalError as e:
+                if engine is primary_engine:
+                    raise
+                self._connector.mark_replica_unhealthy(engine, e)
+
+    def _execute_read(self, read: Callable[[Connection], Any], use_primary: bool = False) -> Any:
+        replica_error: Optional[OperationalError] = None
+
+        with self._connect(use_primary) as conn:
+            try:
+                return read(conn)
+            except OperationalError as e:
+                if conn.engine is self._connector.get_engine():
+                    raise
+                replica_error = e
+
+        self._connector.mark_replica_unhealthy(conn.engine, replica_error)
+
+        with self._connect(use_primary=True) as conn:
+            return read(conn)
+
+    def execute_query(self, query: Union[str, TextClause], params: Optional[Dict] = None,
+                      as_tuples: bool = False, use_primary: bool = False) -> Union[List[Dict[str, Any]], List[Tuple]]:
         try:
-            with self._connector.get_engine().connect() as conn:
+            statement = text(query) if isinstance(query, str) else query
+
+            def read(conn: Connection) -> Union[List[Dict[str, Any]], List[Tuple]]:
                 if params:
-                    result = conn.execute(text(query), params)
+                    result = conn.execute(statement, params)
                 else:
-                    result = conn.execute(text(query))
+                    result = conn.execute(statement)
 
                 columns = list(result.keys())
-                rows = []
-
-                for row in result:
-                    row_dict = {}
-                    for i, value in enumerate(row):
-                        if value is not None:
-                            if hasattr(value, 'isoformat'):
-                                row_dict[columns[i]] = value.isoformat()
-                            elif hasattr(value, '__str__') and not isinstance(value, (int, float, bool, str)):
-                                row_dict[columns[i]] = str(value)
-                            else:
-                                row_dict[columns[i]] = value
-                        else:
-                            row_dict[columns[i]] = None
+                converters = self._resolve_column_converters(result)
 
-                    rows.append(row_dict)
+                return self._materialize_rows(rows=result.fetchall(), columns=columns,
+                                              converters=converters, as_tuples=as_tuples)
 
-                return rows
+            return self._execute_read(read, use_primary=use_primary)
 
         except SQLAlchemyError as e:
             self._logger.error(f"SQL sorgu hatası: {e}")
@@ -45,13 +103,167 @@ class DatabaseHandler:
             self._logger.error(f"Genel hata: {e}")
             raise
 
+    @staticmethod
+    def _resolve_column_converters(result) -> List[Tuple[int, Callable[[Any], Any]]]:
+        cursor = getattr(result, "cursor", None)
+        description = getattr(cursor, "description", None)
+
+        if not description:
+            return [(i, _convert_value) for i in range(len(result.keys()))]
+
+        converters = []
+        for i, column in enumerate(description):
+            type_code = column[1]
+            if type_code in _PASSTHROUGH_TYPE_CODES:
+                continue
+            elif type_code in _ISOFORMAT_TYPE_CODES:
+                converters.append((i, _isoformat_value))
+            elif type_code in _STRING_TYPE_CODES:
+                converters.append((i, str))
+            else:
+                converters.append((i, _convert_value))
+
+        return converters
+
+    @staticmethod
+    def _materialize_rows(rows, columns: List[str], converters: List[Tuple[int, Callable[[Any], Any]]],
+                          as_tuples: bool = False) -> Union[List[Dict[str, Any]], List[Tuple]]:
+        if converters and rows:
+            column_values = list(zip(*rows))
+            for i, converter in converters:
+                column_values[i] = [converter(value) if value is not None else None for value in column_values[i]]
+            rows = zip(*column_values)
+
+        if as_tuples:
+            return [tuple(row) for row in rows]
+
+        return [dict(zip(columns, row)) for row in rows]
+
     def _format_table_name(self, table_name: str) -> str:
         if any(c.isupper() for c in table_name):
             return f'"{table_name}"'
         return table_name
 
+    def _get_select_statement(self, table_name: str, columns: List[str] = None, where_clause: str = None,
+                              order_by: List[str] = None, descending: bool = False,
+                              limit: int = None) -> TextClause:
+        key = (table_name, tuple(columns) if columns else None, where_clause,
+               tuple(order_by) if order_by else None, descending, limit)
+
+        with self._statement_cache_lock:
+            statement = self._statement_cache.get(key)
+            if statement is not None:
+                self._statement_cache.move_to_end(key)
+                return statement
+
+        statement = text(self._build_select_query(table_name=table_name, columns=columns,
+                                                  where_clause=where_clause, order_by=order_by,
+                                                  descending=descending, limit=limit))
+
+        with self._statement_cache_lock:
+            self._statement_cache[key] = statement
+            while len(self._statement_cache) > self._STATEMENT_CACHE_SIZE:
+                self._statement_cache.popitem(last=False)
+
+        return statement
+
+    def execute_prepared(self, name: str, query: str, params: Optional[Dict] = None,
+                         use_primary: bool = False) -> List[Dict[str, Any]]:
+        param_names = list(dict.fromkeys(_BIND_PARAM_PATTERN.findall(query)))
+        positional_query = _BIND_PARAM_PATTERN.sub(
+            lambda match: f"${param_names.index(match.group(1)) + 1}", query)
+        execute_statement = text(f"EXECUTE {name}({', '.join(f':{param}' for param in param_names)})"
+                                 if param_names else f"EXECUTE {name}")
+
+        def read(conn: Connection) -> List[Dict[str, Any]]:
+            prepared_statements = conn.connection.info.setdefault("prepared_statements", set())
+
+            if name not in prepared_statements:
+                conn.execute(text(f"PREPARE {name} AS {positional_query}"))
+                prepared_statements.add(name)
+
+            result = conn.execute(execute_statement, params or {})
+
+            columns = list(result.keys())
+            converters = self._resolve_column_converters(result)
+
+            return self._materialize_rows(rows=result.fetchall(), columns=columns, converters=converters)
+
+        try:
+            return self._execute_read(read, use_primary=use_primary)
+
+        except SQLAlchemyError as e:
+            self._logger.error(f"Hazır sorgu hatası ({name}): {e}")
+            raise
+
+    def iter_query(self, query: Union[str, TextClause], params: Optional[Dict] = None,
+                   fetch_size: int = 1000, chunked: bool = False, as_tuples: bool = False,
+                   use_primary: bool = False) -> Iterator[Union[Dict[str, Any], Tuple, List]]:
+        try:
+            statement = text(query) if isinstance(query, str) else query
+            rows_yielded = False
+
+            with self._connect(use_primary) as conn:
+                try:
+                    for rows in self._iter_partitions(conn, statement, params, fetch_size, as_tuples):
+                        rows_yielded = True
+                        if chunked:
+                            yield rows
+                        else:
+                            yield from rows
+                    return
+                except OperationalError as e:
+                    if rows_yielded or conn.engine is self._connector.get_engine():
+                        raise
+                    replica_error = e
+
+            self._connector.mark_replica_unhealthy(conn.engine, replica_error)
+
+            with self._connect(use_primary=True) as conn:
+                for rows in self._iter_partitions(conn, statement, params, fetch_size, as_tuples):
+                    if chunked:
+                        yield rows
+                    else:
+                        yield from rows
+
+        except SQLAlchemyError as e:
+            self._logger.error(f"SQL akış sorgusu hatası: {e}")
+            raise
+
+    def _iter_partitions(self, conn: Connection, statement: TextClause, params: Optional[Dict], fetch_size: int,
+                         as_tuples: bool) -> Iterator[Union[List[Dict[str, Any]], List[Tuple]]]:
+        streaming_conn = conn.execution_options(stream_results=True, yield_per=fetch_size)
+        result = streaming_conn.execute(statement, params or {})
+
+        columns = list(result.keys())
+        converters = None
+
+        for partition in result.partitions(fetch_size):
+            if converters is None:
+                converters = self._resolve_column_converters(result)
+
+            yield self._materialize_rows(rows=partition, columns=columns, converters=converters,
+                                         as_tuples=as_tuples)
+
     def execute_select(self, table_name: str, columns: List[str] = None,
-                       where_clause: str = None, params: Dict = None) -> List[Dict[str, Any]]:
+                       where_clause: str = None, params: Dict = None,
+                       order_by: List[str] = None, descending: bool = False,
+                       limit: int = None, use_primary: bool = False) -> List[Dict[str, Any]]:
+        statement = self._get_select_statement(table_name=table_name, columns=columns, where_clause=where_clause,
+                                               order_by=order_by, descending=descending, limit=limit)
+        return self.execute_query(statement, params, use_primary=use_primary)
+
+    def iter_select(self, table_name: str, columns: List[str] = None,
+                    where_clause: str = None, params: Dict = None,
+                    order_by: List[str] = None, descending: bool = False,
+                    limit: int = None, fetch_size: int = 1000, chunked: bool = False,
+                    use_primary: bool = False) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        statement = self._get_select_statement(table_name=table_name, columns=columns, where_clause=where_clause,
+                                               order_by=order_by, descending=descending, limit=limit)
+        return self.iter_query(statement, params, fetch_size=fetch_size, chunked=chunked, use_primary=use_primary)
+
+    def _build_select_query(self, table_name: str, columns: List[str] = None, where_clause: str = None,
+                            order_by: List[str] = None, descending: bool = False, limit: int = None) -> str:
         if columns:
             formatted_columns = [self._format_table_name(col) if any(c.isupper() for c in col) else col for col in
                                  columns]
@@ -63,16 +275,17 @@ class DatabaseHandler:
         query = f"SELECT {columns_str} FROM {formatted_table_name}"
 
         if where_clause:
-            def format_identifier(match):
-                identifier = match.group(0)
-                if any(c.isupper() for c in identifier):
-                    return f'"{identifier}"'
-                return identifier
+            query += f" WHERE {_format_where_clause(where_clause)}"
+
+        if order_by:
+            direction = " DESC" if descending else ""
+            formatted_order_by = [f"{self._format_table_name(col)}{direction}" for col in order_by]
+            query += f" ORDER BY {', '.join(formatted_order_by)}"
 
-            formatted_where = re.sub(r'\b[A-Za-z_][A-Za-z0-9_]*\b', format_identifier, where_clause)
-            query += f" WHERE {formatted_where}"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
 
-        return self.execute_query(query, params)
+        return query
 
     def execute_insert(self, table_name: str, data: Dict[str, Any]) -> bool:
         try:
@@ -184,8 +397,8 @@ class DatabaseHandler:
         result = self.execute_query(query, {"table_name": table_name, "schema": schema})
         return result[0]['count'] > 0
 
-    def get_table_count(self, table_name: str) -> int:
+    def get_table_count(self, table_name: str, use_primary: bool = False) -> int:
         formatted_table_name = self._format_table_name(table_name)
         query = f"SELECT COUNT(*) as count FROM {formatted_table_name}"
-        result = self.execute_query(query)
+        result = self.execute_query(query, use_primary=use_primary)
         return result[0]['count']
\ No newline at end of file
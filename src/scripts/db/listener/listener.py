@@ -0,0 +1,86 @@
+from typing import Optional
+import select
+
+from src.logger.custom_logger import SingletonLogger
+
+class OrderNotificationListener:
+
+    def __init__(self, connector, channel: str = "mikro_new_order"):
+        self._connector = connector
+        self._channel: str = channel
+        self._connection = None
+        self._logger = SingletonLogger().get_logger()
+
+    def install_trigger(self) -> None:
+        function_name: str = f"{self._channel}_notify"
+
+        statements: list[str] = [
+            f"""
+            CREATE OR REPLACE FUNCTION {function_name}() RETURNS trigger AS $$
+            BEGIN
+                PERFORM pg_notify('{self._channel}', NEW."Id"::text);
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql
+            """,
+            f'DROP TRIGGER IF EXISTS {function_name}_trigger ON "Orders"',
+            f"""
+            CREATE TRIGGER {function_name}_trigger
+            AFTER INSERT ON "Orders"
+            FOR EACH ROW EXECUTE FUNCTION {function_name}()
+            """
+        ]
+
+        connection = self._connector.get_engine().raw_connection()
+        try:
+            cursor = connection.cursor()
+            for statement in statements:
+                cursor.execute(statement)
+            connection.commit()
+            cursor.close()
+        finally:
+            connection.close()
+
+        self._logger.info(f"Orders tablosu için '{self._channel}' bildirim tetikleyicisi kuruldu")
+
+    def start(self) -> None:
+        if self._connection is not None:
+            return
+
+        self._connection = self._connector.get_engine().raw_connection()
+        dbapi_connection = self._connection.dbapi_connection
+        dbapi_connection.autocommit = True
+
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"LISTEN {self._channel}")
+        cursor.close()
+
+        self._logger.info(f"'{self._channel}' kanalı yeni siparişler için dinleniyor")
+
+    def wait(self, timeout: float) -> int:
+        if self._connection is None:
+            self.start()
+
+        dbapi_connection = self._connection.dbapi_connection
+
+        try:
+            readable, _, _ = select.select([dbapi_connection], [], [], timeout)
+            if not readable:
+                return 0
+
+            dbapi_connection.poll()
+            notification_count: int = len(dbapi_connection.notifies)
+            dbapi_connection.notifies.clear()
+            return notification_count
+
+        except Exception:
+            self.stop()
+            raise
+
+    def stop(self) -> None:
+        connection: Optional[object] = self._connection
+        self._connection = None
+
+        if connection is not None:
+            connection.invalidate()
+            self._logger.info(f"'{self._channel}' kanalının dinlenmesi durduruldu")
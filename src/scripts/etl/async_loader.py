@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Collection, Hashable, Optional, TypeVar
+import asyncio
+import time
+
+from src.logger.custom_logger import SingletonLogger
+
+T = TypeVar("T")
+
+class PredecessorFailedError(Exception):
+    pass
+
+class AsyncLoader:
+
+    def __init__(self, max_in_flight: int = 4, min_in_flight: int = 1, slow_response_seconds: float = 5.0):
+        self._logger = SingletonLogger.get_logger()
+        self._max_in_flight: int = max(max_in_flight, 1)
+        self._min_in_flight: int = max(min(min_in_flight, self._max_in_flight), 1)
+        self._slow_response_seconds: float = slow_response_seconds
+        self._executor = ThreadPoolExecutor(max_workers=self._max_in_flight, thread_name_prefix="mikro-loader")
+
+        self._in_flight_limit: int = self._max_in_flight
+        self._in_flight: int = 0
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def in_flight_limit(self) -> int:
+        return self._in_flight_limit
+
+    def run_all(self, jobs: list[Callable[[], T]],
+                ordering_keys: Optional[list[Collection[Hashable]]] = None,
+                is_failure: Optional[Callable[[T], bool]] = None) -> list:
+        return asyncio.run(self.run_all_async(jobs=jobs, ordering_keys=ordering_keys, is_failure=is_failure))
+
+    async def run_all_async(self, jobs: list[Callable[[], T]],
+                            ordering_keys: Optional[list[Collection[Hashable]]] = None,
+                            is_failure: Optional[Callable[[T], bool]] = None) -> list:
+        self._condition = asyncio.Condition()
+        ordering_keys = ordering_keys or [()] * len(jobs)
+
+        last_task_by_key: dict[Hashable, asyncio.Task] = {}
+        tasks: list[asyncio.Task] = []
+
+        for job, job_ordering_keys in zip(jobs, ordering_keys):
+            previous_tasks: set[asyncio.Task] = {last_task_by_key[ordering_key] for ordering_key in job_ordering_keys
+                                                 if ordering_key in last_task_by_key}
+            task = asyncio.create_task(self._run_job(job=job, previous_tasks=previous_tasks, is_failure=is_failure))
+
+            for ordering_key in job_ordering_keys:
+                last_task_by_key[ordering_key] = task
+            tasks.append(task)
+
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_job(self, job: Callable[[], T], previous_tasks: set[asyncio.Task],
+                       is_failure: Optional[Callable[[T], bool]]) -> T:
+        if previous_tasks:
+            await asyncio.wait(previous_tasks)
+
+            if any(self._has_failed(task=previous_task, is_failure=is_failure) for previous_task in previous_tasks):
+                raise PredecessorFailedError("Aynı sıralama anahtarına sahip önceki iş başarısız oldu, bu iş "
+                                             "gönderilmedi")
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self._in_flight_limit)
+            self._in_flight += 1
+
+        started_at: float = time.monotonic()
+        succeeded: bool = False
+
+        try:
+            result: T = await asyncio.get_running_loop().run_in_executor(self._executor, job)
+            succeeded = True
+            return result
+
+        finally:
+            elapsed_seconds: float = time.monotonic() - started_at
+
+            async with self._condition:
+                self._in_flight -= 1
+                self._adjust_in_flight_limit(succeeded=succeeded, elapsed_seconds=elapsed_seconds)
+                self._condition.notify_all()
+
+    @staticmethod
+    def _has_failed(task: asyncio.Task, is_failure: Optional[Callable[[T], bool]]) -> bool:
+        if task.cancelled() or task.exception() is not None:
+            return True
+        return is_failure is not None and is_failure(task.result())
+
+    def _adjust_in_flight_limit(self, succeeded: bool, elapsed_seconds: float) -> None:
+        if not succeeded or elapsed_seconds > self._slow_response_seconds:
+            new_limit: int = max(self._min_in_flight, self._in_flight_limit // 2)
+            if new_limit != self._in_flight_limit:
+                self._logger.warning(f"Mikro yavaşladı ({elapsed_seconds:.2f} sn), eş zamanlı istek limiti "
+                                     f"{self._in_flight_limit} -> {new_limit} düşürüldü")
+        else:
+            new_limit: int = min(self._max_in_flight, self._in_flight_limit + 1)
+
+        self._in_flight_limit = new_limit
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
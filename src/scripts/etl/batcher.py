@@ -0,0 +1,144 @@
+from dataclasses import dataclass, field
+import json
+import requests
+
+from src.library.models.evrak_result import EvrakResult
+from src.library.models.order_line import OrderLine
+from src.logger.custom_logger import SingletonLogger
+from src.scripts.generator.siparis_kaydet_v2_json import SiparisKaydetV2JSON
+
+@dataclass()
+class SiparisBatch:
+
+    orders: list[dict[str, any]] = field(default_factory=list)
+    evraklar: list[dict[str, any]] = field(default_factory=list)
+    evrak_payloads: list[bytes] = field(default_factory=list)
+    line_count: int = 0
+    byte_size: int = 0
+
+    @property
+    def ordering_keys(self) -> frozenset:
+        return frozenset(order.get("CustomerId") for order in self.orders if order.get("CustomerId") is not None)
+
+class SiparisBatcher:
+
+    def __init__(self, generator: SiparisKaydetV2JSON, max_orders: int = 50,
+                 max_lines: int = 1000, max_bytes: int = 1000000):
+        self._logger = SingletonLogger.get_logger()
+        self._generator: SiparisKaydetV2JSON = generator
+        self._max_orders: int = max(max_orders, 1)
+        self._max_lines: int = max(max_lines, 1)
+        self._max_bytes: int = max(max_bytes, 1)
+
+    def create_batches(self, orders: list[dict[str, any]],
+                       orders_final_items: list[list[OrderLine]]) -> tuple[list[SiparisBatch], list[EvrakResult]]:
+        batches: list[SiparisBatch] = []
+        rejected_results: list[EvrakResult] = []
+        current_batch = SiparisBatch()
+
+        orders_with_lines: list[dict[str, any]] = []
+        evraklar: list[dict[str, any]] = []
+
+        for order, final_order_items in zip(orders, orders_final_items):
+            if not final_order_items:
+                self._logger.warning(f"{order.get('Code')} kodlu siparişin satırı bulunamadı, yeniden denenmek "
+                                     f"üzere kuyruğa alındı")
+                rejected_results.append(EvrakResult(order=order, success=False,
+                                                    message="Siparişin satırı bulunamadı"))
+                continue
+
+            orders_with_lines.append(order)
+            evraklar.append(self._generator.create_evrak(final_order_items))
+
+        evrak_errors: dict[int, list[str]] = self._generator.validate_evraklar(evraklar) if evraklar else {}
+
+        for evrak_index, (order, evrak) in enumerate(zip(orders_with_lines, evraklar)):
+            if evrak_index in evrak_errors:
+                message: str = "; ".join(evrak_errors[evrak_index])
+                self._logger.error(f"{order.get('Code')} kodlu sipariş Mikro şemasına uygun değil, "
+                                   f"gönderilmeyecek: {message}")
+                rejected_results.append(EvrakResult(order=order, success=False, message=message, retryable=False))
+                continue
+
+            evrak_payload: bytes = self._generator.serialize_evrak(evrak)
+            evrak_byte_size: int = len(evrak_payload)
+            evrak_line_count: int = len(evrak["satirlar"])
+
+            if current_batch.orders and (
+                    len(current_batch.orders) >= self._max_orders
+                    or current_batch.line_count + evrak_line_count > self._max_lines
+                    or current_batch.byte_size + evrak_byte_size > self._max_bytes):
+                batches.append(current_batch)
+                current_batch = SiparisBatch()
+
+            current_batch.orders.append(order)
+            current_batch.evraklar.append(evrak)
+            current_batch.evrak_payloads.append(evrak_payload)
+            current_batch.line_count += evrak_line_count
+            current_batch.byte_size += evrak_byte_size
+
+        if current_batch.orders:
+            batches.append(current_batch)
+
+        self._logger.info(f"{len(orders)} sipariş {len(batches)} toplu istekte gönderilmek üzere paketlendi")
+        return batches, rejected_results
+
+    def parse_batch_results(self, batch: SiparisBatch, resp: requests.models.Response) -> list[EvrakResult]:
+        batch_success: bool = resp.status_code == 200
+        evrak_results: list = self._get_evrak_results(resp=resp)
+
+        if len(evrak_results) != len(batch.orders):
+            error_messages: list[str] = self._get_error_messages(resp=resp)
+            if evrak_results and not error_messages:
+                error_messages.append(f"Mikro {len(batch.orders)} evrak için {len(evrak_results)} sonuç döndürdü")
+
+            success: bool = batch_success and not error_messages
+            message: str = "" if success else (f"Statü Kodu: {resp.status_code} - "
+                                               f"{'; '.join(error_messages) or resp.text}")
+            return [EvrakResult(order=order, success=success, message=message, response=resp.text)
+                    for order in batch.orders]
+
+        results: list[EvrakResult] = []
+        for order, evrak_result in zip(batch.orders, evrak_results):
+            is_error: bool = bool(evrak_result.get("IsError", not batch_success))
+            message: str = evrak_result.get("ErrorMessage") or ""
+            results.append(EvrakResult(order=order, success=batch_success and not is_error, message=message,
+                                       response=json.dumps(evrak_result, ensure_ascii=False)))
+
+        return results
+
+    @staticmethod
+    def _get_error_messages(resp: requests.models.Response) -> list[str]:
+        try:
+            body = resp.json()
+        except ValueError:
+            return []
+
+        error_messages: list[str] = []
+        pending: list = [body]
+
+        while pending:
+            item = pending.pop()
+
+            if isinstance(item, list):
+                pending.extend(item)
+            elif isinstance(item, dict):
+                if item.get("IsError") is True:
+                    error_messages.append(str(item.get("ErrorMessage") or "IsError: true"))
+                pending.extend(value for value in item.values() if isinstance(value, (dict, list)))
+
+        return error_messages
+
+    @staticmethod
+    def _get_evrak_results(resp: requests.models.Response) -> list:
+        try:
+            body = resp.json()
+        except ValueError:
+            return []
+
+        if isinstance(body, dict):
+            body = body.get("result", body.get("Result", []))
+
+        if isinstance(body, list) and all(isinstance(item, dict) for item in body):
+            return body
+        return []
@@ -1,11 +1,18 @@
-from typing import Optional
+from typing import Iterator, Optional
 
+from sqlalchemy import bindparam, text
+
+from src.library.models.order_line import OrderLine
+from src.library.models.order_partition import OrderPartition
+from src.library.models.order_watermark import OrderWatermark
 from src.scripts.db.handler.handler import DatabaseHandler
+from src.scripts.utils.lookup_cache import LookupCache
 from src.logger.custom_logger import SingletonLogger
 
 class Extractor(DatabaseHandler):
 
-    def __init__(self, connector):
+    def __init__(self, connector, cache_config: Optional[dict[str, any]] = None,
+                 use_prepared_statements: bool = False, safety_window_seconds: float = 0):
         super().__init__(connector)
         self._logger = SingletonLogger().get_logger()
         self.order_id: str = ""
@@ -14,16 +21,148 @@ class Extractor(DatabaseHandler):
         self.customer_code: str = ""
         self.formatted_order_items: list[dict[str, any]] = []
         self._db_handler = DatabaseHandler(connector=connector)
+        self._use_prepared_statements: bool = use_prepared_statements
+        self._safety_window_seconds: float = safety_window_seconds
+
+        cache_config: dict[str, any] = cache_config or {}
+        self._cache_max_size: int = cache_config.get("max_size", 10000)
+        self._cache_updated_at_column: str = cache_config.get("updated_at_column", "")
+        self._customer_code_cache = LookupCache(name="Müşteri kodu",
+                                                max_size=self._cache_max_size,
+                                                ttl_seconds=cache_config.get("ttl_seconds", 3600))
+        self._product_code_cache = LookupCache(name="Ürün kodu",
+                                               max_size=self._cache_max_size,
+                                               ttl_seconds=cache_config.get("ttl_seconds", 3600))
 
-    def get_latest_order_from_orders_table(self) -> Optional[str]:
-        orders_data: dict[str, any] = self._db_handler.execute_select(table_name="Orders")
+    def get_latest_order_from_orders_table(self) -> Optional[dict[str, any]]:
+        orders_data: list[dict] = self._db_handler.execute_select(
+            table_name="Orders",
+            order_by=["CreatedAt", "Id"],
+            descending=True,
+            limit=1,
+            use_primary=True
+        )
 
         if orders_data:
-            latest_order: dict[str, any] = orders_data[-1]
-            latest_order_json: str = self._db_handler.to_json(latest_order)
+            latest_order: dict[str, any] = orders_data[0]
+            latest_order_json: dict[str, any] = self._db_handler.to_json(latest_order)
 
             return latest_order_json
 
+    def get_order_by_code(self, order_code: str) -> Optional[dict[str, any]]:
+        orders_data: list[dict] = self._db_handler.execute_select(
+            table_name="Orders",
+            where_clause="Code = :order_code",
+            params={"order_code": order_code},
+            limit=1,
+            use_primary=True
+        )
+
+        if orders_data:
+            return self._db_handler.to_json(orders_data[0])
+
+    def get_orders_by_ids(self, order_ids: list) -> list[dict[str, any]]:
+        if not order_ids:
+            return []
+
+        query = text("""
+        SELECT *
+        FROM "Orders"
+        WHERE "Id" IN :order_ids
+        ORDER BY "CreatedAt", "Id"
+        """).bindparams(bindparam("order_ids", expanding=True))
+
+        return self._db_handler.execute_query(query, {"order_ids": list(order_ids)}, use_primary=True)
+
+    def get_orders_after_watermark(self, watermark: Optional[OrderWatermark], limit: int,
+                                   partition: Optional[OrderPartition] = None) -> list[dict[str, any]]:
+        where_clauses, params = self._orders_after_watermark_filter(watermark=watermark, partition=partition,
+                                                                    safety_window_seconds=self._safety_window_seconds)
+
+        if self._use_prepared_statements and where_clauses:
+            query: str = self._build_select_query(
+                table_name="Orders",
+                where_clause=" AND ".join(where_clauses),
+                order_by=["CreatedAt", "Id"],
+                limit=limit
+            )
+            name: str = f"mikro_orders_after_watermark_{int(limit)}"
+            if watermark is None:
+                name += "_initial"
+            if partition is not None and partition.enabled:
+                name += "_partitioned"
+            return self._db_handler.execute_prepared(name=name, query=query, params=params, use_primary=True)
+
+        return self._db_handler.execute_select(
+            table_name="Orders",
+            where_clause=" AND ".join(where_clauses) or None,
+            params=params,
+            order_by=["CreatedAt", "Id"],
+            limit=limit,
+            use_primary=True
+        )
+
+    def count_orders_after_watermark(self, watermark: Optional[OrderWatermark],
+                                     partition: Optional[OrderPartition] = None) -> int:
+        where_clauses, params = self._orders_after_watermark_filter(watermark=watermark, partition=partition,
+                                                                    safety_window_seconds=self._safety_window_seconds)
+
+        if not where_clauses:
+            return self._db_handler.get_table_count(table_name="Orders")
+
+        query: str = self._build_select_query(table_name="Orders", columns=["count(*) as count"],
+                                              where_clause=" AND ".join(where_clauses))
+        name: str = "mikro_count_orders_after_watermark"
+        if watermark is None:
+            name += "_initial"
+        if partition is not None and partition.enabled:
+            name += "_partitioned"
+
+        result: list[dict] = self._execute_hot_query(name=name, query=query, params=params)
+        return result[0]["count"]
+
+    @staticmethod
+    def _orders_after_watermark_filter(watermark: Optional[OrderWatermark], partition: Optional[OrderPartition],
+                                       safety_window_seconds: float = 0) -> tuple[list[str], dict[str, any]]:
+        where_clauses: list[str] = []
+        params: dict[str, any] = {}
+
+        if safety_window_seconds > 0:
+            where_clauses.append("CreatedAt <= now() - make_interval(secs => :safety_window_seconds)")
+            params["safety_window_seconds"] = float(safety_window_seconds)
+
+        if watermark is not None:
+            where_clauses.append("(CreatedAt, Id) > (:watermark_created_at, :watermark_order_id)")
+            params.update(watermark.to_params())
+
+        if partition is not None and partition.enabled:
+            where_clauses.append(OrderPartition.WHERE_CLAUSE)
+            params.update(partition.to_params())
+
+        return where_clauses, params
+
+    def _execute_hot_query(self, name: str, query: str, params: dict[str, any],
+                           use_primary: bool = False) -> list[dict[str, any]]:
+        if self._use_prepared_statements:
+            return self._db_handler.execute_prepared(name=name, query=query, params=params, use_primary=use_primary)
+        return self._db_handler.execute_query(query, params, use_primary=use_primary)
+
+    def iter_orders_after_watermark(self, watermark: Optional[OrderWatermark], page_size: int,
+                                    partition: Optional[OrderPartition] = None) -> Iterator[list[dict[str, any]]]:
+        while True:
+            orders_page: list[dict] = self.get_orders_after_watermark(watermark=watermark, limit=page_size,
+                                                                      partition=partition)
+
+            if not orders_page:
+                return
+
+            yield orders_page
+
+            if len(orders_page) < page_size:
+                return
+
+            watermark = OrderWatermark.from_order(orders_page[-1])
+
     def fetch_from_latest_order(self, latest_order: dict[str, any]) -> tuple[str, str, str]:
         self.order_id: str = latest_order.get("Id")
         self.createdAt: str = latest_order.get("CreatedAt")
@@ -31,23 +170,36 @@ class Extractor(DatabaseHandler):
         return self.order_id, self.createdAt, self.customer_id
 
     def fetch_customer_code_from_latest_users(self, customer_id: str) -> str:
-        customer_data: list[dict] = self._db_handler.execute_select(
-        table_name="Users",
-        where_clause="Id = :customer_id",
-        params={"customer_id": customer_id})
+        self.customer_code: str = ""
+
+        cached_customer_code: Optional[str] = self._customer_code_cache.get(customer_id)
+        if cached_customer_code is not None:
+            self.customer_code: str = cached_customer_code
+            return self.customer_code
+
+        customer_query: str = 'SELECT "Code" FROM "Users" WHERE "Id" = :customer_id'
+        customer_data: list[dict] = self._execute_hot_query(name="mikro_customer_code", query=customer_query,
+                                                            params={"customer_id": customer_id})
+
+        if not customer_data:
+            customer_data = self._execute_hot_query(name="mikro_customer_code", query=customer_query,
+                                                    params={"customer_id": customer_id}, use_primary=True)
 
         if customer_data:
             customer: dict[str, any] = customer_data[0]
             customer_json: dict[str, any] = self._db_handler.to_json(customer)
             self.customer_code: str = customer_json.get("Code")
+            self._customer_code_cache.put(customer_id, self.customer_code)
         return self.customer_code
 
     def get_latest_order_item_from_order_items_table(self, order_id: str) -> None:
+        self.formatted_order_items: list[dict[str, any]] = []
 
         order_item_data: list[dict] = self._db_handler.execute_select(
             table_name="OrderItems",
             where_clause="OrderId = :order_id",
-            params={"order_id": order_id}
+            params={"order_id": order_id},
+            use_primary=True
         )
 
         if order_item_data:
@@ -58,16 +210,147 @@ class Extractor(DatabaseHandler):
                                                     "orderId": order_item.get("OrderId")})
 
     def fetch_product_code_from_products_table(self) -> list[dict[str, any]]:
-        for order_item in self.formatted_order_items:
-            products_data: list[dict] = self._db_handler.execute_select(
-                table_name="Products",
-                where_clause="Id = :product_id",
-                params={"product_id": order_item.get("productId")}
-            )
+        product_codes: dict[any, str] = self.resolve_product_codes(
+            product_ids=[order_item.get("productId") for order_item in self.formatted_order_items])
 
-            if products_data:
-                product: dict[str, any] = products_data[0]
-                product_code: str = product.get("Code")
+        for order_item in self.formatted_order_items:
+            product_code: Optional[str] = product_codes.get(order_item.get("productId"))
+            if product_code is not None:
                 order_item["productCode"] = product_code
 
         return self.formatted_order_items
+
+    def resolve_product_codes(self, product_ids: list) -> dict[any, str]:
+        return self._resolve_codes(table_name="Products", cache=self._product_code_cache, ids=product_ids)
+
+    def resolve_customer_codes(self, customer_ids: list) -> dict[any, str]:
+        return self._resolve_codes(table_name="Users", cache=self._customer_code_cache, ids=customer_ids)
+
+    def _resolve_codes(self, table_name: str, cache: LookupCache, ids: list) -> dict[any, str]:
+        codes: dict[any, str] = {}
+        missing_ids: list = []
+
+        for code_id in dict.fromkeys(code_id for code_id in ids if code_id is not None):
+            code: Optional[str] = cache.get(code_id)
+            if code is None:
+                missing_ids.append(code_id)
+            else:
+                codes[code_id] = code
+
+        if missing_ids:
+            fetched_codes: dict[any, str] = self._fetch_codes_by_ids(table_name=table_name, ids=missing_ids)
+            cache.put_many(fetched_codes)
+            codes.update(fetched_codes)
+
+        return codes
+
+    def _fetch_codes_by_ids(self, table_name: str, ids: list) -> dict[any, str]:
+        query = text(f"""
+        SELECT "Id", "Code"
+        FROM "{table_name}"
+        WHERE "Id" IN :ids
+        """).bindparams(bindparam("ids", expanding=True))
+
+        codes: dict[any, str] = {row["Id"]: row["Code"]
+                                 for row in self._db_handler.execute_query(query, {"ids": ids})}
+
+        missing_ids: list = [code_id for code_id in ids if code_id not in codes]
+        if missing_ids:
+            codes.update({row["Id"]: row["Code"]
+                          for row in self._db_handler.execute_query(query, {"ids": missing_ids}, use_primary=True)})
+
+        return codes
+
+    def _lookup_caches(self) -> list[tuple[str, LookupCache]]:
+        return [("Users", self._customer_code_cache), ("Products", self._product_code_cache)]
+
+    def _get_updated_at_high_water_mark(self, table_name: str) -> Optional[str]:
+        query = f'SELECT MAX("{self._cache_updated_at_column}") AS high_water_mark FROM "{table_name}"'
+        result: list[dict] = self._db_handler.execute_query(query)
+        return result[0]["high_water_mark"]
+
+    def warm_lookup_caches(self) -> None:
+        if self._cache_max_size <= 0:
+            return
+
+        for table_name, cache in self._lookup_caches():
+            if self._cache_updated_at_column:
+                cache.high_water_mark = self._get_updated_at_high_water_mark(table_name=table_name)
+
+            loaded_count: int = 0
+            for rows in self._db_handler.iter_select(table_name=table_name, columns=["Id", "Code"],
+                                                     limit=self._cache_max_size, chunked=True):
+                cache.put_many({row["Id"]: row["Code"] for row in rows})
+                loaded_count += len(rows)
+
+            self._logger.info(f"{table_name} tablosundan {loaded_count} kod önbelleğe yüklendi")
+
+    def refresh_lookup_caches(self) -> None:
+        if self._cache_max_size <= 0 or not self._cache_updated_at_column:
+            return
+
+        for table_name, cache in self._lookup_caches():
+            if cache.high_water_mark is None:
+                cache.high_water_mark = self._get_updated_at_high_water_mark(table_name=table_name)
+                continue
+
+            query = f"""
+            SELECT "Id", "{self._cache_updated_at_column}" AS updated_at
+            FROM "{table_name}"
+            WHERE "{self._cache_updated_at_column}" > :high_water_mark
+            """
+            changed_rows: list[dict] = self._db_handler.execute_query(
+                query, {"high_water_mark": cache.high_water_mark})
+
+            for row in changed_rows:
+                cache.invalidate(row["Id"])
+
+            if changed_rows:
+                cache.high_water_mark = max(row["updated_at"] for row in changed_rows)
+                self._logger.info(f"{table_name} tablosunda değişen {len(changed_rows)} kayıt önbellekten silindi")
+
+    def get_lookup_cache_stats(self) -> list[dict[str, any]]:
+        return [cache.get_stats() for _, cache in self._lookup_caches()]
+
+    def fetch_order_lines_for_orders(self, order_ids: list) -> dict[any, dict[str, any]]:
+        orders_lines: dict[any, dict[str, any]] = {
+            order_id: {"customer_code": "", "order_items": []} for order_id in order_ids
+        }
+
+        if not order_ids:
+            return orders_lines
+
+        query = text("""
+        SELECT oi."OrderId" AS "orderId",
+               oi."ProductId" AS "productId",
+               oi."Quantity" AS "quantity",
+               oi."Price" AS "price",
+               o."CustomerId" AS "customerId"
+        FROM "Orders" o
+        JOIN "OrderItems" oi ON oi."OrderId" = o."Id"
+        WHERE o."Id" IN :order_ids
+        """).bindparams(bindparam("order_ids", expanding=True))
+
+        order_lines_data: list[tuple] = self._db_handler.execute_query(query, {"order_ids": list(order_ids)},
+                                                                       as_tuples=True)
+
+        found_order_ids: set = {order_line_data[0] for order_line_data in order_lines_data}
+        missing_order_ids: list = [order_id for order_id in order_ids if order_id not in found_order_ids]
+        if missing_order_ids:
+            order_lines_data += self._db_handler.execute_query(query, {"order_ids": missing_order_ids},
+                                                               as_tuples=True, use_primary=True)
+
+        product_codes: dict[any, str] = self.resolve_product_codes(
+            product_ids=[order_line_data[1] for order_line_data in order_lines_data])
+        customer_codes: dict[any, str] = self.resolve_customer_codes(
+            customer_ids=[order_line_data[4] for order_line_data in order_lines_data])
+
+        for order_id, product_id, quantity, price, customer_id in order_lines_data:
+            order_lines: dict[str, any] = orders_lines.setdefault(order_id, {"customer_code": "", "order_items": []})
+            order_lines["customer_code"] = customer_codes.get(customer_id) or ""
+            order_lines["order_items"].append(OrderLine(order_id=order_id, product_id=product_id, quantity=quantity,
+                                                        price=price, product_code=product_codes.get(product_id)))
+
+        self._logger.info(f"{len(order_ids)} sipariş için {len(order_lines_data)} satır çekildi, ürün ve müşteri "
+                          f"kodları önbellekten çözüldü")
+        return orders_lines
@@ -1,32 +1,141 @@
+from contextlib import nullcontext
+from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.retry import Retry
 from src.library.endpoints.mikro import Mikro
 from src.logger.custom_logger import SingletonLogger
+from src.scripts.utils.circuit_breaker import CircuitBreaker
+from src.scripts.utils.rate_limiter import AdaptiveRateLimiter
 import requests
+import threading
+import time
+
+class MikroUnavailableError(Exception):
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code: int = status_code
 
 class Loader:
 
-    def __init__(self):
+    _RETRY_STATUS_CODES: tuple[int, ...] = (502, 503, 504)
+    _OVERLOAD_STATUS_CODES: tuple[int, ...] = (429,)
+    _REFUSED_STATUS_CODES: tuple[int, ...] = (429, 503)
+
+    def __init__(self, pool_size: int = 10, connect_timeout: float = 5, read_timeout: float = 30,
+                 max_retries: int = 3, backoff_factor: float = 0.5,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 in_flight_limiter: Optional[threading.Semaphore] = None):
         self._endpoints = Mikro()
+        self._circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self._rate_limiter: Optional[AdaptiveRateLimiter] = rate_limiter
+        self._in_flight_limiter: Optional[threading.Semaphore] = in_flight_limiter
         self._logger = SingletonLogger.get_logger()
-        self._header: dict[str, str] = {"Content-Type": "application/json"}
+        self._header: dict[str, str] = {"Content-Type": "application/json; charset=utf-8"}
+        self._timeout: tuple[float, float] = (connect_timeout, read_timeout)
+        self._session: requests.Session = self._create_session(
+            pool_size=pool_size, retry=self._create_retry(max_retries=max_retries, backoff_factor=backoff_factor,
+                                                          retry_sent_requests=False))
+        self._login_session: requests.Session = self._create_session(
+            pool_size=1, retry=self._create_retry(max_retries=max_retries, backoff_factor=backoff_factor,
+                                                  retry_sent_requests=True))
+
+    def _create_retry(self, max_retries: int, backoff_factor: float, retry_sent_requests: bool) -> Retry:
+        return Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            other=0,
+            status=max_retries if retry_sent_requests else 0,
+            backoff_factor=backoff_factor,
+            status_forcelist=self._RETRY_STATUS_CODES if retry_sent_requests else (),
+            allowed_methods=frozenset(["POST"]) if retry_sent_requests else frozenset(),
+            raise_on_status=False
+        )
+
+    def _create_session(self, pool_size: int, retry: Retry) -> requests.Session:
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        session = requests.Session()
+        session.headers.update(self._header)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _post(self, url: str, payload: bytes, session: requests.Session) -> requests.models.Response:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.before_call()
+
+        started_at: float = time.monotonic()
+        succeeded: bool = False
+
+        try:
+            with self._in_flight_limiter or nullcontext():
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+
+                started_at = time.monotonic()
+                resp: requests.models.Response = session.post(url=url, data=payload, timeout=self._timeout)
+
+            succeeded = not self.is_unavailable_response(resp)
+            return resp
+        finally:
+            self._record_call(succeeded=succeeded, elapsed_seconds=time.monotonic() - started_at)
 
-    def post_mikro_api_up(self, mikro_api_up_json: dict) -> None:
+    @classmethod
+    def is_unavailable_response(cls, resp: requests.models.Response) -> bool:
+        return resp.status_code >= 500 or resp.status_code in cls._OVERLOAD_STATUS_CODES
+
+    @classmethod
+    def is_refused_status(cls, status_code: int) -> bool:
+        return status_code in cls._REFUSED_STATUS_CODES
+
+    @staticmethod
+    def is_connect_error(error: Exception) -> bool:
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+            return False
+        return isinstance(getattr(error.args[0], "reason", error.args[0]), ConnectTimeoutError)
+
+    def _record_call(self, succeeded: bool, elapsed_seconds: float) -> None:
+        if self._rate_limiter is not None:
+            self._rate_limiter.record(elapsed_seconds=elapsed_seconds, succeeded=succeeded)
+
+        if self._circuit_breaker is None:
+            return
+
+        if succeeded:
+            self._circuit_breaker.record_success()
+        else:
+            self._circuit_breaker.record_failure()
+
+    def post_mikro_api_up(self, mikro_api_up_json: bytes) -> requests.models.Response:
         url: str = self._endpoints.login_mikro
-        headers: dict = self._header
-        payload: dict = mikro_api_up_json
-        resp: requests.models.Response = requests.post(url=url, data=payload, headers=headers)
+        payload: bytes = mikro_api_up_json
+        resp: requests.models.Response = self._post(url=url, payload=payload, session=self._login_session)
 
         if resp.status_code != 200:
             self._logger.error(f"Statü Kodu: {resp.status_code} - Mikro'ya login olunamadı :/ -> {resp.text} - {resp.content}")
         else:
             self._logger.info(f"Statü Kodu: {resp.status_code} - Login işlemi başarılı !")
 
-    def post_siparis_kaydet(self, siparis_kaydet_json: dict) -> None:
+        return resp
+
+    def post_siparis_kaydet(self, siparis_kaydet_json: bytes) -> requests.models.Response:
         url: str = self._endpoints.siparis_kaydet_v2
-        headers: dict = self._header
-        payload: dict = siparis_kaydet_json
-        resp: requests.models.Response = requests.post(url=url, data=payload, headers=headers)
+        payload: bytes = siparis_kaydet_json
+        resp: requests.models.Response = self._post(url=url, payload=payload, session=self._session)
 
         if resp.status_code != 200:
             self._logger.error(f"Statü Kodu: {resp.status_code} - Sipariş oluşturulamadı :/ -> {resp.text} - {resp.content}")
         else:
             self._logger.info(f"Statü Kodu: {resp.status_code} - Sipariş oluşturuldu !")
+
+        return resp
+
+    def close(self) -> None:
+        self._session.close()
+        self._login_session.close()
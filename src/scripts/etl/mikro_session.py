@@ -0,0 +1,83 @@
+from datetime import datetime
+from threading import Lock
+from typing import Callable, Optional
+import requests
+
+from src.logger.custom_logger import SingletonLogger
+from src.scripts.etl.loader import Loader
+from src.scripts.generator.md5_hashed_password import MD5HashedPassword
+from src.scripts.generator.mikro_api_up_v2_json import MikroApiUp
+
+class MikroLoginError(Exception):
+    pass
+
+class MikroSessionManager:
+
+    _AUTH_FAILURE_STATUS_CODES: tuple[int, ...] = (401, 403)
+
+    def __init__(self, loader: Loader, login_generator: MikroApiUp, kullanici_kodu: str):
+        self._logger = SingletonLogger.get_logger()
+        self._loader: Loader = loader
+        self._login_mikro: MikroApiUp = login_generator
+        self._kullanici_kodu: str = kullanici_kodu
+        self._lock = Lock()
+
+        self._session_date: Optional[str] = None
+        self._md5_hash_pass: Optional[str] = None
+        self._refresh_listeners: list[Callable[[], None]] = []
+
+    def add_refresh_listener(self, listener: Callable[[], None]) -> None:
+        self._refresh_listeners.append(listener)
+
+    def ensure_session(self) -> str:
+        today: str = datetime.today().strftime("%Y-%m-%d")
+
+        with self._lock:
+            if self._md5_hash_pass is None or self._session_date != today:
+                self._login(today=today)
+
+            return self._md5_hash_pass
+
+    def _login(self, today: str) -> None:
+        md5_hash_pass: str = MD5HashedPassword(self._kullanici_kodu).get_hashed_password()
+
+        self._login_mikro.refresh_current_year()
+        mikro_api_up_json = self._login_mikro.prepare_login_json(md5_hash_pass=md5_hash_pass)
+        try:
+            resp: requests.models.Response = self._loader.post_mikro_api_up(mikro_api_up_json=mikro_api_up_json)
+        except requests.exceptions.RequestException as e:
+            raise MikroLoginError(f"Mikro'ya login olunamadı: {e}") from e
+
+        if resp.status_code != 200:
+            raise MikroLoginError(f"Mikro'ya login olunamadı, statü kodu: {resp.status_code}")
+
+        self._md5_hash_pass = md5_hash_pass
+        self._session_date = today
+
+        for listener in self._refresh_listeners:
+            listener()
+
+        self._logger.info(f"Mikro oturumu {today} tarihi için açıldı")
+
+    def invalidate(self, md5_hash_pass: Optional[str] = None) -> None:
+        with self._lock:
+            if md5_hash_pass is None or md5_hash_pass == self._md5_hash_pass:
+                self._md5_hash_pass = None
+                self._session_date = None
+
+    def is_auth_failure(self, resp: requests.models.Response) -> bool:
+        return resp.status_code in self._AUTH_FAILURE_STATUS_CODES
+
+    def post_siparis_kaydet(self, build_payload: Callable[[str], any]) -> requests.models.Response:
+        md5_hash_pass: str = self.ensure_session()
+        resp: requests.models.Response = self._loader.post_siparis_kaydet(
+            siparis_kaydet_json=build_payload(md5_hash_pass))
+
+        if self.is_auth_failure(resp):
+            self._logger.warning(f"Statü Kodu: {resp.status_code} - Mikro oturumu geçersiz, yeniden login olunuyor")
+            self.invalidate(md5_hash_pass=md5_hash_pass)
+
+            md5_hash_pass = self.ensure_session()
+            resp = self._loader.post_siparis_kaydet(siparis_kaydet_json=build_payload(md5_hash_pass))
+
+        return resp
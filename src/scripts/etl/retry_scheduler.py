@@ -0,0 +1,41 @@
+from typing import Callable, Optional
+import threading
+
+from src.logger.custom_logger import SingletonLogger
+
+class RetryScheduler:
+
+    def __init__(self, retry_callback: Callable[[], int], interval_seconds: float = 15, stop_event=None):
+        self._logger = SingletonLogger.get_logger()
+        self._retry_callback: Callable[[], int] = retry_callback
+        self._interval_seconds: float = interval_seconds
+        self._stop_event = stop_event if stop_event is not None else threading.Event()
+        self._halt_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._halt_event.clear()
+        self._thread = threading.Thread(target=self._run, name="mikro-retry", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._halt_event.wait(self._interval_seconds) and not self._stop_event.is_set():
+            try:
+                retried_order_count: int = self._retry_callback()
+            except Exception as e:
+                self._logger.error(f"Başarısız siparişler yeniden denenirken hata oluştu: {e}")
+                continue
+
+            if retried_order_count:
+                self._logger.info(f"{retried_order_count} başarısız sipariş yeniden denendi")
+
+    def stop(self) -> None:
+        self._halt_event.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
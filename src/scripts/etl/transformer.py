@@ -1,6 +1,14 @@
 from datetime import datetime
 
+from src.library.models.evrak_result import EvrakResult
+from src.library.models.order_line import OrderLine
 from src.logger.custom_logger import SingletonLogger
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 class Transformer():
 
     def __init__(self):
@@ -8,69 +16,83 @@ class Transformer():
 
     def prepare_final_order_items(self, order_items: list[dict[str, any]],
                                   latest_order_json: dict[str, any],
-                                  customer_code: str):
-        order_items_step_one: list[dict[str, any]] = (
-            self._delete_product_id_from_order_items(order_items=order_items))
-        order_items_step_two: list[dict[str, any]] = (
-            self._add_required_keys_to_order_items(latest_order_json=latest_order_json,
-                                                   order_items=order_items_step_one,
-                                                   customer_code=customer_code))
-        order_items_step_three: list[dict[str, any]] = (
-            self._transform_create_at_date_format(order_items=order_items_step_two))
-        order_items_step_four: list[dict[str, any]] = (
-            self._add_total_price_to_order_items(order_items=order_items_step_three))
-        final_order_items: list[dict[str, any]] = (
-            self._delete_order_id_from_order_items(order_items=order_items_step_four))
-
-        return final_order_items
-
-    @staticmethod
-    def _transform_create_at_date_format(order_items: list[dict[str, any]]) -> list[dict[str, any]]:
-        for order_item in order_items:
-            created_at: str = order_item["orderDate"]
-            dt = datetime.fromisoformat(created_at)
-            formatted_dt = dt.strftime("%d.%m.%Y")
-            order_item["orderDate"] = formatted_dt
-
-        return order_items
-
-    @staticmethod
-    def _delete_product_id_from_order_items(order_items: list[dict[str, any]]) -> list[dict[str, any]]:
-        for order_item in order_items:
-            order_item.pop("productId", None)
-
-        return order_items
+                                  customer_code: str) -> list[OrderLine]:
+        order_lines: list[OrderLine] = [OrderLine.from_order_item(order_item) for order_item in order_items]
+
+        return self._fill_order_lines(order_lines=order_lines,
+                                      order_code=latest_order_json["Code"],
+                                      order_date=self._format_order_date(latest_order_json["OrderDate"]),
+                                      customer_code=customer_code,
+                                      total_prices=self._multiply_columns(
+                                          quantities=[int(order_line.quantity) for order_line in order_lines],
+                                          prices=[float(order_line.price) for order_line in order_lines]))
+
+    def prepare_orders_final_items(self, orders: list[dict[str, any]], orders_lines: dict[any, dict[str, any]]
+                                   ) -> tuple[list[dict[str, any]], list[list[OrderLine]], list[EvrakResult]]:
+        transformed_orders: list[dict[str, any]] = []
+        orders_order_lines: list[list[OrderLine]] = []
+        order_dates: list[str] = []
+        rejected_results: list[EvrakResult] = []
+        quantities: list[int] = []
+        prices: list[float] = []
+        formatted_dates: dict[any, str] = {}
+
+        for order in orders:
+            order_lines: list[OrderLine] = (orders_lines.get(order["Id"]) or {}).get("order_items") or []
+
+            try:
+                order_quantities: list[int] = [int(order_line.quantity) for order_line in order_lines]
+                order_prices: list[float] = [float(order_line.price) for order_line in order_lines]
+
+                formatted_date: str = formatted_dates.get(order["OrderDate"])
+                if formatted_date is None:
+                    formatted_date = self._format_order_date(order["OrderDate"])
+                    formatted_dates[order["OrderDate"]] = formatted_date
+
+            except (TypeError, ValueError) as e:
+                self._logger.error(f"{order.get('Code')} kodlu sipariş dönüştürülemedi, gönderilmeyecek: {e}")
+                rejected_results.append(EvrakResult(order=order, success=False,
+                                                    message=f"Sipariş dönüştürülemedi: {e}", retryable=False))
+                continue
+
+            transformed_orders.append(order)
+            orders_order_lines.append(order_lines)
+            order_dates.append(formatted_date)
+            quantities.extend(order_quantities)
+            prices.extend(order_prices)
+
+        total_prices: list[float] = self._multiply_columns(quantities=quantities, prices=prices)
+        line_index: int = 0
+
+        for order, order_lines, order_date in zip(transformed_orders, orders_order_lines, order_dates):
+            self._fill_order_lines(order_lines=order_lines,
+                                   order_code=order["Code"],
+                                   order_date=order_date,
+                                   customer_code=(orders_lines.get(order["Id"]) or {}).get("customer_code"),
+                                   total_prices=total_prices[line_index:line_index + len(order_lines)])
+            line_index += len(order_lines)
+
+        self._logger.info(f"{len(transformed_orders)} sipariş için {line_index} satır tek geçişte dönüştürüldü")
+        return transformed_orders, orders_order_lines, rejected_results
 
     @staticmethod
-    def _add_required_keys_to_order_items(latest_order_json: dict[str, any],
-                                         order_items: list[dict[str, any]],
-                                         customer_code: str) -> list[dict[str, any]]:
-        latest_order_id = latest_order_json["Id"]
-        order_code = latest_order_json["Code"]
-        order_date = latest_order_json["OrderDate"]
-
+    def _fill_order_lines(order_lines: list[OrderLine], order_code: str, order_date: str,
+                          customer_code: str, total_prices: list[float]) -> list[OrderLine]:
+        for order_line, total_price in zip(order_lines, total_prices):
+            order_line.order_code = order_code
+            order_line.order_date = order_date
+            order_line.customer_code = customer_code
+            order_line.total_price = total_price
 
-        for item in order_items:
-            if item["orderId"] == latest_order_id:
-                item["orderCode"] = order_code
-                item["orderDate"] = order_date
-                item["customerCode"] = customer_code
-
-        return order_items
+        return order_lines
 
     @staticmethod
-    def _add_total_price_to_order_items(order_items: list[dict[str, any]]) -> list[dict[str, any]]:
-        for item in order_items:
-            quantity: int = int(item["quantity"])
-            price: float = float(item["price"])
-            total: float = float(quantity * price)
-            item["totalPrice"]: float = total
-
-        return order_items
+    def _format_order_date(order_date: str) -> str:
+        return datetime.fromisoformat(order_date).strftime("%d.%m.%Y")
 
     @staticmethod
-    def _delete_order_id_from_order_items(order_items: list[dict[str, any]] ) -> list[dict[str, any]]:
-        for item in order_items:
-            item.pop("orderId", None)
-
-        return order_items
+    def _multiply_columns(quantities: list[int], prices: list[float]) -> list[float]:
+        if numpy is not None and quantities:
+            return numpy.multiply(numpy.asarray(quantities, dtype=numpy.int64),
+                                  numpy.asarray(prices, dtype=numpy.float64)).tolist()
+        return [quantity * price for quantity, price in zip(quantities, prices)]
@@ -1,6 +1,6 @@
 from src.logger.custom_logger import SingletonLogger
+from src.scripts.utils.json_serializer import JSONSerializer
 from datetime import datetime
-import json
 
 class MikroApiUp:
 
@@ -11,8 +11,12 @@ class MikroApiUp:
         self._firma_kod: str = firma_kodu
         self._kullanici_kodu: str = kullanici_kodu
         self._current_year: str = datetime.today().strftime("%Y")
+        self._serializer = JSONSerializer()
 
-    def prepare_login_json(self, md5_hash_pass: str, indent: int = 2):
+    def refresh_current_year(self) -> None:
+        self._current_year: str = datetime.today().strftime("%Y")
+
+    def prepare_login_json(self, md5_hash_pass: str) -> bytes:
 
         json_structure= {
             "ApiKey": self._api_key,
@@ -25,4 +29,4 @@ class MikroApiUp:
         }
 
         self._logger.info(f"Mikro'ya login olmak için JSON hazırlandı")
-        return json.dumps(json_structure, ensure_ascii=False, indent=indent)
+        return self._serializer.dumps(json_structure)
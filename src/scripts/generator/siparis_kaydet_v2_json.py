@@ -1,63 +1,76 @@
+from src.library.models.order_line import OrderLine
 from src.logger.custom_logger import SingletonLogger
-from typing import List, Dict, Any
-import json
+from src.scripts.generator.siparis_kaydet_v2_schema import SiparisKaydetV2Validator
+from src.scripts.generator.siparis_kaydet_v2_template import SiparisKaydetV2Template
+from src.scripts.utils.json_serializer import JSONSerializer
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 class SiparisKaydetV2JSON:
 
-    def __init__(self, api_key: str = None, firma_kodu: str = None, kullanici_kodu: str = None, sifre: str = None):
+    def __init__(self, api_key: str = None, firma_kodu: str = None, kullanici_kodu: str = None, sifre: str = None,
+                 satir_defaults: Optional[Dict[str, Any]] = None):
         self._logger = SingletonLogger.get_logger()
 
         self._api_key: str = api_key
         self._firma_kod: str = firma_kodu
         self._kullanici_kodu: str = kullanici_kodu
         self._sifre: str = sifre
-        self._seriler_no : int = 0
+        self._serializer = JSONSerializer()
+        self._validator = SiparisKaydetV2Validator()
+        self._template = SiparisKaydetV2Template(satir_defaults=satir_defaults, serializer=self._serializer)
 
         self._current_year: str = datetime.today().strftime("%Y")
 
-    def prepare_final_siparis_kaydet_v2_json(self, final_order_items: list[dict[str, any]], md5_hash_pass: str) -> dict:
+    def refresh_current_year(self) -> None:
+        self._current_year: str = datetime.today().strftime("%Y")
+
+    def prepare_final_siparis_kaydet_v2_json(self, final_order_items: List[OrderLine], md5_hash_pass: str) -> bytes:
 
         mikro_json = self._generate_json(final_order_items=final_order_items,
                                          md5_hash_pass=md5_hash_pass)
 
-        if self._validate_json_structure(mikro_json):
-            mikro_json = self._generate_json_string(final_order_items=final_order_items,
-                                                    md5_hash_pass=md5_hash_pass)
-
-            self._logger.info(f"Mikro'ya sipariş kaydetmek için JSON oluşturuldu")
-        return mikro_json
-
-    def _create_satirlar_from_order_items(self, final_order_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-
-        satirlar = []
-
-        for order_item in final_order_items:
-            satir = {
-                "sip_tarih": order_item.get('orderDate', ''),
-                "seriler": f"ARTEK{self._seriler_no}",
-                "sip_birim_pntr": 0,
-                "sip_cins": 0,
-                "sip_evrakno_seri": order_item.get('orderCode', ''),
-                "sip_musteri_kod": order_item.get('customerCode', ''),
-                "sip_stok_kod": order_item.get('productCode', ''),
-                "sip_b_fiyat": float(order_item.get('price', 0)),
-                "sip_miktar": int(order_item.get('quantity', 0)),
-                "sip_tutar": float(order_item.get('totalPrice', 0)),
-                "sip_vergi_pntr": 0,
-                "sip_depono": 1,
-                "sip_vergisiz_fl": False,
-                "sip_stok_sormerk": "",
-                "user_tablo": [
-                    {
-                        "aciklama": ""
-                    }
-                ]
-            }
-            satirlar.append(satir)
+        self._validate_document(header=self._create_header(md5_hash_pass=md5_hash_pass),
+                                evraklar=mikro_json.get("Mikro", {}).get("evraklar", []))
+
+        self._logger.info(f"Mikro'ya sipariş kaydetmek için JSON oluşturuldu")
+        return self._serializer.dumps(mikro_json)
+
+    def serialize_evrak(self, evrak: Dict[str, Any]) -> bytes:
+        return self._template.serialize_evrak(evrak)
+
+    def validate_evraklar(self, evraklar: List[Dict[str, Any]]) -> Dict[int, List[str]]:
+        return self._validator.validate_evraklar(evraklar)
+
+    def _validate_document(self, header: Dict[str, Any], evraklar: List[Dict[str, Any]],
+                           validate_evraklar: bool = True) -> None:
+        errors: List[str] = self._validator.validate_header(header)
+
+        if not evraklar:
+            errors.append("evraklar: boş olamaz")
+        elif validate_evraklar:
+            errors.extend(f"{evrak_index + 1}. evrak {message}"
+                          for evrak_index, messages in self.validate_evraklar(evraklar).items()
+                          for message in messages)
+
+        if errors:
+            self._logger.error(f"Sipariş Kaydet V2 JSON'u Mikro şemasına uygun değil: {'; '.join(errors)}")
+            raise ValueError(f"Sipariş Kaydet V2 JSON yapısı Mikro validasyon kurallarına uygun değil: "
+                             f"{'; '.join(errors)}")
+
+    def _create_header(self, md5_hash_pass: str) -> Dict[str, Any]:
+        return {
+            "FirmaKodu": self._firma_kod,
+            "CalismaYili": self._current_year,
+            "KullaniciKodu": self._kullanici_kodu,
+            "Sifre": md5_hash_pass,
+            "ApiKey": self._api_key
+        }
+
+    def _create_satirlar_from_order_items(self, final_order_items: List[OrderLine]) -> List[Dict[str, Any]]:
 
-        self._seriler_no += 1
-        return satirlar
+        order_id = final_order_items[0].order_id if final_order_items else ''
+        return self._template.build_satirlar(order_lines=final_order_items, seriler=f"ARTEK{order_id}")
 
     @staticmethod
     def _create_evrak_aciklamalari(order_code: str = None) -> List[Dict[str, str]]:
@@ -67,23 +80,19 @@ class SiparisKaydetV2JSON:
             }
         ]
 
-    def _generate_json(self, final_order_items: List[Dict[str, Any]], md5_hash_pass: str) -> Dict[str, Any]:
+    def _generate_json(self, final_order_items: List[OrderLine], md5_hash_pass: str) -> Dict[str, Any]:
 
         if not final_order_items:
             self._logger.warning("Sipariş için JSON oluşturulurken herhangi bir sipariş saptanamadı")
             return {}
 
-        order_code = final_order_items[0].get('orderCode', '') if final_order_items else ''
+        order_code = final_order_items[0].order_code if final_order_items else ''
         satirlar = self._create_satirlar_from_order_items(final_order_items)
         evrak_aciklamalari = self._create_evrak_aciklamalari(order_code)
 
         json_structure = {
             "Mikro": {
-                "FirmaKodu": self._firma_kod,
-                "CalismaYili": self._current_year,
-                "KullaniciKodu": self._kullanici_kodu,
-                "Sifre": md5_hash_pass,
-                "ApiKey": self._api_key,
+                **self._create_header(md5_hash_pass=md5_hash_pass),
                 "evraklar": [
                     {
                         "evrak_aciklamalari": evrak_aciklamalari,
@@ -96,56 +105,36 @@ class SiparisKaydetV2JSON:
         self._logger.info(f"Sipariş kaydet için {len(satirlar)} kadar ürün içeren JSON hazırlanıyor...")
         return json_structure
 
-    def _generate_json_string(self, final_order_items: List[Dict[str, Any]], md5_hash_pass: str, indent: int = 2) -> str:
+    def create_evrak(self, final_order_items: List[OrderLine]) -> Dict[str, Any]:
 
-        json_dict = self._generate_json(final_order_items, md5_hash_pass)
-        self._logger.info(f"Sipariş kaydet JSON, Mikro API formatına göre düzenlendi ")
-        return json.dumps(json_dict, ensure_ascii=False, indent=indent)
+        order_code = final_order_items[0].order_code if final_order_items else ''
+
+        return {
+            "evrak_aciklamalari": self._create_evrak_aciklamalari(order_code),
+            "satirlar": self._create_satirlar_from_order_items(final_order_items)
+        }
 
     def add_additional_evrak(self, json_structure: Dict[str, Any],
-                             additional_order_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+                             additional_order_items: List[OrderLine]) -> Dict[str, Any]:
 
         if not additional_order_items:
             return json_structure
 
-        order_code = additional_order_items[0].get('orderCode', '') if additional_order_items else ''
-        new_satirlar = self._create_satirlar_from_order_items(additional_order_items)
-        new_evrak_aciklamalari = self._create_evrak_aciklamalari(order_code)
-
-        new_evrak = {
-            "evrak_aciklamalari": new_evrak_aciklamalari,
-            "satirlar": new_satirlar
-        }
-
+        new_evrak = self.create_evrak(additional_order_items)
         json_structure["Mikro"]["evraklar"].append(new_evrak)
 
-        self._logger.info(f"Yeni evrak, {len(new_satirlar)} kadar ürün için hazırlandı")
+        self._logger.info(f"Yeni evrak, {len(new_evrak['satirlar'])} kadar ürün için hazırlandı")
         return json_structure
 
-    def _validate_json_structure(self, json_structure: Dict[str, Any]) -> bool:
-
-        try:
-            mikro = json_structure.get("Mikro", {})
-            required_fields = ["FirmaKodu", "CalismaYili", "KullaniciKodu", "Sifre", "ApiKey", "evraklar"]
-
-            for field in required_fields:
-                if field not in mikro:
-                    self._logger.error(f"Sipariş Kaydet V2 için eksik kısımlar: {field}")
-                    return False
-
-            evraklar = mikro.get("evraklar", [])
-            if not isinstance(evraklar, list) or len(evraklar) == 0:
-                self._logger.error("Sipariş Kaydet V2 için 'Evraklar' kısmı boş olamaz")
-                return False
+    def prepare_batch_siparis_kaydet_v2_json(self, evraklar: List[Dict[str, Any]], md5_hash_pass: str,
+                                             evrak_payloads: Optional[List[bytes]] = None,
+                                             validate_evraklar: bool = True) -> bytes:
 
-            for i, evrak in enumerate(evraklar):
-                if "satirlar" not in evrak or "evrak_aciklamalari" not in evrak:
-                    self._logger.error(f"Sipariş Kaydet V2 'Evraklar' için {i}.  satırdan eksik alanlar testpit edildi")
-                    return False
+        header = self._create_header(md5_hash_pass=md5_hash_pass)
+        self._validate_document(header=header, evraklar=evraklar, validate_evraklar=validate_evraklar)
 
-            self._logger.info("JSON yapısı Mikro validasyon kurallarına uygun !")
-            return True
+        if evrak_payloads is None:
+            evrak_payloads = [self.serialize_evrak(evrak) for evrak in evraklar]
 
-        except Exception as e:
-            self._logger.error(f"JSON validasyonu hatası: {str(e)}")
-            return False
\ No newline at end of file
+        self._logger.info(f"Mikro'ya {len(evraklar)} evrak içeren toplu sipariş JSON'u oluşturuldu")
+        return self._template.build_document(header=header, evrak_payloads=evrak_payloads)
@@ -0,0 +1,90 @@
+from typing import Annotated, Any, Dict, List
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+NonNegativeFloat = Annotated[float, Field(ge=0, allow_inf_nan=False)]
+
+class UserTablo(BaseModel):
+
+    model_config = ConfigDict(strict=True)
+
+    aciklama: str
+
+class Satir(BaseModel):
+
+    model_config = ConfigDict(strict=True)
+
+    sip_tarih: Annotated[str, Field(pattern=r"^\d{2}\.\d{2}\.\d{4}$")]
+    seriler: NonEmptyStr
+    sip_birim_pntr: int
+    sip_cins: int
+    sip_evrakno_seri: NonEmptyStr
+    sip_musteri_kod: NonEmptyStr
+    sip_stok_kod: NonEmptyStr
+    sip_b_fiyat: NonNegativeFloat
+    sip_miktar: Annotated[int, Field(gt=0)]
+    sip_tutar: NonNegativeFloat
+    sip_vergi_pntr: int
+    sip_depono: int
+    sip_vergisiz_fl: bool
+    sip_stok_sormerk: str
+    user_tablo: List[UserTablo]
+
+class EvrakAciklamasi(BaseModel):
+
+    model_config = ConfigDict(strict=True)
+
+    aciklama: str
+
+class Evrak(BaseModel):
+
+    model_config = ConfigDict(strict=True)
+
+    evrak_aciklamalari: List[EvrakAciklamasi]
+    satirlar: Annotated[List[Satir], Field(min_length=1)]
+
+class MikroHeader(BaseModel):
+
+    model_config = ConfigDict(strict=True)
+
+    FirmaKodu: NonEmptyStr
+    CalismaYili: Annotated[str, Field(pattern=r"^\d{4}$")]
+    KullaniciKodu: NonEmptyStr
+    Sifre: NonEmptyStr
+    ApiKey: NonEmptyStr
+
+class SiparisKaydetV2Validator:
+
+    _EVRAKLAR_ADAPTER: TypeAdapter = TypeAdapter(List[Evrak])
+    _HEADER_ADAPTER: TypeAdapter = TypeAdapter(MikroHeader)
+
+    def validate_evraklar(self, evraklar: List[Dict[str, Any]]) -> Dict[int, List[str]]:
+        try:
+            self._EVRAKLAR_ADAPTER.validate_python(evraklar)
+        except ValidationError as e:
+            evrak_errors: Dict[int, List[str]] = {}
+
+            for error in e.errors(include_url=False):
+                location: list = list(error["loc"])
+                evrak_index: int = location.pop(0) if location else 0
+                evrak_errors.setdefault(evrak_index, []).append(self._format_error(location=location, error=error))
+
+            return evrak_errors
+
+        return {}
+
+    def validate_header(self, header: Dict[str, Any]) -> List[str]:
+        try:
+            self._HEADER_ADAPTER.validate_python(header)
+        except ValidationError as e:
+            return [self._format_error(location=list(error["loc"]), error=error)
+                    for error in e.errors(include_url=False)]
+
+        return []
+
+    @staticmethod
+    def _format_error(location: list, error: dict) -> str:
+        if len(location) >= 3 and location[0] == "satirlar":
+            return f"{location[1] + 1}. satır {'.'.join(str(part) for part in location[2:])}: {error['msg']}"
+        return f"{'.'.join(str(part) for part in location) or 'evrak'}: {error['msg']}"
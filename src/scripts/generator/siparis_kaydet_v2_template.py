@@ -0,0 +1,65 @@
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from src.library.models.order_line import OrderLine
+from src.scripts.utils.json_serializer import JSONSerializer
+
+class SiparisKaydetV2Template:
+
+    _DEFAULT_SATIR_CONSTANTS: Dict[str, Any] = {
+        "sip_birim_pntr": 0,
+        "sip_cins": 0,
+        "sip_vergi_pntr": 0,
+        "sip_depono": 1,
+        "sip_vergisiz_fl": False,
+        "sip_stok_sormerk": ""
+    }
+
+    def __init__(self, satir_defaults: Optional[Dict[str, Any]] = None, serializer: Optional[JSONSerializer] = None):
+        self._serializer: JSONSerializer = serializer or JSONSerializer()
+        self._lock = Lock()
+
+        self._satir_constants: Dict[str, Any] = {
+            **self._DEFAULT_SATIR_CONSTANTS,
+            **{key: value for key, value in (satir_defaults or {}).items() if value is not None},
+            "user_tablo": [{"aciklama": ""}]
+        }
+
+        self._header_key: Optional[tuple] = None
+        self._header_prefix: bytes = b""
+
+    def build_satirlar(self, order_lines: List[OrderLine], seriler: str) -> List[Dict[str, Any]]:
+        satir_constants: Dict[str, Any] = self._satir_constants
+
+        return [
+            {
+                "sip_tarih": order_line.order_date,
+                "seriler": seriler,
+                "sip_evrakno_seri": order_line.order_code,
+                "sip_musteri_kod": order_line.customer_code,
+                "sip_stok_kod": order_line.product_code or '',
+                "sip_b_fiyat": float(order_line.price or 0),
+                "sip_miktar": int(order_line.quantity or 0),
+                "sip_tutar": float(order_line.total_price),
+                **satir_constants
+            }
+            for order_line in order_lines
+        ]
+
+    def serialize_evrak(self, evrak: Dict[str, Any]) -> bytes:
+        return self._serializer.dumps(evrak)
+
+    def _get_header_prefix(self, header: Dict[str, Any]) -> bytes:
+        header_key: tuple = tuple(header.items())
+
+        with self._lock:
+            if self._header_key != header_key:
+                self._header_prefix = self._serializer.object_array_prefix(obj=header, array_key="evraklar",
+                                                                           wrapper_key="Mikro")
+                self._header_key = header_key
+
+            return self._header_prefix
+
+    def build_document(self, header: Dict[str, Any], evrak_payloads: List[bytes]) -> bytes:
+        return self._serializer.write_array(prefix=self._get_header_prefix(header=header),
+                                            array_items=evrak_payloads, suffix=b"]}}")
@@ -0,0 +1,19 @@
+class AdaptivePoller:
+
+    def __init__(self, min_interval: float = 1.0, max_interval: float = 120.0, backoff_factor: float = 2.0):
+        self._min_interval: float = min_interval
+        self._max_interval: float = max(max_interval, min_interval)
+        self._backoff_factor: float = max(backoff_factor, 1.0)
+        self._current_interval: float = min_interval
+
+    def next_interval(self, processed_order_count: int) -> float:
+        if processed_order_count > 0:
+            self.reset()
+            return 0.0
+
+        interval: float = self._current_interval
+        self._current_interval = min(self._current_interval * self._backoff_factor, self._max_interval)
+        return interval
+
+    def reset(self) -> None:
+        self._current_interval = self._min_interval
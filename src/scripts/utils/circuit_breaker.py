@@ -0,0 +1,70 @@
+from threading import Lock
+import time
+
+from src.logger.custom_logger import SingletonLogger
+
+class CircuitOpenError(Exception):
+    pass
+
+class CircuitBreaker:
+
+    STATE_CLOSED: str = "closed"
+    STATE_OPEN: str = "open"
+    STATE_HALF_OPEN: str = "half_open"
+
+    def __init__(self, name: str = "Mikro", failure_threshold: int = 5, recovery_seconds: float = 30,
+                 half_open_max_calls: int = 1):
+        self._logger = SingletonLogger.get_logger()
+        self._name: str = name
+        self._failure_threshold: int = max(failure_threshold, 1)
+        self._recovery_seconds: float = recovery_seconds
+        self._half_open_max_calls: int = max(half_open_max_calls, 1)
+        self._lock = Lock()
+
+        self._state: str = self.STATE_CLOSED
+        self._failure_count: int = 0
+        self._opened_at: float = 0
+        self._half_open_calls: int = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._state == self.STATE_OPEN:
+                remaining_seconds: float = self._opened_at + self._recovery_seconds - time.monotonic()
+
+                if remaining_seconds > 0:
+                    raise CircuitOpenError(f"{self._name} devre kesicisi açık, {remaining_seconds:.0f} sn sonra "
+                                           f"yeniden denenecek")
+
+                self._state = self.STATE_HALF_OPEN
+                self._half_open_calls = 0
+                self._logger.info(f"{self._name} devre kesicisi yarı açık, deneme isteği gönderiliyor")
+
+            if self._state == self.STATE_HALF_OPEN:
+                if self._half_open_calls >= self._half_open_max_calls:
+                    raise CircuitOpenError(f"{self._name} devre kesicisi yarı açık, deneme isteğinin sonucu bekleniyor")
+                self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == self.STATE_HALF_OPEN:
+                self._logger.info(f"{self._name} yeniden yanıt veriyor, devre kesicisi kapatıldı")
+
+            self._state = self.STATE_CLOSED
+            self._failure_count = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failure_count += 1
+
+            if self._state == self.STATE_HALF_OPEN or self._failure_count >= self._failure_threshold:
+                if self._state != self.STATE_OPEN:
+                    self._logger.error(f"{self._name} art arda {self._failure_count} kez hata verdi, devre kesicisi "
+                                       f"{self._recovery_seconds:.0f} sn için açıldı")
+
+                self._state = self.STATE_OPEN
+                self._opened_at = time.monotonic()
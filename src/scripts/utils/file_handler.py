@@ -1,3 +1,7 @@
+from typing import Optional
+import os
+
+from src.library.models.order_watermark import OrderWatermark
 from src.logger.custom_logger import SingletonLogger
 
 class FileHandler:
@@ -5,6 +9,8 @@ class FileHandler:
     def __init__(self):
 
         self._latest_order_file_name = "docs/latest_order_code.txt"
+        self._watermark_file_name = "docs/order_watermark.txt"
+        self._watermark_prefix = "En son senkronize edilen sipariş:"
         self._logger = SingletonLogger.get_logger()
 
     def get_last_order_code_from_txt(self) -> str:
@@ -24,4 +30,21 @@ class FileHandler:
         with open(file=self._latest_order_file_name, mode="w", encoding="utf-8") as f:
             f.write(f"En son oluşturulan sipariş kodu:{last_order_code}")
 
-        self._logger.info(f"En son işlem gören sipariş kodu yeniden .txt dosyasında güncellendi.")
\ No newline at end of file
+        self._logger.info(f"En son işlem gören sipariş kodu yeniden .txt dosyasında güncellendi.")
+
+    def get_watermark_from_txt(self) -> Optional[OrderWatermark]:
+
+        if not os.path.exists(self._watermark_file_name):
+            return None
+
+        with open(file=self._watermark_file_name, mode="r", encoding="utf-8") as f:
+            line: str = f.readline().strip()
+
+        if not line.startswith(self._watermark_prefix):
+            return None
+
+        created_at, _, order_id = line[len(self._watermark_prefix):].partition("|")
+        if not created_at or not order_id:
+            return None
+
+        return OrderWatermark(created_at=created_at, order_id=order_id)
@@ -0,0 +1,63 @@
+from typing import Callable, Iterable, Optional
+import json
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class JSONSerializer:
+
+    _STDLIB_ENCODER: json.JSONEncoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"),
+                                                         check_circular=False)
+
+    def __init__(self, encoder: Optional[Callable[[any], bytes]] = None):
+        self._local = threading.local()
+
+        if encoder is not None:
+            self._encoder: Callable[[any], bytes] = encoder
+            self.backend: str = getattr(encoder, "__name__", "custom")
+        elif orjson is not None:
+            self._encoder = orjson.dumps
+            self.backend = "orjson"
+        else:
+            self._encoder = self._stdlib_dumps
+            self.backend = "json"
+
+    @classmethod
+    def _stdlib_dumps(cls, obj: any) -> bytes:
+        return cls._STDLIB_ENCODER.encode(obj).encode("utf-8")
+
+    def dumps(self, obj: any) -> bytes:
+        return self._encoder(obj)
+
+    def _get_buffer(self) -> bytearray:
+        buffer: Optional[bytearray] = getattr(self._local, "buffer", None)
+
+        if buffer is None:
+            buffer = bytearray()
+            self._local.buffer = buffer
+
+        del buffer[:]
+        return buffer
+
+    def object_array_prefix(self, obj: dict[str, any], array_key: str, wrapper_key: Optional[str] = None) -> bytes:
+        object_payload: bytes = self._encoder(obj)
+        prefix: bytes = object_payload[:-1] + (b"," if obj else b"") + self._encoder(array_key) + b":["
+
+        if wrapper_key is not None:
+            prefix = b"{" + self._encoder(wrapper_key) + b":" + prefix
+        return prefix
+
+    def write_array(self, prefix: bytes, array_items: Iterable[bytes], suffix: bytes) -> bytes:
+        buffer: bytearray = self._get_buffer()
+        buffer += prefix
+
+        for index, array_item in enumerate(array_items):
+            if index:
+                buffer += b","
+            buffer += array_item
+
+        buffer += suffix
+        return bytes(buffer)
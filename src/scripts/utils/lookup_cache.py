@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional
+import time
+
+from src.logger.custom_logger import SingletonLogger
+
+class LookupCache:
+
+    def __init__(self, name: str, max_size: int = 10000, ttl_seconds: float = 3600):
+        self._logger = SingletonLogger.get_logger()
+        self._name: str = name
+        self._max_size: int = max_size
+        self._ttl_seconds: float = ttl_seconds
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.high_water_mark: Optional[str] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._put(key, value)
+
+    def put_many(self, entries: dict) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            for key, value in entries.items():
+                self._put(key, value)
+
+    def _put(self, key: Hashable, value: Any) -> None:
+        expires_at: Optional[float] = time.monotonic() + self._ttl_seconds if self._ttl_seconds > 0 else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self.high_water_mark = None
+                self._logger.info(f"{self._name} önbelleği temizlendi")
+            else:
+                self._entries.pop(key, None)
+
+    def get_stats(self) -> dict[str, any]:
+        with self._lock:
+            total: int = self.hits + self.misses
+            return {
+                "name": self._name,
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "high_water_mark": self.high_water_mark
+            }
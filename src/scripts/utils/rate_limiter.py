@@ -0,0 +1,74 @@
+from threading import Lock
+import time
+
+from src.logger.custom_logger import SingletonLogger
+
+class AdaptiveRateLimiter:
+
+    def __init__(self, rate_per_second: float = 5, min_rate_per_second: float = 0.5,
+                 max_rate_per_second: float = 20, burst: int = 5, target_latency_seconds: float = 5,
+                 max_error_rate: float = 0.2, increase_step: float = 0.5, decrease_ratio: float = 0.5,
+                 smoothing: float = 0.2):
+        self._logger = SingletonLogger.get_logger()
+        self._min_rate: float = max(min_rate_per_second, 0.01)
+        self._max_rate: float = max(max_rate_per_second, self._min_rate)
+        self._burst: float = float(max(burst, 1))
+        self._target_latency_seconds: float = target_latency_seconds
+        self._max_error_rate: float = max_error_rate
+        self._increase_step: float = increase_step
+        self._decrease_ratio: float = decrease_ratio
+        self._smoothing: float = smoothing
+        self._lock = Lock()
+
+        self._rate: float = min(max(rate_per_second, self._min_rate), self._max_rate)
+        self._tokens: float = self._burst
+        self._refilled_at: float = time.monotonic()
+        self._latency_seconds: float = 0
+        self._error_rate: float = 0
+
+    @property
+    def rate(self) -> float:
+        with self._lock:
+            return self._rate
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._burst, self._tokens + (now - self._refilled_at) * self._rate)
+        self._refilled_at = now
+
+    def acquire(self) -> float:
+        waited_seconds: float = 0
+
+        while True:
+            with self._lock:
+                self._refill(now=time.monotonic())
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited_seconds
+
+                wait_seconds: float = (1 - self._tokens) / self._rate
+
+            time.sleep(wait_seconds)
+            waited_seconds += wait_seconds
+
+    def record(self, elapsed_seconds: float, succeeded: bool) -> None:
+        with self._lock:
+            self._latency_seconds += self._smoothing * (elapsed_seconds - self._latency_seconds)
+            self._error_rate += self._smoothing * ((0.0 if succeeded else 1.0) - self._error_rate)
+
+            overloaded: bool = self._error_rate > self._max_error_rate \
+                or self._latency_seconds > self._target_latency_seconds
+
+            if overloaded and (not succeeded or elapsed_seconds > self._target_latency_seconds):
+                new_rate: float = max(self._min_rate, self._rate * self._decrease_ratio)
+
+                if new_rate != self._rate:
+                    self._logger.warning(f"Mikro yanıt süresi {self._latency_seconds:.2f} sn, hata oranı "
+                                         f"{self._error_rate:.0%}; istek hızı {self._rate:.2f} -> "
+                                         f"{new_rate:.2f} istek/sn düşürüldü")
+            elif not overloaded and succeeded:
+                new_rate = min(self._max_rate, self._rate + self._increase_step)
+            else:
+                new_rate = self._rate
+
+            self._rate = new_rate
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+import random
+
+@dataclass(frozen=True)
+class RetryPolicy:
+
+    base_delay_seconds: float = 30
+    max_delay_seconds: float = 3600
+    max_attempts: int = 8
+    jitter_ratio: float = 0.2
+
+    def next_delay(self, attempt_count: int) -> float:
+        delay: float = min(self.base_delay_seconds * 2 ** min(max(attempt_count - 1, 0), 32), self.max_delay_seconds)
+        return max(delay * (1 + random.uniform(-self.jitter_ratio, self.jitter_ratio)), 0)
+
+    def should_retry(self, attempt_count: int) -> bool:
+        return attempt_count < self.max_attempts
@@ -0,0 +1,376 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Iterator, Optional
+import os
+import sqlite3
+
+from src.library.models.order_partition import OrderPartition
+from src.library.models.order_watermark import OrderWatermark
+from src.logger.custom_logger import SingletonLogger
+from src.scripts.utils.retry_policy import RetryPolicy
+
+class SyncStateStore:
+
+    STATUS_PENDING: str = "pending"
+    STATUS_SENT: str = "sent"
+    STATUS_FAILED: str = "failed"
+    STATUS_DEAD_LETTER: str = "dead_letter"
+
+    _SCHEMA: tuple[str, ...] = (
+        """
+        CREATE TABLE IF NOT EXISTS order_sync_state (
+            order_id TEXT PRIMARY KEY,
+            order_code TEXT,
+            created_at TEXT,
+            status TEXT NOT NULL,
+            attempt_count INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            mikro_response TEXT,
+            claimed_by TEXT,
+            claimed_at TEXT,
+            next_attempt_at TEXT,
+            updated_at TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_order_sync_state_status ON order_sync_state (status)",
+        "CREATE INDEX IF NOT EXISTS idx_order_sync_state_order_code ON order_sync_state (order_code)",
+        "CREATE INDEX IF NOT EXISTS idx_order_sync_state_retry ON order_sync_state (status, next_attempt_at)",
+        """
+        CREATE TABLE IF NOT EXISTS sync_watermark (
+            name TEXT PRIMARY KEY,
+            created_at TEXT NOT NULL,
+            order_id TEXT NOT NULL,
+            order_code TEXT,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+
+    _MIGRATED_COLUMNS: dict[str, str] = {
+        "claimed_by": "TEXT",
+        "claimed_at": "TEXT",
+        "next_attempt_at": "TEXT"
+    }
+
+    _SCHEMA_VERSION: int = 1
+    _UTC_TIMESTAMP_COLUMNS: dict[str, tuple[str, ...]] = {
+        "order_sync_state": ("claimed_at", "next_attempt_at", "updated_at"),
+        "sync_watermark": ("updated_at",)
+    }
+
+    def __init__(self, path: str = "docs/sync_state.db", claim_lease_seconds: float = 600,
+                 retry_policy: Optional[RetryPolicy] = None):
+        self._logger = SingletonLogger.get_logger()
+        self._path: str = path
+        self._lock = Lock()
+        self._claim_lease_seconds: float = claim_lease_seconds
+        self._retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self._connection.create_function("order_partition", 2,
+                                         lambda order_id, count: OrderPartition.index_of(order_id=order_id,
+                                                                                         count=count),
+                                         deterministic=True)
+
+        with self._transaction() as cursor:
+            self._migrate(cursor=cursor)
+            for statement in self._SCHEMA:
+                cursor.execute(statement)
+            self._migrate_timestamps_to_utc(cursor=cursor)
+
+    def _migrate(self, cursor: sqlite3.Cursor) -> None:
+        existing_columns: set[str] = {row[1] for row in cursor.execute("PRAGMA table_info(order_sync_state)")}
+        if not existing_columns:
+            return
+
+        for column, column_type in self._MIGRATED_COLUMNS.items():
+            if column not in existing_columns:
+                cursor.execute(f"ALTER TABLE order_sync_state ADD COLUMN {column} {column_type}")
+
+    def _migrate_timestamps_to_utc(self, cursor: sqlite3.Cursor) -> None:
+        if cursor.execute("PRAGMA user_version").fetchone()[0] >= self._SCHEMA_VERSION:
+            return
+
+        for table, columns in self._UTC_TIMESTAMP_COLUMNS.items():
+            for column in columns:
+                cursor.execute(f"UPDATE {table} SET {column} = strftime('%Y-%m-%dT%H:%M:%f000+00:00', {column}, 'utc') "
+                               f"WHERE {column} IS NOT NULL AND {column} NOT LIKE '%+00:00'")
+
+        cursor.execute(f"PRAGMA user_version = {self._SCHEMA_VERSION}")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        with self._lock:
+            cursor: sqlite3.Cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+
+            try:
+                yield cursor
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            else:
+                cursor.execute("COMMIT")
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _utc_now() -> datetime:
+        return datetime.now(timezone.utc)
+
+    @staticmethod
+    def _format_timestamp(timestamp: datetime) -> str:
+        return timestamp.isoformat(timespec="microseconds")
+
+    def _now(self) -> str:
+        return self._format_timestamp(self._utc_now())
+
+    def _lease_expired_before(self) -> str:
+        return self._format_timestamp(self._utc_now() - timedelta(seconds=self._claim_lease_seconds))
+
+    def get_watermark(self, name: str = "orders") -> Optional[OrderWatermark]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT created_at, order_id FROM sync_watermark WHERE name = ?", (name,)).fetchone()
+
+        if row is None:
+            return None
+        return OrderWatermark(created_at=row[0], order_id=row[1])
+
+    def get_earliest_watermark(self, prefix: str = "orders") -> Optional[OrderWatermark]:
+        with self._lock:
+            row = self._connection.execute(
+                """
+                SELECT created_at, order_id FROM sync_watermark
+                WHERE name = ? OR substr(name, 1, ?) = ?
+                ORDER BY created_at, order_id
+                LIMIT 1
+                """,
+                (prefix, len(prefix) + 1, f"{prefix}_")).fetchone()
+
+        if row is None:
+            return None
+        return OrderWatermark(created_at=row[0], order_id=row[1])
+
+    def set_watermark(self, watermark: OrderWatermark, order_code: str = None, name: str = "orders") -> None:
+        with self._transaction() as cursor:
+            self._set_watermark(cursor=cursor, watermark=watermark, order_code=order_code, name=name)
+
+    def _set_watermark(self, cursor, watermark: OrderWatermark, order_code: Optional[str], name: str) -> None:
+        cursor.execute(
+            """
+            INSERT INTO sync_watermark (name, created_at, order_id, order_code, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET
+                created_at = excluded.created_at,
+                order_id = excluded.order_id,
+                order_code = excluded.order_code,
+                updated_at = excluded.updated_at
+            """,
+            (name, str(watermark.created_at), str(watermark.order_id), order_code, self._now())
+        )
+
+    def get_last_order_code(self, name: str = "orders") -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT order_code FROM sync_watermark WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def claim_orders(self, orders: list[dict[str, any]], worker_id: str) -> list[dict[str, any]]:
+        if not orders:
+            return []
+
+        now: str = self._now()
+        lease_expired_before: str = self._lease_expired_before()
+        order_ids: list[str] = [str(order.get("Id")) for order in orders]
+        claimed_order_ids: set[str] = set()
+
+        with self._transaction() as cursor:
+            cursor.executemany(
+                """
+                INSERT INTO order_sync_state (order_id, order_code, created_at, status, claimed_by, claimed_at,
+                                              updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (order_id) DO UPDATE SET
+                    claimed_by = excluded.claimed_by,
+                    claimed_at = excluded.claimed_at,
+                    updated_at = excluded.updated_at
+                WHERE order_sync_state.status NOT IN (?, ?)
+                  AND (order_sync_state.status != ? OR order_sync_state.next_attempt_at IS NULL
+                       OR order_sync_state.next_attempt_at <= ?)
+                  AND (order_sync_state.claimed_by IS NULL
+                       OR order_sync_state.claimed_by = excluded.claimed_by
+                       OR order_sync_state.claimed_at < ?)
+                """,
+                [(str(order.get("Id")), order.get("Code"), str(order.get("CreatedAt")), self.STATUS_PENDING,
+                  worker_id, now, now, self.STATUS_SENT, self.STATUS_DEAD_LETTER, self.STATUS_FAILED, now,
+                  lease_expired_before)
+                 for order in orders]
+            )
+
+            for start in range(0, len(order_ids), 500):
+                chunk: list[str] = order_ids[start:start + 500]
+                placeholders: str = ", ".join("?" for _ in chunk)
+                rows = cursor.execute(
+                    f"SELECT order_id FROM order_sync_state "
+                    f"WHERE claimed_by = ? AND status NOT IN (?, ?) "
+                    f"AND (status != ? OR next_attempt_at IS NULL OR next_attempt_at <= ?) "
+                    f"AND order_id IN ({placeholders})",
+                    (worker_id, self.STATUS_SENT, self.STATUS_DEAD_LETTER, self.STATUS_FAILED, now,
+                     *chunk)).fetchall()
+                claimed_order_ids.update(row[0] for row in rows)
+
+        return [order for order in orders if str(order.get("Id")) in claimed_order_ids]
+
+    def release_claims(self, orders: list[dict[str, any]], worker_id: str) -> None:
+        with self._transaction() as cursor:
+            cursor.executemany(
+                """
+                UPDATE order_sync_state SET claimed_by = NULL, claimed_at = NULL
+                WHERE order_id = ? AND claimed_by = ?
+                """,
+                [(str(order.get("Id")), worker_id) for order in orders]
+            )
+
+    def record_results(self, results: list[tuple[dict[str, any], bool, str, str]],
+                       watermark: Optional[OrderWatermark] = None, order_code: str = None,
+                       name: str = "orders", retryable: bool = True) -> None:
+        now_datetime: datetime = self._utc_now()
+        now: str = self._format_timestamp(now_datetime)
+        dead_lettered_order_codes: list[str] = []
+
+        with self._transaction() as cursor:
+            attempt_counts: dict[str, int] = self._get_attempt_counts(
+                cursor=cursor, order_ids=[str(order.get("Id")) for order, success, _, _ in results if not success])
+            rows: list[tuple] = []
+
+            for order, success, error, response in results:
+                order_id: str = str(order.get("Id"))
+                attempt_count: int = attempt_counts.get(order_id, 0) + 1
+                next_attempt_at: Optional[str] = None
+
+                if success:
+                    status: str = self.STATUS_SENT
+                elif retryable and self._retry_policy.should_retry(attempt_count=attempt_count):
+                    status = self.STATUS_FAILED
+                    next_attempt_at = self._format_timestamp(now_datetime + timedelta(
+                        seconds=self._retry_policy.next_delay(attempt_count=attempt_count)))
+                else:
+                    status = self.STATUS_DEAD_LETTER
+                    dead_lettered_order_codes.append(order.get("Code") or order_id)
+
+                rows.append((order_id, order.get("Code"), str(order.get("CreatedAt")), status, attempt_count,
+                             None if success else error, response, next_attempt_at, now))
+
+            cursor.executemany(
+                """
+                INSERT INTO order_sync_state (order_id, order_code, created_at, status, attempt_count,
+                                              last_error, mikro_response, next_attempt_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (order_id) DO UPDATE SET
+                    status = excluded.status,
+                    attempt_count = excluded.attempt_count,
+                    last_error = excluded.last_error,
+                    mikro_response = excluded.mikro_response,
+                    next_attempt_at = excluded.next_attempt_at,
+                    claimed_by = NULL,
+                    claimed_at = NULL,
+                    updated_at = excluded.updated_at
+                """,
+                rows
+            )
+
+            if watermark is not None:
+                self._set_watermark(cursor=cursor, watermark=watermark, order_code=order_code, name=name)
+
+        if dead_lettered_order_codes:
+            self._logger.error(f"{len(dead_lettered_order_codes)} sipariş yeniden denenmeyecek, hatalı siparişler "
+                               f"kuyruğuna alındı: {', '.join(str(code) for code in dead_lettered_order_codes)}")
+
+    @staticmethod
+    def _get_attempt_counts(cursor: sqlite3.Cursor, order_ids: list[str]) -> dict[str, int]:
+        attempt_counts: dict[str, int] = {}
+
+        for start in range(0, len(order_ids), 500):
+            chunk: list[str] = order_ids[start:start + 500]
+            placeholders: str = ", ".join("?" for _ in chunk)
+            rows = cursor.execute(
+                f"SELECT order_id, attempt_count FROM order_sync_state WHERE order_id IN ({placeholders})",
+                chunk).fetchall()
+            attempt_counts.update({order_id: attempt_count for order_id, attempt_count in rows})
+
+        return attempt_counts
+
+    def get_due_retry_order_ids(self, limit: int = 500, partition: Optional[OrderPartition] = None) -> list[str]:
+        now: str = self._now()
+        lease_expired_before: str = self._lease_expired_before()
+        partition_clause: str = ""
+        params: list = [self.STATUS_FAILED, now, lease_expired_before, self.STATUS_PENDING, lease_expired_before]
+
+        if partition is not None and partition.enabled:
+            partition_clause = "AND order_partition(order_id, ?) = ?"
+            params.extend((partition.count, partition.index))
+
+        with self._lock:
+            rows = self._connection.execute(
+                f"""
+                SELECT order_id FROM order_sync_state
+                WHERE ((status = ?
+                        AND (next_attempt_at IS NULL OR next_attempt_at <= ?)
+                        AND (claimed_by IS NULL OR claimed_at < ?))
+                       OR (status = ? AND claimed_by IS NOT NULL AND claimed_at < ?))
+                  {partition_clause}
+                ORDER BY next_attempt_at, created_at
+                LIMIT ?
+                """,
+                (*params, limit)).fetchall()
+
+        return [row[0] for row in rows]
+
+    def get_dead_letters(self, limit: int = 100) -> list[dict[str, any]]:
+        with self._lock:
+            rows = self._connection.execute(
+                """
+                SELECT order_id, order_code, attempt_count, last_error, updated_at FROM order_sync_state
+                WHERE status = ?
+                ORDER BY updated_at DESC
+                LIMIT ?
+                """,
+                (self.STATUS_DEAD_LETTER, limit)).fetchall()
+
+        return [{"order_id": order_id, "order_code": order_code, "attempt_count": attempt_count,
+                 "last_error": last_error, "updated_at": updated_at}
+                for order_id, order_code, attempt_count, last_error, updated_at in rows]
+
+    def requeue_dead_letters(self, order_codes: Optional[list[str]] = None) -> int:
+        now: str = self._now()
+        query: str = ("UPDATE order_sync_state SET status = ?, attempt_count = 0, next_attempt_at = ?, "
+                      "claimed_by = NULL, claimed_at = NULL, updated_at = ? WHERE status = ?")
+        params: list = [self.STATUS_FAILED, now, now, self.STATUS_DEAD_LETTER]
+
+        if order_codes:
+            query += f" AND order_code IN ({', '.join('?' for _ in order_codes)})"
+            params.extend(order_codes)
+
+        with self._transaction() as cursor:
+            requeued_count: int = cursor.execute(query, params).rowcount
+
+        self._logger.info(f"{requeued_count} sipariş hatalı siparişler kuyruğundan yeniden denenmek üzere alındı")
+        return requeued_count
+
+    def get_status_counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT status, COUNT(*) FROM order_sync_state GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,67 @@
+import threading
+import time
+
+import pytest
+
+from src.scripts.etl.async_loader import AsyncLoader, PredecessorFailedError
+
+
+@pytest.fixture()
+def async_loader():
+    loader = AsyncLoader(max_in_flight=4)
+    yield loader
+    loader.close()
+
+
+def test_jobs_sharing_an_ordering_key_run_in_submission_order(async_loader: AsyncLoader):
+    events: list[str] = []
+    events_lock = threading.Lock()
+
+    def job(name: str, duration_seconds: float):
+        def run() -> str:
+            with events_lock:
+                events.append(f"{name}-start")
+            time.sleep(duration_seconds)
+            with events_lock:
+                events.append(f"{name}-end")
+            return name
+        return run
+
+    results: list = async_loader.run_all(jobs=[job("a", 0.1), job("b", 0), job("c", 0)],
+                                         ordering_keys=[{"C1"}, {"C1", "C2"}, {"C2"}])
+
+    assert results == ["a", "b", "c"]
+    assert events.index("a-end") < events.index("b-start")
+    assert events.index("b-end") < events.index("c-start")
+
+
+def test_jobs_without_a_shared_key_run_concurrently(async_loader: AsyncLoader):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def job() -> bool:
+        barrier.wait()
+        return True
+
+    assert async_loader.run_all(jobs=[job, job], ordering_keys=[{"C1"}, {"C2"}]) == [True, True]
+
+
+def test_failed_job_skips_later_jobs_of_the_same_key_only(async_loader: AsyncLoader):
+    def fail() -> str:
+        raise RuntimeError("Mikro hatası")
+
+    results: list = async_loader.run_all(jobs=[fail, lambda: "b", lambda: "c"],
+                                         ordering_keys=[{"C1"}, {"C1"}, {"C2"}])
+
+    assert isinstance(results[0], RuntimeError)
+    assert isinstance(results[1], PredecessorFailedError)
+    assert results[2] == "c"
+
+
+def test_failed_result_skips_later_jobs_of_the_same_key(async_loader: AsyncLoader):
+    results: list = async_loader.run_all(jobs=[lambda: False, lambda: True, lambda: True],
+                                         ordering_keys=[{"C1"}, {"C1"}, {"C1"}],
+                                         is_failure=lambda result: result is False)
+
+    assert results[0] is False
+    assert isinstance(results[1], PredecessorFailedError)
+    assert isinstance(results[2], PredecessorFailedError)
@@ -0,0 +1,58 @@
+import json
+
+import requests
+
+from src.scripts.etl.batcher import SiparisBatch, SiparisBatcher
+from src.scripts.generator.siparis_kaydet_v2_json import SiparisKaydetV2JSON
+
+
+def _response(status_code: int, body: any) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp._content = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+    return resp
+
+
+def _batch(order_count: int) -> SiparisBatch:
+    return SiparisBatch(orders=[{"Id": order_id, "Code": f"SIP-{order_id}"} for order_id in range(1, order_count + 1)])
+
+
+def _parse(batch: SiparisBatch, resp: requests.Response) -> list:
+    return SiparisBatcher(generator=SiparisKaydetV2JSON()).parse_batch_results(batch=batch, resp=resp)
+
+
+def test_results_are_matched_to_orders_by_position():
+    resp = _response(200, {"result": [{"IsError": False}, {"IsError": True, "ErrorMessage": "Stok bulunamadı"}]})
+
+    results = _parse(_batch(2), resp)
+
+    assert [(result.order["Id"], result.success, result.message) for result in results] == [
+        (1, True, ""), (2, False, "Stok bulunamadı")]
+    assert json.loads(results[1].response)["ErrorMessage"] == "Stok bulunamadı"
+
+
+def test_count_mismatch_fails_the_whole_batch_with_the_reported_errors():
+    resp = _response(200, {"result": [{"IsError": True, "ErrorMessage": "Hatalı evrak"}]})
+
+    results = _parse(_batch(2), resp)
+
+    assert [result.success for result in results] == [False, False]
+    assert all(result.message == "Statü Kodu: 200 - Hatalı evrak" for result in results)
+
+
+def test_count_mismatch_without_errors_is_not_treated_as_success():
+    resp = _response(200, [{"IsError": False}])
+
+    results = _parse(_batch(2), resp)
+
+    assert [result.success for result in results] == [False, False]
+    assert results[0].message == "Statü Kodu: 200 - Mikro 2 evrak için 1 sonuç döndürdü"
+
+
+def test_body_without_per_evrak_results_falls_back_to_the_status_code():
+    assert [result.success for result in _parse(_batch(2), _response(200, b"OK"))] == [True, True]
+
+    results = _parse(_batch(2), _response(500, b"Internal Server Error"))
+
+    assert [result.success for result in results] == [False, False]
+    assert results[0].message == "Statü Kodu: 500 - Internal Server Error"
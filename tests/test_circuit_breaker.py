@@ -0,0 +1,59 @@
+import pytest
+
+from src.scripts.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+def _open_circuit_breaker(recovery_seconds: float = 60) -> CircuitBreaker:
+    circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=recovery_seconds)
+    circuit_breaker.record_failure()
+    circuit_breaker.record_failure()
+    return circuit_breaker
+
+
+def test_circuit_opens_after_consecutive_failures_and_rejects_calls():
+    circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=60)
+
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitBreaker.STATE_CLOSED
+
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitBreaker.STATE_OPEN
+
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_call()
+
+
+def test_success_resets_the_failure_count():
+    circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=60)
+
+    circuit_breaker.record_failure()
+    circuit_breaker.record_success()
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CircuitBreaker.STATE_CLOSED
+
+
+def test_half_open_circuit_allows_one_probe_and_closes_on_success():
+    circuit_breaker = _open_circuit_breaker(recovery_seconds=0)
+
+    circuit_breaker.before_call()
+    assert circuit_breaker.state == CircuitBreaker.STATE_HALF_OPEN
+
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_call()
+
+    circuit_breaker.record_success()
+    assert circuit_breaker.state == CircuitBreaker.STATE_CLOSED
+    circuit_breaker.before_call()
+
+
+def test_failed_half_open_probe_reopens_the_circuit():
+    circuit_breaker = _open_circuit_breaker()
+    circuit_breaker._opened_at -= 60
+
+    circuit_breaker.before_call()
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CircuitBreaker.STATE_OPEN
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_call()
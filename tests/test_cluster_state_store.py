@@ -0,0 +1,133 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.library.models.order_partition import OrderPartition
+from src.library.models.order_watermark import OrderWatermark
+from src.scripts.db.coordination.cluster_state_store import ClusterStateStore
+from src.scripts.db.coordination.leader_election import AdvisoryLock
+from src.scripts.utils.retry_policy import RetryPolicy
+
+pytestmark = pytest.mark.skipif(not os.getenv("TEST_DATABASE_URL"),
+                                reason="TEST_DATABASE_URL ile yerel bir Postgres veritabanı verilmedi")
+
+
+class _EngineConnector:
+
+    def __init__(self, engine):
+        self._engine = engine
+
+    def get_engine(self):
+        return self._engine
+
+    def create_primary_engine(self, pool_size: int, max_overflow: int = 0):
+        return create_engine(self._engine.url, pool_size=pool_size, max_overflow=max_overflow)
+
+
+@pytest.fixture()
+def connector():
+    engine = create_engine(os.getenv("TEST_DATABASE_URL"))
+    connector = _EngineConnector(engine)
+    ClusterStateStore(connector=connector).close()
+
+    with engine.begin() as conn:
+        conn.execute(text("TRUNCATE mikro_order_sync_state, mikro_sync_watermark"))
+
+    yield connector
+    engine.dispose()
+
+
+def _create_store(connector, claim_lease_seconds: float = 600, max_attempts: int = 8,
+                  cluster_lock: AdvisoryLock = None) -> ClusterStateStore:
+    return ClusterStateStore(connector=connector, claim_lease_seconds=claim_lease_seconds,
+                             retry_policy=RetryPolicy(base_delay_seconds=0, max_attempts=max_attempts,
+                                                      jitter_ratio=0),
+                             cluster_lock=cluster_lock)
+
+
+def _orders(count: int) -> list[dict[str, any]]:
+    return [{"Id": order_id, "Code": f"SIP-{order_id}", "CreatedAt": f"2026-01-01T00:00:{order_id:02d}"}
+            for order_id in range(count)]
+
+
+def test_claims_are_exclusive_between_nodes(connector):
+    orders: list[dict[str, any]] = _orders(4)
+    first_node: ClusterStateStore = _create_store(connector)
+    second_node: ClusterStateStore = _create_store(connector)
+
+    assert first_node.claim_orders(orders=orders[:3], worker_id="node-a-0") == orders[:3]
+    assert second_node.claim_orders(orders=orders, worker_id="node-b-0") == orders[3:]
+
+    first_node.release_claims(orders=orders[:1], worker_id="node-a-0")
+    assert second_node.claim_orders(orders=orders[:3], worker_id="node-b-0") == orders[:1]
+
+
+def test_failures_of_a_node_are_retried_by_the_node_that_takes_over_the_shard(connector):
+    orders: list[dict[str, any]] = _orders(30)
+    partition = OrderPartition(index=2, count=3)
+    failed_node: ClusterStateStore = _create_store(connector)
+
+    failed_node.claim_orders(orders=orders, worker_id="node-a-2")
+    failed_node.record_results(results=[(order, False, "hata", "") for order in orders],
+                               watermark=OrderWatermark.from_order(orders[-1]), order_code=orders[-1]["Code"],
+                               name="orders_md5_2_of_3")
+
+    standby_node: ClusterStateStore = _create_store(connector)
+    due_order_ids: list[str] = standby_node.get_due_retry_order_ids(partition=partition)
+
+    assert sorted(due_order_ids) == sorted(str(order["Id"]) for order in orders
+                                           if OrderPartition.index_of(order_id=order["Id"], count=3) == 2)
+    assert standby_node.get_watermark(name="orders_md5_2_of_3") == OrderWatermark(
+        created_at=orders[-1]["CreatedAt"], order_id=str(orders[-1]["Id"]))
+    assert standby_node.get_last_order_code(name="orders_md5_2_of_3") == orders[-1]["Code"]
+
+    claimed_orders: list[dict[str, any]] = standby_node.claim_orders(
+        orders=[order for order in orders if str(order["Id"]) in due_order_ids], worker_id="node-b-2-retry")
+    assert len(claimed_orders) == len(due_order_ids)
+    assert standby_node.get_due_retry_order_ids(partition=partition) == []
+
+
+def test_orders_claimed_by_a_dead_node_become_due_after_the_lease(connector):
+    orders: list[dict[str, any]] = _orders(3)
+    dead_node: ClusterStateStore = _create_store(connector, claim_lease_seconds=0)
+    dead_node.claim_orders(orders=orders, worker_id="node-a-0")
+    dead_node.record_results(results=[(orders[0], True, "", "")])
+
+    standby_node: ClusterStateStore = _create_store(connector, claim_lease_seconds=0)
+
+    assert sorted(standby_node.get_due_retry_order_ids()) == ["1", "2"]
+    assert standby_node.claim_orders(orders=orders, worker_id="node-b-0") == orders[1:]
+
+
+def test_orders_are_dead_lettered_and_replayed(connector):
+    orders: list[dict[str, any]] = _orders(2)
+    store: ClusterStateStore = _create_store(connector, max_attempts=2)
+
+    store.record_results(results=[(order, False, "hata", "") for order in orders])
+    store.record_results(results=[(orders[0], False, "hata", "")])
+    store.record_results(results=[(orders[1], False, "şema hatası", "")], retryable=False)
+
+    assert store.get_status_counts() == {ClusterStateStore.STATUS_DEAD_LETTER: 2}
+    assert {dead_letter["order_code"] for dead_letter in store.get_dead_letters()} == {"SIP-0", "SIP-1"}
+    assert store.claim_orders(orders=orders, worker_id="node-a-0") == []
+
+    assert store.requeue_dead_letters(order_codes=["SIP-1"]) == 1
+    assert store.get_due_retry_order_ids() == ["1"]
+
+
+def test_watermark_is_only_moved_while_the_cluster_lock_is_held(connector):
+    orders: list[dict[str, any]] = _orders(3)
+    cluster_lock = AdvisoryLock(connector=connector, name="mikro_cluster_state_store_test")
+    assert cluster_lock.try_acquire()
+
+    leader: ClusterStateStore = _create_store(connector, cluster_lock=cluster_lock)
+    leader.set_watermark(watermark=OrderWatermark.from_order(orders[0]))
+    cluster_lock.release()
+
+    leader.set_watermark(watermark=OrderWatermark.from_order(orders[1]))
+    leader.record_results(results=[(orders[2], True, "", "")], watermark=OrderWatermark.from_order(orders[2]))
+
+    assert leader.get_watermark() == OrderWatermark(created_at=orders[0]["CreatedAt"], order_id="0")
+    assert leader.get_status_counts() == {ClusterStateStore.STATUS_SENT: 1}
+    leader.close()
@@ -0,0 +1,41 @@
+import sqlite3
+
+from sqlalchemy import create_engine, text
+
+from src.logger.custom_logger import SingletonLogger
+from src.scripts.db.connector.connector import DatabaseConnector
+from src.scripts.db.connector.pool_metrics import InstrumentedQueuePool
+
+
+def _create_connector() -> DatabaseConnector:
+    connector = object.__new__(DatabaseConnector)
+    connector._logger = SingletonLogger.get_logger()
+    return connector
+
+
+def test_checkout_replaces_connection_that_fails_pre_ping(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool,
+                           pool_pre_ping=True, pool_size=1, max_overflow=0)
+    _create_connector()._listen_pool_errors(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    ping = engine.dialect.do_ping
+    failed_pings: list = []
+
+    def fail_first_ping(dbapi_connection) -> bool:
+        if not failed_pings:
+            failed_pings.append(dbapi_connection)
+            raise sqlite3.OperationalError("server closed the connection unexpectedly")
+        return ping(dbapi_connection)
+
+    engine.dialect.do_ping = fail_first_ping
+    engine.dialect.is_disconnect = lambda error, connection, cursor: True
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+
+    assert len(failed_pings) == 1
+    assert engine.pool.metrics.pre_ping_failures == 1
+    engine.dispose()
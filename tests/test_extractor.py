@@ -0,0 +1,80 @@
+import os
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.library.models.order_watermark import OrderWatermark
+from src.scripts.etl.extractor import Extractor
+
+pytestmark = pytest.mark.skipif(not os.getenv("TEST_DATABASE_URL"),
+                                reason="TEST_DATABASE_URL ile yerel bir Postgres veritabanı verilmedi")
+
+_SCHEMA: str = "mikro_extractor_test"
+
+
+class _EngineConnector:
+
+    def __init__(self, engine):
+        self._engine = engine
+
+    def get_engine(self):
+        return self._engine
+
+    def get_read_engine(self):
+        return self._engine
+
+
+@pytest.fixture()
+def engine():
+    admin_engine = create_engine(os.getenv("TEST_DATABASE_URL"))
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {_SCHEMA}"))
+        conn.execute(text(f"""
+            CREATE TABLE {_SCHEMA}."Orders" (
+                "Id" SERIAL PRIMARY KEY,
+                "Code" TEXT NOT NULL,
+                "CreatedAt" TIMESTAMP NOT NULL DEFAULT now()
+            )
+        """))
+
+    engine = create_engine(os.getenv("TEST_DATABASE_URL"), connect_args={"options": f"-c search_path={_SCHEMA}"})
+    yield engine
+    engine.dispose()
+
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA {_SCHEMA} CASCADE"))
+    admin_engine.dispose()
+
+
+def _read_codes(extractor: Extractor, watermark: OrderWatermark) -> list[str]:
+    return [order["Code"] for orders_page in extractor.iter_orders_after_watermark(watermark=watermark, page_size=10)
+            for order in orders_page]
+
+
+def test_order_committed_behind_a_newer_order_is_not_skipped(engine):
+    safety_window_seconds: float = 1
+    extractor = Extractor(_EngineConnector(engine), safety_window_seconds=safety_window_seconds)
+
+    with engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO "Orders" ("Code", "CreatedAt") VALUES ('SIP-OLD', now() - interval '1 hour')
+        """))
+    old_order: dict[str, any] = extractor.get_latest_order_from_orders_table()
+    watermark: OrderWatermark = OrderWatermark.from_order(old_order)
+
+    with engine.connect() as late_conn:
+        late_transaction = late_conn.begin()
+        late_conn.execute(text("""INSERT INTO "Orders" ("Code") VALUES ('SIP-LATE')"""))
+
+        with engine.begin() as conn:
+            conn.execute(text("""INSERT INTO "Orders" ("Code") VALUES ('SIP-NEW')"""))
+
+        assert _read_codes(extractor, watermark=watermark) == []
+        late_transaction.commit()
+
+    time.sleep(safety_window_seconds + 0.2)
+
+    assert _read_codes(extractor, watermark=watermark) == ["SIP-LATE", "SIP-NEW"]
+    assert extractor.count_orders_after_watermark(watermark=watermark) == 2
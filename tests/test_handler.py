@@ -0,0 +1,53 @@
+import threading
+
+from sqlalchemy import create_engine, text
+
+from src.logger.custom_logger import SingletonLogger
+from src.scripts.db.connector.connector import DatabaseConnector
+from src.scripts.db.handler.handler import DatabaseHandler
+
+
+def _create_connector(tmp_path) -> DatabaseConnector:
+    primary_engine = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    with primary_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE orders (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO orders (id, name) VALUES (1, 'a'), (2, 'b')"))
+
+    connector = object.__new__(DatabaseConnector)
+    connector._logger = SingletonLogger.get_logger()
+    connector._initialized = True
+    connector._engine = primary_engine
+    connector._replica_lock = threading.Lock()
+    connector._replica_retry_seconds = 30
+    connector._replica_max_lag_seconds = 0
+    connector._next_replica_index = 0
+    connector._replicas = [{
+        "label": "replica:5432",
+        "engine": create_engine(f"sqlite:///{tmp_path / 'replica.db'}"),
+        "unhealthy_until": 0.0,
+        "lag_seconds": 0.0,
+        "lag_checked_at": 0.0,
+        "lagging": False
+    }]
+    return connector
+
+
+def test_execute_query_retries_on_primary_when_replica_read_fails(tmp_path):
+    connector = _create_connector(tmp_path)
+    handler = DatabaseHandler(connector)
+
+    rows = handler.execute_query("SELECT id, name FROM orders ORDER BY id")
+
+    assert rows == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    assert connector._replicas[0]["unhealthy_until"] > 0
+    assert connector.get_read_engine() is connector.get_engine()
+
+
+def test_iter_query_retries_on_primary_when_replica_read_fails(tmp_path):
+    connector = _create_connector(tmp_path)
+    handler = DatabaseHandler(connector)
+
+    rows = list(handler.iter_query("SELECT id FROM orders ORDER BY id", as_tuples=True))
+
+    assert rows == [(1,), (2,)]
+    assert connector.get_read_engine() is connector.get_engine()
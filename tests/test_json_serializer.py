@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from src.scripts.utils.json_serializer import JSONSerializer
+
+_PAYLOAD: dict[str, any] = {
+    "FirmaKodu": "01",
+    "Sifre": None,
+    "evraklar": [{"evrak_aciklamalari": [{"aciklama": "Sipariş: ŞİĞ-1 \"özel\" \\ / \n"}],
+                  "satirlar": [{"sip_b_fiyat": 2.5, "sip_miktar": 3, "sip_tutar": 7.5, "sip_vergisiz_fl": False,
+                                "user_tablo": []}]}]
+}
+
+
+def _serializers() -> list[JSONSerializer]:
+    return [JSONSerializer(), JSONSerializer(encoder=JSONSerializer._stdlib_dumps)]
+
+
+def test_orjson_and_stdlib_produce_identical_bytes():
+    pytest.importorskip("orjson")
+    orjson_serializer, stdlib_serializer = _serializers()
+
+    assert orjson_serializer.backend == "orjson"
+    assert orjson_serializer.dumps(_PAYLOAD) == stdlib_serializer.dumps(_PAYLOAD)
+    assert json.loads(stdlib_serializer.dumps(_PAYLOAD)) == _PAYLOAD
+
+
+@pytest.mark.parametrize("serializer", _serializers(), ids=lambda serializer: serializer.backend)
+@pytest.mark.parametrize("header", [{"FirmaKodu": "01", "Sifre": None}, {}])
+def test_streamed_array_matches_serializing_the_whole_object(serializer: JSONSerializer, header: dict):
+    items: list[dict] = _PAYLOAD["evraklar"] * 3
+
+    prefix: bytes = serializer.object_array_prefix(obj=header, array_key="evraklar", wrapper_key="Mikro")
+    document: bytes = serializer.write_array(prefix=prefix, array_items=[serializer.dumps(item) for item in items],
+                                             suffix=b"]}}")
+
+    assert document == serializer.dumps({"Mikro": {**header, "evraklar": items}})
@@ -0,0 +1,29 @@
+import threading
+
+import pytest
+
+from src.scripts.etl.loader import Loader
+from src.scripts.utils.circuit_breaker import CircuitBreaker
+
+
+class _FailingSession:
+
+    def __init__(self, error: Exception):
+        self._error = error
+
+    def post(self, url, data, timeout):
+        raise self._error
+
+
+def test_unexpected_error_during_a_half_open_probe_reopens_the_circuit():
+    circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0)
+    in_flight_limiter = threading.BoundedSemaphore(1)
+    loader = Loader(circuit_breaker=circuit_breaker, in_flight_limiter=in_flight_limiter)
+    circuit_breaker.record_failure()
+
+    with pytest.raises(RuntimeError):
+        loader._post(url="http://mikro", payload=b"{}", session=_FailingSession(RuntimeError("beklenmeyen")))
+
+    assert circuit_breaker.state == CircuitBreaker.STATE_OPEN
+    assert in_flight_limiter.acquire(blocking=False)
+    loader.close()
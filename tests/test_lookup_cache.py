@@ -0,0 +1,50 @@
+import time
+
+from src.scripts.utils.lookup_cache import LookupCache
+
+
+def test_entries_expire_after_the_ttl():
+    cache = LookupCache(name="Ürün", ttl_seconds=0.05)
+    cache.put("P1", 1)
+
+    assert cache.get("P1") == 1
+    time.sleep(0.1)
+
+    assert cache.get("P1", default="yok") == "yok"
+    assert cache.get_stats()["size"] == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_non_positive_ttl_keeps_entries_until_invalidated():
+    cache = LookupCache(name="Ürün", ttl_seconds=0)
+    cache.put_many({"P1": 1, "P2": 2})
+    cache.high_water_mark = "2026-03-01T00:00:00"
+
+    cache.invalidate("P1")
+    assert cache.get("P1") is None
+    assert cache.get("P2") == 2
+
+    cache.invalidate()
+    assert cache.get("P2") is None
+    assert cache.high_water_mark is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LookupCache(name="Ürün", max_size=2)
+    cache.put("P1", 1)
+    cache.put("P2", 2)
+    cache.get("P1")
+
+    cache.put("P3", 3)
+
+    assert cache.get("P2") is None
+    assert (cache.get("P1"), cache.get("P3")) == (1, 3)
+    assert cache.evictions == 1
+
+
+def test_zero_max_size_disables_the_cache():
+    cache = LookupCache(name="Ürün", max_size=0)
+    cache.put("P1", 1)
+
+    assert not cache.enabled
+    assert cache.get("P1") is None
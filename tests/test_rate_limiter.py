@@ -0,0 +1,44 @@
+from src.scripts.utils.rate_limiter import AdaptiveRateLimiter
+
+
+def _create_rate_limiter(**options) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(**{"rate_per_second": 4, "min_rate_per_second": 1, "max_rate_per_second": 5,
+                                  "target_latency_seconds": 1, "smoothing": 1, **options})
+
+
+def test_acquire_spends_the_burst_before_waiting():
+    rate_limiter = _create_rate_limiter(rate_per_second=20, max_rate_per_second=20, burst=2)
+
+    assert rate_limiter.acquire() == 0
+    assert rate_limiter.acquire() == 0
+    assert rate_limiter.acquire() > 0
+
+
+def test_failures_halve_the_rate_down_to_the_minimum():
+    rate_limiter = _create_rate_limiter()
+
+    rate_limiter.record(elapsed_seconds=0.1, succeeded=False)
+    assert rate_limiter.rate == 2
+
+    rate_limiter.record(elapsed_seconds=0.1, succeeded=False)
+    rate_limiter.record(elapsed_seconds=0.1, succeeded=False)
+    assert rate_limiter.rate == 1
+
+
+def test_slow_responses_lower_the_rate():
+    rate_limiter = _create_rate_limiter()
+
+    rate_limiter.record(elapsed_seconds=2, succeeded=True)
+
+    assert rate_limiter.rate == 2
+
+
+def test_fast_successes_raise_the_rate_up_to_the_maximum():
+    rate_limiter = _create_rate_limiter()
+
+    rate_limiter.record(elapsed_seconds=0.1, succeeded=True)
+    assert rate_limiter.rate == 4.5
+
+    for _ in range(5):
+        rate_limiter.record(elapsed_seconds=0.1, succeeded=True)
+    assert rate_limiter.rate == 5
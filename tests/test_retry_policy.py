@@ -0,0 +1,24 @@
+import pytest
+
+from src.scripts.utils.retry_policy import RetryPolicy
+
+
+def test_delay_doubles_per_attempt_and_is_capped():
+    retry_policy = RetryPolicy(base_delay_seconds=30, max_delay_seconds=100, jitter_ratio=0)
+
+    assert [retry_policy.next_delay(attempt_count) for attempt_count in range(0, 5)] == [30, 30, 60, 100, 100]
+    assert retry_policy.next_delay(10000) == 100
+
+
+def test_jitter_stays_within_the_configured_ratio():
+    retry_policy = RetryPolicy(base_delay_seconds=100, jitter_ratio=0.2)
+
+    delays: list[float] = [retry_policy.next_delay(1) for _ in range(200)]
+
+    assert all(80 <= delay <= 120 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.parametrize("attempt_count, expected", [(0, True), (2, True), (3, False), (4, False)])
+def test_should_retry_stops_at_max_attempts(attempt_count: int, expected: bool):
+    assert RetryPolicy(max_attempts=3).should_retry(attempt_count) is expected
@@ -0,0 +1,74 @@
+import pytest
+import requests
+
+from src.library.models.evrak_result import EvrakResult
+from src.library.models.order_watermark import OrderWatermark
+from src.logger.custom_logger import SingletonLogger
+from src.run import Run
+from src.scripts.etl.async_loader import AsyncLoader
+from src.scripts.etl.batcher import SiparisBatch
+from src.scripts.etl.loader import Loader, MikroUnavailableError
+from src.scripts.utils.retry_policy import RetryPolicy
+from src.scripts.utils.state_store import SyncStateStore
+
+
+def _order(order_id: int, customer_id: str = "C1") -> dict[str, any]:
+    return {"Id": order_id, "Code": f"SIP-{order_id}", "CreatedAt": f"2026-01-01T00:00:{order_id:02d}",
+            "CustomerId": customer_id}
+
+
+@pytest.fixture()
+def run(tmp_path):
+    run = object.__new__(Run)
+    run._logger = SingletonLogger.get_logger()
+    run._loader = Loader
+    run._watermark_name = "orders"
+    run._state_store = SyncStateStore(path=str(tmp_path / "state.db"),
+                                      retry_policy=RetryPolicy(base_delay_seconds=60, jitter_ratio=0))
+    yield run
+    run._state_store.close()
+
+
+def _load(run: Run, batches: list[SiparisBatch], results: dict[int, any]) -> bool:
+    def load_batch(batch: SiparisBatch) -> list[EvrakResult]:
+        result = results[batch.orders[0]["Id"]]
+        if isinstance(result, Exception):
+            raise result
+        return [EvrakResult(order=order, success=result) for order in batch.orders]
+
+    run._load_batch = load_batch
+    async_loader = AsyncLoader(max_in_flight=2)
+    try:
+        return run._load_batches(batches=batches, worker_id="node-0", async_loader=async_loader,
+                                 advance_watermark=True)
+    finally:
+        async_loader.close()
+
+
+def test_rejected_batch_releases_later_batches_of_the_customer_without_aborting(run):
+    orders: list[dict[str, any]] = [_order(1), _order(2), _order(3, customer_id="C2")]
+    run._state_store.claim_orders(orders=orders, worker_id="node-0")
+
+    page_settled: bool = _load(run, batches=[SiparisBatch(orders=[order]) for order in orders],
+                               results={1: False, 2: True, 3: True})
+
+    assert not page_settled
+    assert run._state_store.get_status_counts() == {SyncStateStore.STATUS_FAILED: 1,
+                                                    SyncStateStore.STATUS_PENDING: 1,
+                                                    SyncStateStore.STATUS_SENT: 1}
+    assert run._state_store.claim_orders(orders=orders, worker_id="node-1") == [orders[1]]
+    assert run._state_store.get_watermark() == OrderWatermark(created_at=orders[0]["CreatedAt"], order_id="1")
+
+
+def test_batch_with_unknown_result_is_dead_lettered_instead_of_retried(run):
+    orders: list[dict[str, any]] = [_order(1), _order(2, customer_id="C2")]
+    run._state_store.claim_orders(orders=orders, worker_id="node-0")
+
+    page_settled: bool = _load(run, batches=[SiparisBatch(orders=[order]) for order in orders],
+                               results={1: requests.exceptions.ReadTimeout("okuma zaman aşımı"),
+                                        2: MikroUnavailableError("Mikro meşgul", status_code=503)})
+
+    assert page_settled
+    assert run._state_store.get_status_counts() == {SyncStateStore.STATUS_DEAD_LETTER: 1,
+                                                    SyncStateStore.STATUS_FAILED: 1}
+    assert [dead_letter["order_code"] for dead_letter in run._state_store.get_dead_letters()] == ["SIP-1"]
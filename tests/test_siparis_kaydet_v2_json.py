@@ -0,0 +1,18 @@
+from src.library.models.order_line import OrderLine
+from src.scripts.generator.siparis_kaydet_v2_json import SiparisKaydetV2JSON
+
+
+def _order_lines(order_id: int) -> list[OrderLine]:
+    return [OrderLine(order_id=order_id, product_id=1, quantity=2, price=2.5, product_code="P1",
+                      order_code=f"SIP-{order_id}", order_date="01.03.2026", customer_code="C1", total_price=5.0)]
+
+
+def test_seriler_is_derived_from_the_order_and_stable_across_generators():
+    first_generator = SiparisKaydetV2JSON()
+    second_generator = SiparisKaydetV2JSON()
+
+    first_evrak: dict[str, any] = first_generator.create_evrak(_order_lines(41))
+    assert first_generator.create_evrak(_order_lines(42))["satirlar"][0]["seriler"] == "ARTEK42"
+
+    assert first_evrak["satirlar"][0]["seriler"] == "ARTEK41"
+    assert second_generator.create_evrak(_order_lines(41)) == first_evrak
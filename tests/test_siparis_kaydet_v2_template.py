@@ -0,0 +1,58 @@
+import json
+
+from src.library.models.order_line import OrderLine
+from src.scripts.generator.siparis_kaydet_v2_json import SiparisKaydetV2JSON
+from src.scripts.generator.siparis_kaydet_v2_template import SiparisKaydetV2Template
+
+
+def _order_lines() -> list[OrderLine]:
+    return [OrderLine(order_id=7, product_id=1, quantity="2", price="2.5", product_code="P1", order_code="SIP-7",
+                      order_date="01.03.2026", customer_code="C1", total_price=5.0),
+            OrderLine(order_id=7, product_id=2, quantity=1, price=None, product_code="P2", order_code="SIP-7",
+                      order_date="01.03.2026", customer_code="C1", total_price=0.0)]
+
+
+def _expected_satir(order_line: OrderLine) -> dict[str, any]:
+    return {
+        "sip_tarih": order_line.order_date,
+        "seriler": "ARTEK7",
+        "sip_birim_pntr": 0,
+        "sip_cins": 0,
+        "sip_evrakno_seri": order_line.order_code,
+        "sip_musteri_kod": order_line.customer_code,
+        "sip_stok_kod": order_line.product_code or "",
+        "sip_b_fiyat": float(order_line.price or 0),
+        "sip_miktar": int(order_line.quantity or 0),
+        "sip_tutar": float(order_line.total_price),
+        "sip_vergi_pntr": 0,
+        "sip_depono": 1,
+        "sip_vergisiz_fl": False,
+        "sip_stok_sormerk": "",
+        "user_tablo": [{"aciklama": ""}]
+    }
+
+
+def test_satirlar_match_the_hand_built_rows():
+    satirlar: list[dict] = SiparisKaydetV2Template().build_satirlar(order_lines=_order_lines(), seriler="ARTEK7")
+
+    assert satirlar == [_expected_satir(order_line) for order_line in _order_lines()]
+
+
+def test_satir_defaults_override_the_constants():
+    satirlar: list[dict] = SiparisKaydetV2Template(satir_defaults={"sip_depono": 3, "sip_cins": None}).build_satirlar(
+        order_lines=_order_lines(), seriler="ARTEK7")
+
+    assert (satirlar[0]["sip_depono"], satirlar[0]["sip_cins"]) == (3, 0)
+
+
+def test_batch_document_matches_the_single_order_document():
+    generator = SiparisKaydetV2JSON(api_key="key", firma_kodu="01", kullanici_kodu="SRV", sifre="x")
+
+    single_document: bytes = generator.prepare_final_siparis_kaydet_v2_json(final_order_items=_order_lines(),
+                                                                            md5_hash_pass="hash")
+    batch_document: bytes = generator.prepare_batch_siparis_kaydet_v2_json(
+        evraklar=[generator.create_evrak(_order_lines())], md5_hash_pass="hash")
+
+    assert batch_document == single_document
+    assert json.loads(batch_document)["Mikro"]["evraklar"][0]["satirlar"] == [
+        _expected_satir(order_line) for order_line in _order_lines()]
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+import sqlite3
+
+from src.library.models.order_partition import OrderPartition
+from src.scripts.utils.retry_policy import RetryPolicy
+from src.scripts.utils.state_store import SyncStateStore
+
+
+def _orders(count: int) -> list[dict[str, any]]:
+    return [{"Id": order_id, "Code": f"SIP-{order_id}", "CreatedAt": f"2026-01-01T00:00:{order_id:02d}"}
+            for order_id in range(count)]
+
+
+def test_due_retries_are_filtered_by_partition(tmp_path):
+    store = SyncStateStore(path=str(tmp_path / "state.db"),
+                           retry_policy=RetryPolicy(base_delay_seconds=0, jitter_ratio=0))
+    orders: list[dict[str, any]] = _orders(40)
+    store.record_results(results=[(order, False, "hata", "") for order in orders])
+
+    partition = OrderPartition(index=1, count=3)
+    due_order_ids: list[str] = store.get_due_retry_order_ids(limit=5, partition=partition)
+
+    assert len(due_order_ids) == 5
+    assert all(OrderPartition.index_of(order_id=order_id, count=3) == 1 for order_id in due_order_ids)
+    assert len(store.get_due_retry_order_ids(limit=100)) == 40
+    store.close()
+
+
+def test_timestamps_are_stored_in_utc_and_local_ones_are_migrated(tmp_path):
+    path: str = str(tmp_path / "state.db")
+    local_updated_at: str = "2026-03-29T03:30:00.250000"
+    connection = sqlite3.connect(path)
+    connection.execute("""
+        CREATE TABLE order_sync_state (order_id TEXT PRIMARY KEY, order_code TEXT, created_at TEXT,
+                                       status TEXT NOT NULL, attempt_count INTEGER NOT NULL DEFAULT 0,
+                                       last_error TEXT, mikro_response TEXT, updated_at TEXT NOT NULL)
+    """)
+    connection.execute("INSERT INTO order_sync_state (order_id, status, updated_at) VALUES ('0', 'pending', ?)",
+                       (local_updated_at,))
+    connection.commit()
+    connection.close()
+
+    store = SyncStateStore(path=path, retry_policy=RetryPolicy(base_delay_seconds=60, jitter_ratio=0))
+    store.record_results(results=[(order, False, "hata", "") for order in _orders(2)[1:]])
+    store.close()
+
+    connection = sqlite3.connect(path)
+    rows: dict[str, tuple] = {row[0]: row[1:] for row in connection.execute(
+        "SELECT order_id, next_attempt_at, updated_at FROM order_sync_state")}
+    connection.close()
+
+    assert rows["0"] == (None, datetime.fromisoformat(local_updated_at).astimezone(timezone.utc).isoformat())
+    next_attempt_at: datetime = datetime.fromisoformat(rows["1"][0])
+    assert next_attempt_at.utcoffset() == timedelta(0)
+    assert abs((next_attempt_at - datetime.now(timezone.utc)).total_seconds() - 60) < 5
@@ -0,0 +1,27 @@
+from src.library.models.order_line import OrderLine
+from src.scripts.etl.transformer import Transformer
+
+
+def _order(order_id: int, order_date: any = "2026-03-01") -> dict[str, any]:
+    return {"Id": order_id, "Code": f"SIP-{order_id}", "OrderDate": order_date}
+
+
+def _order_lines(order_id: int, quantity: any, price: any = 2.5) -> dict[str, any]:
+    return {"customer_code": "C1",
+            "order_items": [OrderLine(order_id=order_id, product_id=1, quantity=quantity, price=price)]}
+
+
+def test_invalid_orders_are_rejected_without_failing_the_page():
+    orders: list[dict[str, any]] = [_order(1), _order(2), _order(3), _order(4, order_date=None), _order(5)]
+    orders_lines: dict[any, dict[str, any]] = {1: _order_lines(1, 2), 2: _order_lines(2, None),
+                                               3: _order_lines(3, "1.5"), 4: _order_lines(4, 1),
+                                               5: _order_lines(5, "3")}
+
+    transformed_orders, orders_final_items, rejected_results = Transformer().prepare_orders_final_items(
+        orders=orders, orders_lines=orders_lines)
+
+    assert [order["Id"] for order in transformed_orders] == [1, 5]
+    assert [order_lines[0].total_price for order_lines in orders_final_items] == [5.0, 7.5]
+    assert orders_final_items[1][0].order_date == "01.03.2026"
+    assert [rejected_result.order["Id"] for rejected_result in rejected_results] == [2, 3, 4]
+    assert not any(rejected_result.retryable or rejected_result.success for rejected_result in rejected_results)